@@ -0,0 +1,7 @@
+"""
+매매 파이프라인 벤치마크 패키지
+
+    python -m benchmarks.run                     # 전체 실행 후 benchmarks/results/latest.json 저장
+    python -m benchmarks.run --only indicators   # 특정 스위트만 실행
+    python -m benchmarks.run --update-baseline   # 현재 결과를 기준선으로 저장
+"""
@@ -0,0 +1,56 @@
+"""
+가격 알림 엔진 벤치마크 (PriceAlertEngine)
+- 대량 알림 적재 및 가격 틱당 발동 알림 탐색
+"""
+import random
+
+from service.alert.price_alert_engine import PriceAlertEngine
+
+from .harness import measure
+
+NUM_ALERTS = 200000
+NUM_TICKERS = 50
+
+
+def _alerts(rng):
+    return [
+        (i, i % 1000, f"KRW-C{i % NUM_TICKERS:03d}", rng.uniform(50, 150), rng.choice(('above', 'below')))
+        for i in range(1, NUM_ALERTS + 1)
+    ]
+
+
+def run(context):
+    rng = random.Random(11)
+    alerts = _alerts(rng)
+    engine = PriceAlertEngine()
+
+    def load():
+        engine.clear()
+        engine.add_many(alerts)
+
+    results = [measure(
+        f"price_alerts.load[{NUM_ALERTS}]",
+        load,
+        iterations=context.iterations(5),
+        warmup=1,
+        ops_per_call=NUM_ALERTS
+    )]
+
+    # 현재가 부근의 작은 변동: 틱마다 발동되는 알림은 소수
+    load()
+    prices = {f"KRW-C{i:03d}": 100.0 for i in range(NUM_TICKERS)}
+    tickers = list(prices)
+
+    def tick():
+        for ticker in tickers:
+            prices[ticker] *= 1 + rng.gauss(0, 0.0005)
+            engine.match(ticker, prices[ticker])
+
+    results.append(measure(
+        f"price_alerts.match[{NUM_ALERTS}]",
+        tick,
+        iterations=context.iterations(200),
+        ops_per_call=NUM_TICKERS
+    ))
+    engine.clear()
+    return results
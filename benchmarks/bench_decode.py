@@ -0,0 +1,104 @@
+"""
+응답 디코딩 벤치마크
+- 기존 경로: JSON → dict 목록 → pyupbit 형식 DataFrame → 컬럼 배열
+- 구조화 배열 경로: JSON(orjson) → NumPy 구조화 배열 (DataFrame 없음)
+"""
+import json
+
+import numpy as np
+import pandas as pd
+
+from utils.upbit_api.utils.decoding import decode_candles, decode_orderbooks
+from utils.upbit_simulator.market_data import generate_random_walk, parse_candle_time
+
+from .harness import measure
+
+CANDLE_COLUMNS = ['opening_price', 'high_price', 'low_price', 'trade_price',
+                  'candle_acc_trade_volume', 'candle_acc_trade_price']
+
+
+def _candles_via_dataframe(body):
+    """pyupbit.get_ohlcv와 같은 DataFrame을 만든 뒤 차트 컬럼 배열로 변환"""
+    records = json.loads(body)
+    df = pd.DataFrame(records, columns=['candle_date_time_kst'] + CANDLE_COLUMNS)
+    df = df.set_index(pd.to_datetime(df['candle_date_time_kst']))[CANDLE_COLUMNS].iloc[::-1]
+    df.columns = ['open', 'high', 'low', 'close', 'volume', 'value']
+    columns = {'time': df.index.values.astype('datetime64[ms]').astype(np.int64)}
+    for name in df.columns:
+        columns[name] = df[name].to_numpy(dtype=np.float64)
+    return columns
+
+
+def _orderbooks_via_dicts(body):
+    """호가 응답을 dict 목록으로 파싱한 뒤 마켓별 단위 목록 구성"""
+    return {
+        record['market']: [
+            (unit['ask_price'], unit['bid_price'], unit['ask_size'], unit['bid_size'])
+            for unit in record['orderbook_units']
+        ]
+        for record in json.loads(body)
+    }
+
+
+def _candle_body(count):
+    """합성 캔들 count개의 업비트 형식 응답 본문 (최신순)"""
+    market_data = generate_random_walk(['KRW-BENCH'], periods=count, unit='days', seed=3)
+    records = []
+    while len(records) < count:
+        before = parse_candle_time(records[-1]['candle_date_time_utc']) if records else None
+        chunk = market_data.get_candles('KRW-BENCH', 'days', min(count - len(records), 200), before)
+        if not chunk:
+            break
+        records.extend(chunk)
+    return json.dumps(records, separators=(',', ':')).encode()
+
+
+def _orderbook_body(count, depth=15):
+    rng = np.random.default_rng(11)
+    records = []
+    for i in range(count):
+        mid = float(rng.uniform(100, 100000))
+        records.append({
+            'market': f"KRW-C{i:03d}",
+            'timestamp': 1700000000000,
+            'total_ask_size': 0.0,
+            'total_bid_size': 0.0,
+            'orderbook_units': [
+                {'ask_price': round(mid * (1 + 0.001 * (k + 1)), 2), 'bid_price': round(mid * (1 - 0.001 * (k + 1)), 2),
+                 'ask_size': round(float(rng.uniform(0, 10)), 8), 'bid_size': round(float(rng.uniform(0, 10)), 8)}
+                for k in range(depth)
+            ],
+        })
+    return json.dumps(records, separators=(',', ':')).encode()
+
+
+def run(context):
+    results = []
+
+    for count in (200, 1000):
+        body = _candle_body(count)
+        size = len(json.loads(body))
+        results.append(measure(
+            f"decode.candles.dataframe[{size}]",
+            lambda body=body: _candles_via_dataframe(body),
+            iterations=context.iterations(200), ops_per_call=size
+        ))
+        results.append(measure(
+            f"decode.candles.structured[{size}]",
+            lambda body=body: decode_candles(body),
+            iterations=context.iterations(200), ops_per_call=size
+        ))
+
+    body = _orderbook_body(30)
+    results.append(measure(
+        "decode.orderbook.dicts[30]",
+        lambda: _orderbooks_via_dicts(body),
+        iterations=context.iterations(300), ops_per_call=30
+    ))
+    results.append(measure(
+        "decode.orderbook.structured[30]",
+        lambda: decode_orderbooks(body),
+        iterations=context.iterations(300), ops_per_call=30
+    ))
+
+    return results
@@ -0,0 +1,38 @@
+"""
+기술적 지표 계산 벤치마크 (TradingAlgorithmManager)
+"""
+import numpy as np
+import pandas as pd
+
+from utils.manager_trading_algorithm.manager_trading_algorithm import TradingAlgorithmManager
+
+from .harness import measure
+
+
+def run(context):
+    manager = TradingAlgorithmManager()
+    rng = np.random.default_rng(7)
+    results = []
+
+    for size in (30, 200):
+        prices = pd.Series(10000 * np.cumprod(1 + rng.normal(0, 0.02, size)))
+        results.append(measure(
+            f"indicators.rsi[{size}]",
+            lambda: manager.calculate_rsi(prices, 14),
+            iterations=context.iterations(500)
+        ))
+        results.append(measure(
+            f"indicators.macd[{size}]",
+            lambda: manager.calculate_macd(prices),
+            iterations=context.iterations(500)
+        ))
+
+    ohlcv = pd.DataFrame({'close': 10000 * np.cumprod(1 + rng.normal(0, 0.02, 30))})
+    for strategy in manager.available_strategies:
+        results.append(measure(
+            f"signal.{strategy}",
+            lambda strategy=strategy: manager.get_signal(strategy, ohlcv),
+            iterations=context.iterations(300)
+        ))
+
+    return results
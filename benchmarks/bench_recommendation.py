@@ -0,0 +1,38 @@
+"""
+추천 생성 벤치마크
+- 사용자별 생성 (generate_recommendations)
+- 전략 그룹 일괄 생성 (generate_recommendations_for_users)
+"""
+from models.user import User
+from service.recommendation.recommendation_service import RecommendationService
+
+from .harness import measure
+
+
+def run(context):
+    with context.app.app_context():
+        users = User.query.all()
+
+        def recommendation_cycle():
+            for user in users:
+                RecommendationService(user).generate_recommendations()
+
+        def fanout_cycle():
+            RecommendationService().generate_recommendations_for_users(users)
+
+        return [
+            measure(
+                "recommendation.generate[cycle]",
+                recommendation_cycle,
+                iterations=context.iterations(5),
+                warmup=1,
+                ops_per_call=len(users)
+            ),
+            measure(
+                "recommendation.fanout[cycle]",
+                fanout_cycle,
+                iterations=context.iterations(5),
+                warmup=1,
+                ops_per_call=len(users)
+            ),
+        ]
@@ -0,0 +1,37 @@
+"""
+저장소 계층 벤치마크 (DBManager / ApiKeyRepository)
+"""
+from repository.repository_apikey import ApiKeyRepository
+
+from .harness import measure
+
+
+def run(context):
+    repository = ApiKeyRepository()
+    for i in range(20):
+        repository.save_api_key('upbit', f"bench-access-{i:04d}", f"bench-secret-{i:04d}")
+
+    counter = iter(range(10 ** 9))
+
+    return [
+        measure(
+            "repository.save_api_key",
+            lambda: repository.save_api_key('upbit', f"access-{next(counter)}", 'secret'),
+            iterations=context.iterations(200)
+        ),
+        measure(
+            "repository.get_api_key",
+            lambda: repository.get_api_key('upbit'),
+            iterations=context.iterations(500)
+        ),
+        measure(
+            "repository.get_api_key_list",
+            repository.get_api_key_list,
+            iterations=context.iterations(50)
+        ),
+        measure(
+            "db_manager.execute_select_one",
+            lambda: repository.db_manager.execute_select_one("SELECT COUNT(*) FROM api_keys"),
+            iterations=context.iterations(500)
+        ),
+    ]
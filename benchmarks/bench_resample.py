@@ -0,0 +1,76 @@
+"""
+다중 타임프레임 리샘플링 벤치마크
+- pandas resample: 1분 DataFrame → 타임프레임별 OHLCV
+- reduceat: 1분 구조화 배열 → 타임프레임별 OHLCV (resample)
+- 점진 갱신: 진행 중 1분 캔들 1개 병합 (TimeframeResampler.update)
+"""
+import pandas as pd
+
+from utils.market_data.resampler import DEFAULT_TIMEFRAMES, TimeframeResampler, resample
+from utils.upbit_api.utils.decoding import candles_from_records
+from utils.upbit_simulator.market_data import generate_random_walk, parse_candle_time
+
+from .harness import measure
+
+# pandas 규칙과 오프셋 (240분/일은 KST 09:00, 주는 월요일 KST 09:00 기준)
+PANDAS_RULES = {
+    'minute3': ('3min', '0h'), 'minute5': ('5min', '0h'), 'minute15': ('15min', '0h'),
+    'minute30': ('30min', '0h'), 'minute60': ('60min', '0h'), 'minute240': ('240min', '9h'),
+    'day': ('1440min', '9h'), 'week': ('10080min', '105h'),
+}
+
+
+def _minute_candles(count):
+    """합성 1분 캔들 count개 (오래된 순 구조화 배열)"""
+    market_data = generate_random_walk(['KRW-BENCH'], periods=count, unit='minutes/1', seed=5)
+    records = []
+    while len(records) < count:
+        before = parse_candle_time(records[-1]['candle_date_time_utc']) if records else None
+        chunk = market_data.get_candles('KRW-BENCH', 'minutes/1', min(count - len(records), 200), before)
+        if not chunk:
+            break
+        records.extend(chunk)
+    return candles_from_records(records)
+
+
+def _resample_pandas(df):
+    aggregation = {'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum', 'value': 'sum'}
+    return {
+        interval: df.resample(rule, origin='epoch', offset=offset).agg(aggregation).dropna()
+        for interval, (rule, offset) in PANDAS_RULES.items()
+    }
+
+
+def _resample_reduceat(candles):
+    return {interval: resample(candles, interval) for interval in DEFAULT_TIMEFRAMES}
+
+
+def run(context):
+    results = []
+
+    candles = _minute_candles(10080)
+    df = pd.DataFrame({name: candles[name] for name in ('open', 'high', 'low', 'close', 'volume', 'value')},
+                      index=pd.to_datetime(candles['time'], unit='ms'))
+    size = len(candles)
+
+    results.append(measure(
+        f"resample.pandas[{size}]",
+        lambda: _resample_pandas(df),
+        iterations=context.iterations(20), ops_per_call=size
+    ))
+    results.append(measure(
+        f"resample.reduceat[{size}]",
+        lambda: _resample_reduceat(candles),
+        iterations=context.iterations(100), ops_per_call=size
+    ))
+
+    resampler = TimeframeResampler()
+    resampler.update(candles[:-1])
+    live = candles[-2:].copy()
+    results.append(measure(
+        "resample.incremental[live]",
+        lambda: resampler.update(live),
+        iterations=context.iterations(2000)
+    ))
+
+    return results
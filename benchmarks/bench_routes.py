@@ -0,0 +1,25 @@
+"""
+Flask 라우트 벤치마크 (테스트 클라이언트)
+"""
+from .harness import measure
+
+
+def run(context):
+    client = context.app.test_client()
+    with client.session_transaction() as session:
+        session['_user_id'] = str(context.users[0])
+
+    def get(path):
+        def call():
+            response = client.get(path)
+            if response.status_code >= 500:
+                raise RuntimeError(f"{path} -> {response.status_code}")
+        return call
+
+    return [
+        measure("routes.trading_history", get('/api/trading/history?limit=20'), iterations=context.iterations(200)),
+        measure("routes.apikey_list", get('/api/apikey/list'), iterations=context.iterations(200)),
+        measure("routes.dashboard", get('/api/dashboard'), iterations=context.iterations(200)),
+        measure("routes.chart[lttb]", get('/api/charts/ticker/KRW-C000?count=200&width=100'), iterations=context.iterations(200)),
+        measure("routes.chart[binary]", get('/api/charts/ticker/KRW-C000?count=200&width=100&method=minmax&format=binary'), iterations=context.iterations(200)),
+    ]
@@ -0,0 +1,16 @@
+"""
+기동 시간 벤치마크 (새 프로세스에서 wsgi import = create_app 포함)
+"""
+from .harness import measure
+from .startup import profile_import
+
+
+def run(context):
+    def cold_start():
+        profile = profile_import('wsgi')
+        if profile['heavy']:
+            raise RuntimeError(f"웹 기동 시 무거운 모듈 로드: {', '.join(profile['heavy'])}")
+
+    return [
+        measure("startup.wsgi[cold]", cold_start, iterations=context.iterations(5), warmup=1),
+    ]
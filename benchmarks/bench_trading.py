@@ -0,0 +1,38 @@
+"""
+자동 매매 파이프라인 벤치마크
+- get_top_volume_tickers (UpbitService)
+- execute_auto_trading 1회차 (전체 사용자)
+"""
+from models.user import User
+from service.trading.trading_service import TradingService
+from service.upbit.upbit_service import UpbitService
+
+from .harness import measure
+
+
+def run(context):
+    results = []
+    upbit_service = UpbitService()
+
+    results.append(measure(
+        "upbit.get_top_volume_tickers",
+        lambda: upbit_service.get_top_volume_tickers(limit=5),
+        iterations=context.iterations(50)
+    ))
+
+    with context.app.app_context():
+        users = User.query.filter_by(auto_trading_enabled=True).all()
+
+        def trading_cycle():
+            for user in users:
+                TradingService(user).execute_auto_trading()
+
+        results.append(measure(
+            "trading.execute_auto_trading[cycle]",
+            trading_cycle,
+            iterations=context.iterations(5),
+            warmup=1,
+            ops_per_call=len(users)
+        ))
+
+    return results
@@ -0,0 +1,129 @@
+"""
+벤치마크용 로컬 환경 구성
+- 모의 거래소 + 합성 캔들
+- 인메모리 SQLite Flask 앱 + 합성 사용자
+- 매매/추천 경로를 끝까지 실행하기 위한 고정 전략 (벤치마크 프로세스에서만 사용)
+"""
+import os
+
+from utils.upbit_simulator import SimulatedExchange, generate_random_walk, install
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class BenchContext:
+    """벤치마크 스위트에 전달되는 공용 환경"""
+
+    def __init__(self, app, exchange, users, scale=1.0):
+        self.app = app
+        self.exchange = exchange
+        self.users = users
+        self.scale = scale
+
+    def iterations(self, base):
+        """scale을 반영한 반복 횟수 (최소 1회)"""
+        return max(1, int(base * self.scale))
+
+
+def create_exchange(num_markets=30, periods=200, seed=42):
+    """합성 시장 데이터가 적재된 모의 거래소 생성 및 UpbitService에 설치"""
+    markets = [f"KRW-C{i:03d}" for i in range(num_markets)]
+    market_data = generate_random_walk(markets, periods=periods, unit='days', seed=seed)
+    exchange = SimulatedExchange(market_data, default_balances={'KRW': 100000000})
+    install(exchange, request_interval=0.0)
+    return exchange
+
+
+def fixture_signal(ohlcv_data, params):
+    """
+    벤치마크용 고정 매매 신호 (실거래 전략 아님)
+    - RSI/MACD를 계산한 뒤 RSI 기준으로 매수/매도 신호를 내어 주문 경로까지 실행되게 함
+    """
+    from utils.manager_trading_algorithm.manager_trading_algorithm import TradingAlgorithmManager
+
+    manager = TradingAlgorithmManager()
+    close = ohlcv_data['close']
+    rsi = manager.calculate_rsi(close, 14)
+    manager.calculate_macd(close)
+    if rsi < 45:
+        action = 'buy'
+    elif rsi > 55:
+        action = 'sell'
+    else:
+        return None
+    return {'action': action, 'reason': f"벤치마크 고정 신호 (RSI {rsi:.2f})", 'confidence': 0.5,
+            'indicators': {'rsi': float(rsi)}}
+
+
+def install_fixture_strategies():
+    """TradingAlgorithmManager 싱글톤의 모든 전략에 고정 신호 연결 (현재 프로세스에만 적용)"""
+    from utils.manager_trading_algorithm.manager_trading_algorithm import TradingAlgorithmManager
+
+    manager = TradingAlgorithmManager()
+    for handler in manager.STRATEGY_HANDLERS.values():
+        setattr(manager, handler, fixture_signal)
+    return manager
+
+
+def create_app(num_users=20):
+    """
+    인메모리 DB를 사용하는 벤치마크용 Flask 앱 생성
+
+    Returns:
+        tuple: (Flask 앱, 사용자 ID 목록)
+    """
+    from flask import Flask
+    from flask_login import LoginManager
+    from models.user import db, User
+    from models.trade import Trade  # noqa: F401 (테이블 생성용)
+    from models.recommendation import Recommendation  # noqa: F401
+    from models.alert_outbox import AlertOutbox  # noqa: F401
+    from models.job_lease import JobLease  # noqa: F401
+    from models.price_alert import PriceAlert  # noqa: F401
+    from models.history import HistoryRecord, HistorySyncState  # noqa: F401
+    from routes.api.routes_trading import trading_bp
+    from routes.api.routes_dashboard import dashboard_api_bp
+    from routes.api.routes_chart import chart_bp
+    from routes.settings.routes_apikey import api_key_bp
+    from utils.manager_encryption.manager_encryption import EncryptionManager
+
+    app = Flask('benchmarks', root_path=REPO_ROOT)
+    app.config.update(
+        SECRET_KEY='benchmark',
+        SQLALCHEMY_DATABASE_URI='sqlite://',
+        SQLALCHEMY_TRACK_MODIFICATIONS=False,
+        TESTING=True,
+    )
+    db.init_app(app)
+
+    login_manager = LoginManager()
+    login_manager.init_app(app)
+
+    @login_manager.user_loader
+    def load_user(user_id):
+        return User.query.get(int(user_id))
+
+    app.register_blueprint(trading_bp)
+    app.register_blueprint(api_key_bp)
+    app.register_blueprint(dashboard_api_bp)
+    app.register_blueprint(chart_bp)
+
+    encryption_manager = EncryptionManager()
+    strategies = ['rsi_oversold', 'macd_crossover', 'bollinger_bands']
+    user_ids = []
+    with app.app_context():
+        db.create_all()
+        for i in range(num_users):
+            user = User(
+                email=f"bench{i}@example.com",
+                upbit_access_key=encryption_manager.encrypt(f"bench-access-{i}"),
+                upbit_secret_key=encryption_manager.encrypt(f"bench-secret-{i}"),
+                auto_trading_enabled=True,
+                strategy=strategies[i % len(strategies)],
+            )
+            user.password_hash = 'benchmark'
+            db.session.add(user)
+        db.session.commit()
+        user_ids = [user.id for user in User.query.all()]
+
+    return app, user_ids
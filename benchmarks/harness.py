@@ -0,0 +1,200 @@
+"""
+벤치마크 측정/기록 도구
+- 지연시간 백분위수, 처리량, 메모리 할당 측정
+- 결과 JSON 저장 및 기준선(baseline) 비교
+"""
+import gc
+import json
+import logging
+import math
+import os
+import platform
+import time
+import tracemalloc
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+
+def percentile(sorted_values, pct):
+    """정렬된 값 목록의 백분위수 (선형 보간)"""
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * pct / 100.0
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    if low == high:
+        return sorted_values[int(rank)]
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+class BenchmarkResult:
+    """단일 벤치마크 결과"""
+
+    def __init__(self, name, latencies_ns, ops_per_call=1, alloc_peak=0, alloc_blocks=0, error=None):
+        self.name = name
+        self.error = error
+        self.iterations = len(latencies_ns)
+        self.ops_per_call = ops_per_call
+
+        values = sorted(latencies_ns)
+        total = sum(values)
+        self.mean_ms = (total / len(values) / 1e6) if values else 0.0
+        self.p50_ms = percentile(values, 50) / 1e6
+        self.p90_ms = percentile(values, 90) / 1e6
+        self.p99_ms = percentile(values, 99) / 1e6
+        self.max_ms = (values[-1] / 1e6) if values else 0.0
+        self.throughput = (len(values) * ops_per_call / (total / 1e9)) if total else 0.0
+        self.alloc_peak_kb = alloc_peak / 1024
+        self.alloc_blocks = alloc_blocks
+
+    def to_dict(self):
+        return {
+            'iterations': self.iterations,
+            'ops_per_call': self.ops_per_call,
+            'mean_ms': round(self.mean_ms, 4),
+            'p50_ms': round(self.p50_ms, 4),
+            'p90_ms': round(self.p90_ms, 4),
+            'p99_ms': round(self.p99_ms, 4),
+            'max_ms': round(self.max_ms, 4),
+            'throughput_per_s': round(self.throughput, 2),
+            'alloc_peak_kb': round(self.alloc_peak_kb, 2),
+            'alloc_blocks': self.alloc_blocks,
+            'error': self.error,
+        }
+
+
+def measure(name, func, iterations=100, warmup=5, ops_per_call=1, setup=None):
+    """
+    함수 반복 실행 후 지연시간/처리량/할당량 측정
+
+    할당량은 지연시간 측정과 분리된 1회 추가 실행에서 tracemalloc으로 측정하여
+    추적 오버헤드가 지연시간에 섞이지 않도록 함
+
+    Args:
+        name (str): 벤치마크 이름
+        func (callable): 측정할 함수 (인자 없음)
+        iterations (int): 측정 반복 횟수
+        warmup (int): 측정 전 예열 횟수
+        ops_per_call (int): 1회 호출당 처리 단위 수 (처리량 계산용)
+        setup (callable, optional): 매 반복 전 호출되는 준비 함수 (측정 제외)
+
+    Returns:
+        BenchmarkResult: 측정 결과
+    """
+    try:
+        for _ in range(warmup):
+            if setup:
+                setup()
+            func()
+
+        latencies = []
+        gc_enabled = gc.isenabled()
+        gc.collect()
+        gc.disable()
+        try:
+            for _ in range(iterations):
+                if setup:
+                    setup()
+                start = time.perf_counter_ns()
+                func()
+                latencies.append(time.perf_counter_ns() - start)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        # 할당량 측정 (1회)
+        if setup:
+            setup()
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            blocks = sum(stat.count_diff for stat in after.compare_to(before, 'filename') if stat.count_diff > 0)
+        finally:
+            tracemalloc.stop()
+
+        result = BenchmarkResult(name, latencies, ops_per_call, peak, blocks)
+    except Exception as e:
+        logger.error(f"벤치마크 실행 중 오류 발생 ({name}): {e}")
+        result = BenchmarkResult(name, [], ops_per_call, error=str(e))
+
+    logger.info(
+        f"{name}: p50={result.p50_ms:.3f}ms p99={result.p99_ms:.3f}ms "
+        f"throughput={result.throughput:.1f}/s peak={result.alloc_peak_kb:.1f}KB"
+    )
+    return result
+
+
+def write_results(results, path):
+    """결과를 JSON 파일로 저장"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    data = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'benchmarks': {result.name: result.to_dict() for result in results},
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    return data
+
+
+def load_results(path):
+    """저장된 결과 JSON 로드 (없으면 None)"""
+    if not path or not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare(current, baseline, threshold=0.2):
+    """
+    기준선 대비 성능 저하 판정
+
+    Args:
+        current (dict): 현재 결과 (write_results 반환 형식)
+        baseline (dict): 기준선 결과
+        threshold (float): 허용 변화율 (0.2 = 20%)
+
+    Returns:
+        list: 회귀 목록 [(벤치마크 이름, 지표, 기준값, 현재값)]
+    """
+    regressions = []
+    base_benchmarks = baseline.get('benchmarks', {})
+
+    for name, result in current.get('benchmarks', {}).items():
+        base = base_benchmarks.get(name)
+        if not base or base.get('error') or result.get('error'):
+            continue
+
+        if base['p50_ms'] and result['p50_ms'] > base['p50_ms'] * (1 + threshold):
+            regressions.append((name, 'p50_ms', base['p50_ms'], result['p50_ms']))
+        if base['p99_ms'] and result['p99_ms'] > base['p99_ms'] * (1 + threshold * 2):
+            regressions.append((name, 'p99_ms', base['p99_ms'], result['p99_ms']))
+        if base['throughput_per_s'] and result['throughput_per_s'] < base['throughput_per_s'] * (1 - threshold):
+            regressions.append((name, 'throughput_per_s', base['throughput_per_s'], result['throughput_per_s']))
+        if base['alloc_peak_kb'] and result['alloc_peak_kb'] > base['alloc_peak_kb'] * (1 + threshold):
+            regressions.append((name, 'alloc_peak_kb', base['alloc_peak_kb'], result['alloc_peak_kb']))
+
+    return regressions
+
+
+def format_table(results):
+    """결과 요약 표 문자열"""
+    lines = [f"{'benchmark':<40} {'p50(ms)':>10} {'p90(ms)':>10} {'p99(ms)':>10} {'ops/s':>12} {'peak(KB)':>10}"]
+    for result in results:
+        if result.error:
+            lines.append(f"{result.name:<40} ERROR: {result.error}")
+            continue
+        lines.append(
+            f"{result.name:<40} {result.p50_ms:>10.3f} {result.p90_ms:>10.3f} {result.p99_ms:>10.3f} "
+            f"{result.throughput:>12.1f} {result.alloc_peak_kb:>10.1f}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,95 @@
+"""
+벤치마크 실행 스크립트
+
+    python -m benchmarks.run [--only trading,indicators] [--scale 0.5]
+                             [--output benchmarks/results/latest.json]
+                             [--baseline benchmarks/baseline.json] [--update-baseline]
+
+기준선 파일이 있으면 비교하여 성능 저하(threshold 초과) 시 종료 코드 1 반환
+"""
+import argparse
+import importlib
+import logging
+import os
+import shutil
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+SUITES = ['indicators', 'decode', 'resample', 'trading', 'recommendation', 'repository', 'routes', 'alerts', 'startup']
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="매매 파이프라인 벤치마크")
+    parser.add_argument('--only', help=f"실행할 스위트 (쉼표 구분, 기본: 전체) {SUITES}")
+    parser.add_argument('--scale', type=float, default=1.0, help="반복 횟수 배율")
+    parser.add_argument('--users', type=int, default=20, help="합성 사용자 수")
+    parser.add_argument('--markets', type=int, default=30, help="합성 마켓 수")
+    parser.add_argument('--output', default=os.path.join(REPO_ROOT, 'benchmarks', 'results', 'latest.json'))
+    parser.add_argument('--baseline', default=os.path.join(REPO_ROOT, 'benchmarks', 'baseline.json'))
+    parser.add_argument('--threshold', type=float, default=0.2, help="허용 성능 변화율")
+    parser.add_argument('--update-baseline', action='store_true', help="현재 결과를 기준선으로 저장")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format='%(levelname)s - %(name)s - %(message)s')
+    logger.setLevel(logging.INFO)
+    logging.getLogger('benchmarks.harness').setLevel(logging.INFO)
+
+    from benchmarks.harness import compare, format_table, load_results, write_results
+
+    suites = args.only.split(',') if args.only else SUITES
+    output = os.path.abspath(args.output)
+    baseline_path = os.path.abspath(args.baseline)
+
+    # DB/암호화 키 등 작업 디렉토리 기준 파일이 저장소를 오염시키지 않도록 임시 디렉토리에서 실행
+    workdir = tempfile.mkdtemp(prefix='bench-')
+    previous_cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        from benchmarks.fixtures import BenchContext, create_app, create_exchange, install_fixture_strategies
+
+        exchange = create_exchange(num_markets=args.markets)
+        install_fixture_strategies()
+        app, user_ids = create_app(num_users=args.users)
+        context = BenchContext(app, exchange, user_ids, scale=args.scale)
+
+        results = []
+        for suite in suites:
+            module = importlib.import_module(f"benchmarks.bench_{suite}")
+            results.extend(module.run(context))
+    finally:
+        os.chdir(previous_cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(format_table(results))
+    current = write_results(results, output)
+    print(f"\n결과 저장: {output}")
+
+    if args.update_baseline:
+        write_results(results, baseline_path)
+        print(f"기준선 갱신: {baseline_path}")
+        return 0
+
+    baseline = load_results(baseline_path)
+    if baseline is None:
+        print("기준선 파일이 없어 비교를 건너뜁니다. (--update-baseline 으로 생성)")
+        return 0
+
+    regressions = compare(current, baseline, args.threshold)
+    if not regressions:
+        print("기준선 대비 성능 저하 없음")
+        return 0
+
+    print("\n기준선 대비 성능 저하:")
+    for name, metric, base, value in regressions:
+        print(f"  {name} {metric}: {base} -> {value}")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,119 @@
+"""
+기동(cold start) 프로파일러
+- 새 파이썬 프로세스에서 모듈을 import 하며 -X importtime 결과를 수집
+- 전체 소요 시간, 최대 메모리(RSS), 패키지별/모듈별 import 시간, 무거운 모듈 로드 여부 출력
+
+    python -m benchmarks.startup [--module wsgi] [--top 20]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 웹 프로세스 기동 시 로드되지 않아야 하는 모듈 (첫 사용 시 지연 로딩)
+HEAVY_MODULES = ('pandas', 'numpy', 'pyupbit', 'apscheduler', 'selenium', 'matplotlib', 'plotly', 'dash')
+
+_CHILD_CODE = """
+import json, resource, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{'import_ms': elapsed * 1000, 'maxrss_kb': rss, 'modules': sorted(sys.modules)}}))
+"""
+
+
+def _child_env(workdir):
+    env = dict(os.environ)
+    env.update({
+        'PYTHONPATH': REPO_ROOT + os.pathsep + env.get('PYTHONPATH', ''),
+        'DATABASE_URL': env.get('STARTUP_DATABASE_URL', 'sqlite://'),
+        'LOG_FILE': os.path.join(workdir, 'startup.log'),
+    })
+    return env
+
+
+def parse_importtime(stderr):
+    """
+    -X importtime 출력 파싱
+
+    Returns:
+        list: (모듈 이름, 자체 시간 us, 누적 시간 us, 깊이) 목록
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line.split(':', 1)[1].split('|')
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def profile_import(module='wsgi'):
+    """
+    새 프로세스에서 모듈 import 프로파일링
+
+    Args:
+        module (str): import 할 모듈 (wsgi는 create_app까지 실행)
+
+    Returns:
+        dict: import_ms, maxrss_mb, packages(패키지별 자체 시간 ms), modules(모듈별 누적 시간), heavy(로드된 무거운 모듈)
+    """
+    workdir = tempfile.mkdtemp(prefix='startup-')
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', _CHILD_CODE.format(module=module)],
+        cwd=workdir, env=_child_env(workdir), capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{module} import 실패:\n{result.stderr[-2000:]}")
+
+    summary = json.loads(result.stdout.strip().splitlines()[-1])
+    rows = parse_importtime(result.stderr)
+
+    packages = {}
+    for name, self_us, _, _ in rows:
+        package = name.split('.')[0]
+        packages[package] = packages.get(package, 0) + self_us / 1000
+
+    loaded = set(summary['modules'])
+    return {
+        'module': module,
+        'import_ms': summary['import_ms'],
+        'maxrss_mb': summary['maxrss_kb'] / 1024,
+        'module_count': len(loaded),
+        'packages': sorted(packages.items(), key=lambda item: item[1], reverse=True),
+        'modules': sorted(((name, cumulative / 1000) for name, _, cumulative, _ in rows), key=lambda item: item[1], reverse=True),
+        'heavy': [name for name in HEAVY_MODULES if name in loaded],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기동 시간 프로파일러")
+    parser.add_argument('--module', default='wsgi', help="import 할 모듈 (기본: wsgi)")
+    parser.add_argument('--top', type=int, default=20, help="출력할 상위 항목 수")
+    args = parser.parse_args()
+
+    profile = profile_import(args.module)
+    print(f"모듈: {profile['module']}")
+    print(f"import 시간: {profile['import_ms']:.1f} ms")
+    print(f"최대 RSS: {profile['maxrss_mb']:.1f} MB")
+    print(f"로드된 모듈 수: {profile['module_count']}")
+    print(f"무거운 모듈 로드: {', '.join(profile['heavy']) or '없음'}")
+
+    print(f"\n패키지별 자체 import 시간 (상위 {args.top})")
+    for package, ms in profile['packages'][:args.top]:
+        print(f"  {package:<40} {ms:>9.1f} ms")
+
+    print(f"\n모듈별 누적 import 시간 (상위 {args.top})")
+    for name, ms in profile['modules'][:args.top]:
+        print(f"  {name:<60} {ms:>9.1f} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -12,10 +12,12 @@ class Config:
     # 데이터베이스 설정
     SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL', 'sqlite:///crypto_trading.db')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    DB_AUTO_CREATE = os.getenv('DB_AUTO_CREATE', 'True') == 'True'  # 앱 생성 시 테이블/인덱스 생성 여부
     
     # 업비트 API 설정 (기본값, 사용자별로 오버라이드 됨)
     UPBIT_ACCESS_KEY = os.getenv('UPBIT_ACCESS_KEY', '')
     UPBIT_SECRET_KEY = os.getenv('UPBIT_SECRET_KEY', '')
+    UPBIT_SERVER_URL = os.getenv('UPBIT_SERVER_URL', 'https://api.upbit.com')  # 모의 거래소 사용 시 변경
     
     # 뉴스 API 설정
     NEWS_API_KEY = os.getenv('NEWS_API_KEY', '')
@@ -23,10 +25,72 @@ class Config:
     # 추천 알고리즘 설정
     DEFAULT_STRATEGY = 'rsi_oversold'  # 기본 전략 (RSI 과매도)
     DEFAULT_RISK_LEVEL = 'medium'      # 기본 위험 수준
+    RECOMMENDATION_RETENTION_DAYS = int(os.getenv('RECOMMENDATION_RETENTION_DAYS', 30))  # 처리 완료 추천 보관 기간
+    
+    # 대시보드 설정
+    DASHBOARD_BALANCE_TTL = int(os.getenv('DASHBOARD_BALANCE_TTL', 10))  # 거래소 잔고 캐시 시간 (초)
+    DASHBOARD_WORKERS = int(os.getenv('DASHBOARD_WORKERS', 8))          # 파트 동시 조회 스레드 수
+    
+    # 차트 설정
+    CHART_CACHE_TTL = int(os.getenv('CHART_CACHE_TTL', 30))     # (티커, 인터벌, 범위)별 캔들 캐시 시간 (초)
+    CHART_MAX_COUNT = int(os.getenv('CHART_MAX_COUNT', 5000))   # 요청 가능한 최대 캔들 수
+    
+    # 마켓 카탈로그 설정
+    MARKET_CATALOG_TTL = int(os.getenv('MARKET_CATALOG_TTL', 600))  # 마켓 목록 백그라운드 갱신 주기 (초)
+    
+    # 주문 가능 정보 / 입출금 현황 캐시 설정
+    ORDER_CHANCE_CACHE_TTL = int(os.getenv('ORDER_CHANCE_CACHE_TTL', 30))    # 마켓별 주문 가능 정보 캐시 시간 (초)
+    WALLET_STATUS_CACHE_TTL = int(os.getenv('WALLET_STATUS_CACHE_TTL', 60))  # 입출금 현황 캐시 시간 (초)
+    
+    # 캔들 저장소 설정
+    CANDLE_STORE_CAPACITY = int(os.getenv('CANDLE_STORE_CAPACITY', 500))  # (티커, 인터벌)별 링 버퍼 크기
+    CANDLE_STORE_MAX_AGE = int(os.getenv('CANDLE_STORE_MAX_AGE', 30))     # 거래소 재조회 없이 버퍼를 사용할 시간 (초)
+    CANDLE_RESAMPLE_TIMEFRAMES = os.getenv('CANDLE_RESAMPLE_TIMEFRAMES', 'minute3,minute5,minute15,minute30,minute60,minute240,day,week')  # 1분 캔들로 계산할 타임프레임
+    
+    # 시세 아카이브 설정
+    MARKET_ARCHIVE_DIR = os.getenv('MARKET_ARCHIVE_DIR', '')             # 아카이브 디렉터리 (비어 있으면 market_archive 작업 비활성화)
+    MARKET_ARCHIVE_MARKETS = os.getenv('MARKET_ARCHIVE_MARKETS', '')     # 보관할 마켓 (쉼표 구분, 비어 있으면 거래량 상위)
+    MARKET_ARCHIVE_TOP = int(os.getenv('MARKET_ARCHIVE_TOP', 10))        # 마켓을 지정하지 않았을 때 보관할 거래량 상위 마켓 수
+    
+    # 자동 매매 입력 기록 설정
+    REPLAY_RECORD_DIR = os.getenv('REPLAY_RECORD_DIR', '')  # 자동 매매 1회마다 시세/잔고 입력을 기록할 디렉터리 (비어 있으면 기록하지 않음)
+    
+    # 실시간 시세 스트림 설정
+    MARKET_FEED_INTERVAL = float(os.getenv('MARKET_FEED_INTERVAL', 1.0))          # 업스트림 시세 조회 주기 (초)
+    MARKET_FEED_MIN_INTERVAL = float(os.getenv('MARKET_FEED_MIN_INTERVAL', 0.5))  # 클라이언트별 최소 전달 간격 (초)
+    MARKET_FEED_MAX_CLIENTS = int(os.getenv('MARKET_FEED_MAX_CLIENTS', 500))      # 최대 동시 구독 수
+    MARKET_FEED_MAX_MARKETS = int(os.getenv('MARKET_FEED_MAX_MARKETS', 50))       # 구독 1개당 최대 마켓 수
+    MARKET_FEED_KEEPALIVE = int(os.getenv('MARKET_FEED_KEEPALIVE', 15))           # 업데이트가 없을 때 keepalive 간격 (초)
     
     # 자동 매매 설정
     DEFAULT_INVESTMENT_AMOUNT = 100000  # 기본 투자 금액 (10만원)
     
+    # 스케줄러 설정
+    SCHEDULER_MODE = os.getenv('SCHEDULER_MODE', 'local')                   # local / distributed / off
+    SCHEDULER_SHARDS = int(os.getenv('SCHEDULER_SHARDS', 1))                # 사용자 샤드 수 (user.id % 샤드 수)
+    SCHEDULER_LEASE_SECONDS = int(os.getenv('SCHEDULER_LEASE_SECONDS', 600))  # 샤드 임대 유지 시간
+    WORKER_ID = os.getenv('WORKER_ID', '')                                   # 비워두면 호스트:PID
+    WORKER_LOG_FILE = os.getenv('WORKER_LOG_FILE', 'worker.log')            # 워커 프로세스 로그 파일
+    WORKER_METRICS_PORT = int(os.getenv('WORKER_METRICS_PORT', 0))           # 0이면 워커 /metrics 서버 미사용
+    
+    # 알림 설정
+    ALERT_CHANNELS = os.getenv('ALERT_CHANNELS', 'log')           # 쉼표 구분: log, email, webhook, memory
+    ALERT_WORKERS = int(os.getenv('ALERT_WORKERS', 4))            # 발송 스레드 수
+    ALERT_BATCH_SIZE = int(os.getenv('ALERT_BATCH_SIZE', 500))    # 디스패처 배치 크기
+    ALERT_MAX_ATTEMPTS = int(os.getenv('ALERT_MAX_ATTEMPTS', 3))  # 알림별 최대 발송 시도 횟수
+    ALERT_RETRY_BACKOFF = int(os.getenv('ALERT_RETRY_BACKOFF', 60))  # 재시도 대기 기본값 (초, 시도마다 2배)
+    ALERT_WEBHOOK_URL = os.getenv('ALERT_WEBHOOK_URL', '')
+    SMTP_HOST = os.getenv('SMTP_HOST', '')
+    SMTP_PORT = int(os.getenv('SMTP_PORT', 587))
+    SMTP_USERNAME = os.getenv('SMTP_USERNAME', '')
+    SMTP_PASSWORD = os.getenv('SMTP_PASSWORD', '')
+    SMTP_SENDER = os.getenv('SMTP_SENDER', '')
+    SMTP_USE_TLS = os.getenv('SMTP_USE_TLS', 'True') == 'True'
+    
     # 로깅 설정
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
-    LOG_FILE = os.getenv('LOG_FILE', 'app.log')
\ No newline at end of file
+    LOG_FILE = os.getenv('LOG_FILE', 'app.log')
+    LOG_FORMAT = os.getenv('LOG_FORMAT', 'text')                          # text 또는 json
+    LOG_MAX_BYTES = int(os.getenv('LOG_MAX_BYTES', 10 * 1024 * 1024))     # 크기 기준 순환 (기본 10MB)
+    LOG_BACKUP_COUNT = int(os.getenv('LOG_BACKUP_COUNT', 5))
+    LOG_ROTATE_WHEN = os.getenv('LOG_ROTATE_WHEN', '')                    # 예: midnight (지정 시 시간 기준 순환)
\ No newline at end of file
@@ -0,0 +1,35 @@
+from datetime import datetime
+from models.user import db
+
+class AlertOutbox(db.Model):
+    """
+    발송 대기 알림 큐 (outbox)
+    - 알림 생성 측은 행만 추가하고, 실제 발송은 디스패처가 일괄 처리
+    """
+    __tablename__ = 'alert_outbox'
+    __table_args__ = (
+        db.Index('ix_alert_outbox_status_created_at', 'status', 'created_at'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    
+    # 알림 내용
+    category = db.Column(db.String(20), nullable=False)       # 알림 종류 (trade, recommendation, price)
+    title = db.Column(db.String(200), nullable=False)         # 제목
+    message = db.Column(db.Text, nullable=False)              # 본문
+    
+    # 발송 상태
+    status = db.Column(db.String(20), default='pending')      # 상태 (pending, sending, sent, failed)
+    attempts = db.Column(db.Integer, default=0)               # 발송 시도 횟수
+    last_error = db.Column(db.Text, nullable=True)            # 마지막 발송 오류
+    delivered_channels = db.Column(db.String(200), nullable=True)  # 발송에 성공한 채널 (쉼표 구분, 재시도 시 제외)
+    next_attempt_at = db.Column(db.DateTime, nullable=True)   # 다음 발송 시도 가능 시간 (재시도 대기)
+    
+    # 타임스탬프
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    claimed_at = db.Column(db.DateTime, nullable=True)        # 디스패처가 발송을 시작한 시간
+    sent_at = db.Column(db.DateTime, nullable=True)           # 발송 완료 시간
+    
+    def __repr__(self):
+        return f'<AlertOutbox {self.id}: {self.category} user={self.user_id} {self.status}>'
@@ -0,0 +1,31 @@
+from models.user import db
+from models.trade import Trade  # noqa: F401 (테이블 생성용)
+from models.recommendation import Recommendation
+from models.job_lease import JobLease  # noqa: F401
+from models.alert_outbox import AlertOutbox  # noqa: F401
+from models.price_alert import PriceAlert  # noqa: F401
+from models.history import HistoryRecord, HistorySyncState  # noqa: F401
+from utils.manager_metrics.manager_metrics import instrument_sqlalchemy
+
+
+def init_database(app, create_tables=None):
+    """
+    앱에 DB 연결 및 쿼리 메트릭 등록 (웹 앱과 워커 공용)
+
+    Args:
+        app (Flask): 애플리케이션
+        create_tables (bool, optional): 테이블/인덱스 생성 여부 (None이면 DB_AUTO_CREATE 설정에 따름)
+    """
+    if create_tables is None:
+        create_tables = app.config.get('DB_AUTO_CREATE', True)
+
+    db.init_app(app)
+
+    # 스키마 생성은 배포 시 한 번만 하면 되므로 DB_AUTO_CREATE=False로 기동 시 생략 가능
+    with app.app_context():
+        if create_tables:
+            db.create_all()
+            # 기존 DB에 추가된 인덱스 생성 (create_all은 이미 있는 테이블의 인덱스를 만들지 않음)
+            for index in Recommendation.__table__.indexes:
+                index.create(db.engine, checkfirst=True)
+        instrument_sqlalchemy(db.engine)
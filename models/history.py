@@ -0,0 +1,63 @@
+from datetime import datetime
+from models.user import db
+
+class HistoryRecord(db.Model):
+    """
+    거래소 계정 내역 로컬 사본 (입금, 출금, 종료된 주문)
+    - 거래소에서 페이지 단위로 다시 조회하지 않고 내역/세금/손익 화면에서 바로 조회
+    - (user_id, stream, uuid) 단위로 upsert
+    """
+    __tablename__ = 'history_records'
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'stream', 'uuid', name='uq_history_records_user_stream_uuid'),
+        # 화폐/상태/기간 조회용
+        db.Index('ix_history_records_user_stream_created_at', 'user_id', 'stream', 'created_at'),
+        db.Index('ix_history_records_user_currency_created_at', 'user_id', 'currency', 'created_at'),
+        db.Index('ix_history_records_user_state_created_at', 'user_id', 'state', 'created_at'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    stream = db.Column(db.String(10), nullable=False)         # 내역 종류 (deposit, withdraw, order)
+    uuid = db.Column(db.String(64), nullable=False)           # 거래소 UUID
+
+    # 내역 정보
+    currency = db.Column(db.String(20), nullable=False)       # 화폐 코드 (주문은 마켓의 거래 화폐, 예: BTC)
+    market = db.Column(db.String(20), nullable=True)          # 마켓 코드 (주문만, 예: KRW-BTC)
+    side = db.Column(db.String(10), nullable=True)            # 주문 종류 (bid, ask) 또는 입출금 유형
+    state = db.Column(db.String(20), nullable=False)          # 상태 (done, cancel, accepted, ...)
+    amount = db.Column(db.Float, nullable=False, default=0)   # 입출금 수량 또는 체결 수량
+    price = db.Column(db.Float, nullable=True)                # 주문 가격
+    fee = db.Column(db.Float, nullable=False, default=0)      # 수수료
+    txid = db.Column(db.String(200), nullable=True)           # 입출금 트랜잭션 ID
+    raw = db.Column(db.JSON, nullable=True)                   # 거래소 원본 응답
+
+    # 타임스탬프 (UTC)
+    created_at = db.Column(db.DateTime, nullable=False)       # 거래소 생성 시간
+    done_at = db.Column(db.DateTime, nullable=True)           # 완료 시간
+    synced_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<HistoryRecord {self.stream} {self.uuid}: {self.currency} {self.state}>'
+
+
+class HistorySyncState(db.Model):
+    """
+    내역 종류별 동기화 위치
+    - 다음 동기화는 마지막으로 받은 레코드(last_uuid, last_created_at)보다 새로운 것만 조회
+    """
+    __tablename__ = 'history_sync_state'
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'stream', name='uq_history_sync_state_user_stream'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    stream = db.Column(db.String(10), nullable=False)         # 내역 종류 (deposit, withdraw, order)
+
+    last_uuid = db.Column(db.String(64), nullable=True)       # 마지막으로 받은 최신 레코드 UUID
+    last_created_at = db.Column(db.DateTime, nullable=True)   # 마지막으로 받은 최신 레코드 생성 시간 (UTC)
+    synced_at = db.Column(db.DateTime, nullable=True)         # 마지막 동기화 시간
+
+    def __repr__(self):
+        return f'<HistorySyncState {self.user_id}/{self.stream} {self.last_created_at}>'
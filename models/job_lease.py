@@ -0,0 +1,27 @@
+from datetime import datetime
+from models.user import db
+
+class JobLease(db.Model):
+    """
+    분산 스케줄러 작업 임대(lease) 테이블
+    - (job_name, shard) 단위로 한 시점에 하나의 워커만 작업을 실행하도록 보장
+    """
+    __tablename__ = 'job_leases'
+    __table_args__ = (
+        db.UniqueConstraint('job_name', 'shard', name='uq_job_leases_job_shard'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    job_name = db.Column(db.String(50), nullable=False)       # 작업 이름 (auto_trading, recommendations 등)
+    shard = db.Column(db.Integer, nullable=False, default=0)  # 사용자 샤드 번호 (user.id % 샤드 수)
+    
+    # 임대 정보
+    owner = db.Column(db.String(100), nullable=True)          # 임대 중인 워커 ID
+    lease_until = db.Column(db.DateTime, nullable=True)       # 임대 만료 시간 (이후 다른 워커가 가져갈 수 있음)
+    last_tick = db.Column(db.DateTime, nullable=True)         # 마지막으로 실행한 주기 시작 시간
+    
+    # 타임스탬프
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<JobLease {self.job_name}#{self.shard} owner={self.owner} until={self.lease_until}>'
@@ -0,0 +1,41 @@
+from datetime import datetime
+from models.user import db
+
+class PriceAlert(db.Model):
+    __tablename__ = 'price_alerts'
+    __table_args__ = (
+        # 엔진 적재(status='active') 및 사용자별 조회용
+        db.Index('ix_price_alerts_status_ticker', 'status', 'ticker'),
+        db.Index('ix_price_alerts_user_status', 'user_id', 'status'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    
+    # 알림 조건
+    ticker = db.Column(db.String(20), nullable=False)         # 코인 티커 (KRW-BTC 등)
+    target_price = db.Column(db.Float, nullable=False)        # 목표 가격
+    condition_type = db.Column(db.String(10), nullable=False) # 조건 타입 (above: 이상, below: 이하)
+    
+    # 알림 상태
+    status = db.Column(db.String(20), default='active')       # 상태 (active, triggered, canceled)
+    triggered_price = db.Column(db.Float, nullable=True)      # 알림 발생 시 가격
+    
+    # 타임스탬프
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    triggered_at = db.Column(db.DateTime, nullable=True)
+    
+    def __repr__(self):
+        return f'<PriceAlert {self.id}: {self.ticker} {self.condition_type} {self.target_price}>'
+    
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'ticker': self.ticker,
+            'target_price': self.target_price,
+            'condition_type': self.condition_type,
+            'status': self.status,
+            'triggered_price': self.triggered_price,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'triggered_at': self.triggered_at.isoformat() if self.triggered_at else None,
+        }
@@ -3,6 +3,11 @@ from models.user import db
 
 class Recommendation(db.Model):
     __tablename__ = 'recommendations'
+    __table_args__ = (
+        # 만료 처리(status='pending' AND expiration < now) 및 사용자별 대기 추천 조회용
+        db.Index('ix_recommendations_status_expiration', 'status', 'expiration'),
+        db.Index('ix_recommendations_user_status_timestamp', 'user_id', 'status', 'timestamp'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
@@ -36,14 +41,12 @@ class Recommendation(db.Model):
     def __repr__(self):
         return f'<Recommendation {self.id}: {self.recommendation_type} {self.ticker} at {self.price}>'
     
-    # 추천이 유효한지 확인
+    # 추천이 유효한지 확인 (읽기 전용 - 만료 상태 저장은 만료 처리 작업이 일괄 수행)
     def is_valid(self):
         if self.status != 'pending':
             return False
             
         if self.expiration and datetime.utcnow() > self.expiration:
-            self.status = 'expired'
-            db.session.commit()
             return False
             
         return True
\ No newline at end of file
@@ -0,0 +1,65 @@
+from flask import Blueprint, request, jsonify, Response, current_app
+from service.chart.chart_service import ChartService, COLUMNS
+import logging
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# Blueprint 생성
+chart_bp = Blueprint('api_chart', __name__, url_prefix='/api/charts')
+
+
+def _chart_service():
+    return ChartService(
+        cache_ttl=current_app.config.get('CHART_CACHE_TTL', 30),
+        max_count=current_app.config.get('CHART_MAX_COUNT', 5000)
+    )
+
+
+@chart_bp.route('/ticker/<ticker>', methods=['GET'])
+def get_ticker_chart_data(ticker):
+    """
+    특정 코인의 차트 데이터 API
+    쿼리 파라미터:
+        interval: 캔들 간격 (기본값 day)
+        count: 캔들 수 (기본값 30, 최대 CHART_MAX_COUNT)
+        to: 마지막 캔들 시각 (선택사항)
+        width: 차트 픽셀 폭 - 지정 시 결과 점 개수를 폭 이하로 다운샘플링 (선택사항)
+        method: lttb (기본값, 선 차트) / minmax (캔들 차트) / none
+        format: json (기본값, 컬럼 배열) / binary (time int64 + OHLCV float32, 리틀 엔디언)
+    """
+    try:
+        interval = request.args.get('interval', 'day')
+        count = request.args.get('count', 30, type=int)
+        width = request.args.get('width', type=int)
+        method = request.args.get('method', 'lttb')
+        output = request.args.get('format', 'json')
+
+        if count is None or count < 1:
+            return jsonify({"error": "count는 1 이상이어야 합니다."}), 400
+        if width is not None and width < 3:
+            return jsonify({"error": "width는 3 이상이어야 합니다."}), 400
+        if output not in ('json', 'binary'):
+            return jsonify({"error": f"지원하지 않는 형식입니다: {output}"}), 400
+
+        chart_service = _chart_service()
+        chart = chart_service.get_chart(ticker, interval, count, request.args.get('to'), width, method)
+        if 'error' in chart:
+            return jsonify({"error": chart['error']}), 400
+
+        if output == 'binary':
+            response = Response(ChartService.to_binary(chart), mimetype='application/octet-stream')
+            response.headers['X-Chart-Columns'] = ','.join(COLUMNS)
+            response.headers['X-Chart-Length'] = str(chart['length'])
+            response.headers['X-Chart-Total'] = str(chart['total'])
+            response.headers['X-Chart-Method'] = chart['method']
+        else:
+            response = jsonify(ChartService.to_json(chart))
+
+        # 시세 데이터는 사용자와 무관하므로 캐시 시간 동안 공유 캐시 허용
+        response.headers['Cache-Control'] = f"public, max-age={int(chart_service.cache_ttl)}"
+        return response
+
+    except Exception as e:
+        logger.error(f"차트 데이터 조회 중 오류 발생: {e}")
+        return jsonify({"error": "차트 데이터 조회 중 오류가 발생했습니다."}), 500
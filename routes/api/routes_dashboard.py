@@ -0,0 +1,58 @@
+from flask import Blueprint, request, jsonify, Response
+from flask_login import login_required, current_user
+from service.dashboard.dashboard_service import DashboardService, compute_etag
+import logging
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# Blueprint 생성
+dashboard_api_bp = Blueprint('api_dashboard', __name__, url_prefix='/api/dashboard')
+
+
+def _parse_known(value):
+    """known 파라미터(part:etag,part:etag) 파싱"""
+    known = {}
+    for item in (value or '').split(','):
+        part, _, etag = item.partition(':')
+        if part.strip() and etag.strip():
+            known[part.strip()] = etag.strip()
+    return known
+
+
+@dashboard_api_bp.route('', methods=['GET'])
+@login_required
+def get_dashboard():
+    """
+    대시보드 데이터 API
+    쿼리 파라미터:
+        parts: 조회할 파트 (쉼표 구분, 기본값 전체: balance,trades,recommendations)
+        known: 클라이언트가 가진 파트별 ETag (예: balance:abc,trades:def)
+               → ETag가 같은 파트는 데이터 없이 {"etag": ..., "unchanged": true}로 응답
+    전체 응답의 ETag가 If-None-Match와 같으면 304 반환
+    """
+    try:
+        requested = [part.strip() for part in request.args.get('parts', '').split(',') if part.strip()]
+        invalid = [part for part in requested if part not in DashboardService.PARTS]
+        if invalid:
+            return jsonify({"error": f"지원하지 않는 파트입니다: {', '.join(invalid)}"}), 400
+
+        parts = DashboardService(current_user.id).assemble(requested or None)
+        etag = compute_etag({name: part['etag'] for name, part in parts.items()})
+
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        else:
+            known = _parse_known(request.args.get('known'))
+            for name, part in parts.items():
+                if part['etag'] is not None and known.get(name) == part['etag']:
+                    parts[name] = {'etag': part['etag'], 'unchanged': True}
+            response = jsonify({"parts": parts, "etag": etag})
+
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'private, no-cache'
+        return response
+
+    except Exception as e:
+        logger.error(f"대시보드 조회 중 오류 발생: {e}")
+        return jsonify({"error": "대시보드 조회 중 오류가 발생했습니다."}), 500
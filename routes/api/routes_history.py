@@ -0,0 +1,72 @@
+from flask import Blueprint, request, jsonify
+from flask_login import login_required, current_user
+from service.history.history_service import HistoryService, STREAMS, parse_exchange_time
+import logging
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# Blueprint 생성
+history_bp = Blueprint('api_history', __name__, url_prefix='/api/history')
+
+
+@history_bp.route('', methods=['GET'])
+@login_required
+def get_history():
+    """
+    로컬 내역 조회 API (거래소를 다시 조회하지 않음, 동기화는 /api/history/sync 또는 워커 작업)
+    쿼리 파라미터:
+        stream: 내역 종류 (deposit, withdraw, order)
+        currency: 화폐 코드 (예: BTC)
+        state: 상태 (예: done)
+        start, end: 조회 기간 (ISO 8601, 시간대가 없으면 UTC)
+        limit: 최대 조회 수 (기본값 100, 최대 1000)
+        offset: 건너뛸 수
+    """
+    try:
+        stream = request.args.get('stream')
+        if stream and stream not in STREAMS:
+            return jsonify({"error": f"지원하지 않는 내역 종류입니다: {stream}"}), 400
+
+        start = parse_exchange_time(request.args.get('start'))
+        end = parse_exchange_time(request.args.get('end'))
+        if (request.args.get('start') and start is None) or (request.args.get('end') and end is None):
+            return jsonify({"error": "잘못된 기간 형식입니다."}), 400
+
+        limit = max(1, min(request.args.get('limit', 100, type=int), 1000))
+        offset = max(0, request.args.get('offset', 0, type=int))
+
+        history_service = HistoryService(current_user.id)
+        records = history_service.query(
+            stream=stream,
+            currency=request.args.get('currency'),
+            state=request.args.get('state'),
+            start=start,
+            end=end,
+            limit=limit,
+            offset=offset
+        )
+        return jsonify({"records": records, "sync": history_service.sync_status()})
+
+    except Exception as e:
+        logger.error(f"내역 조회 중 오류 발생: {e}")
+        return jsonify({"error": "내역 조회 중 오류가 발생했습니다."}), 500
+
+
+@history_bp.route('/sync', methods=['POST'])
+@login_required
+def sync_history():
+    """
+    거래소 내역 증분 동기화 API
+    요청 본문 (선택): {"streams": ["deposit", "withdraw", "order"]}
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        result = HistoryService(current_user.id).sync(data.get('streams'))
+        if 'error' in result:
+            return jsonify(result), 400
+        return jsonify({"result": result})
+
+    except Exception as e:
+        logger.error(f"내역 동기화 중 오류 발생: {e}")
+        return jsonify({"error": "내역 동기화 중 오류가 발생했습니다."}), 500
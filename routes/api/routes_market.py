@@ -0,0 +1,90 @@
+from flask import Blueprint, request, jsonify, Response, current_app
+from flask_login import login_required
+from service.market.market_feed import MarketFeed, FeedCapacityError
+from utils.upbit_api.market_catalog import MarketCatalog
+import json
+import logging
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# Blueprint 생성
+market_bp = Blueprint('api_market', __name__, url_prefix='/api/market')
+
+
+def _sse(event, data):
+    """SSE 이벤트 문자열 생성"""
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+@market_bp.route('/stream', methods=['GET'])
+@login_required
+def stream_prices():
+    """
+    실시간 시세 스트림 API (Server-Sent Events)
+    쿼리 파라미터:
+        markets: 구독할 마켓 (쉼표 구분, 예: KRW-BTC,KRW-ETH)
+        interval: 최소 전달 간격 (초, 기본값 1.0, 최소 MARKET_FEED_MIN_INTERVAL)
+    이벤트:
+        prices: {"KRW-BTC": 50000000.0, ...} - 가격이 바뀐 마켓만 포함
+        (업데이트가 없으면 주기적으로 keepalive 주석 전송)
+    """
+    markets = [market.strip().upper() for market in request.args.get('markets', '').split(',') if market.strip()]
+    config = current_app.config
+    interval = max(
+        request.args.get('interval', 1.0, type=float) or 1.0,
+        config.get('MARKET_FEED_MIN_INTERVAL', 0.5)
+    )
+    keepalive = config.get('MARKET_FEED_KEEPALIVE', 15)
+
+    # 상장되지 않은 마켓은 폴러에 넣지 않고 거절
+    catalog = MarketCatalog()
+    unknown = [market for market in markets if catalog.exists(market) is False]
+    if unknown:
+        return jsonify({"error": f"존재하지 않는 마켓입니다: {', '.join(unknown)}"}), 400
+
+    feed = MarketFeed().configure_from_config(config)
+    try:
+        subscription = feed.subscribe(markets, min_interval=interval)
+    except FeedCapacityError as e:
+        return jsonify({"error": str(e)}), 503
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    def generate():
+        try:
+            # 재연결 대기 시간 안내
+            yield f"retry: {int(interval * 1000) + 1000}\n\n"
+            while not subscription.closed:
+                updates = subscription.next(timeout=keepalive)
+                if updates is None:
+                    yield ": keepalive\n\n"
+                else:
+                    yield _sse('prices', updates)
+        finally:
+            # 클라이언트 연결 종료 시 (GeneratorExit) 구독 해제
+            subscription.close()
+
+    response = Response(generate(), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'  # nginx 버퍼링 비활성화
+    return response
+
+
+@market_bp.route('/catalog', methods=['GET'])
+def get_catalog():
+    """
+    마켓 카탈로그 API
+    쿼리 파라미터:
+        quote: 기준 화폐 (예: KRW, 기본값 전체)
+        include_warning: 유의 종목 포함 여부 (기본값 true)
+    """
+    catalog = MarketCatalog()
+    include_warning = request.args.get('include_warning', 'true').lower() != 'false'
+    tickers = catalog.tickers(request.args.get('quote'), include_warning=include_warning)
+    if not catalog.loaded:
+        return jsonify({"error": "마켓 목록을 불러올 수 없습니다."}), 503
+
+    response = jsonify({"markets": [catalog.get(market).to_dict() for market in tickers]})
+    response.headers['Cache-Control'] = 'public, max-age=60'
+    return response
@@ -0,0 +1,20 @@
+from flask import Blueprint, Response
+from utils.manager_metrics.manager_metrics import MetricsManager
+import logging
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# Blueprint 생성
+metrics_bp = Blueprint('metrics', __name__)
+
+@metrics_bp.route('/metrics', methods=['GET'])
+def get_metrics():
+    """
+    Prometheus 수집용 메트릭 API (text exposition format 0.0.4)
+    """
+    try:
+        return Response(MetricsManager().render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+    except Exception as e:
+        logger.error(f"메트릭 출력 중 오류 발생: {e}")
+        return Response(f"# error: {e}\n", status=500, mimetype='text/plain')
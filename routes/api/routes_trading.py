@@ -1,6 +1,7 @@
 from flask import Blueprint, request, jsonify, current_app
 from flask_login import login_required, current_user
 from service.trading.trading_service import TradingService
+from models.user import db
 import logging
 
 # 로깅 설정
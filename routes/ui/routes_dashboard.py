@@ -0,0 +1,23 @@
+from flask import Blueprint, render_template
+from flask_login import login_required, current_user
+from service.dashboard.dashboard_service import DashboardService
+
+# Blueprint 생성
+dashboard_bp = Blueprint('dashboard', __name__)
+
+
+# 대시보드 페이지
+@dashboard_bp.route('/dashboard')
+@login_required
+def dashboard():
+    # 잔고/거래/추천을 동시에 조회 (이후 갱신은 /api/dashboard로 변경된 파트만 요청)
+    parts = DashboardService(current_user.id).assemble()
+
+    return render_template(
+        'dashboard.html',
+        user=current_user,
+        balance_info=parts['balance'].get('data') or {"error": parts['balance'].get('error')},
+        recent_trades=parts['trades'].get('data', []),
+        recent_recommendations=parts['recommendations'].get('data', []),
+        etags={name: part['etag'] for name, part in parts.items()}
+    )
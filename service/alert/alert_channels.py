@@ -0,0 +1,199 @@
+import json
+import logging
+import smtplib
+import threading
+from email.message import EmailMessage
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+class AlertChannel:
+    """
+    알림 발송 채널 기본 클래스
+    - send()는 실패 시 예외를 발생시키며, 재시도 여부는 디스패처가 결정
+    """
+
+    name = 'base'
+
+    def send(self, recipient, title, message):
+        """
+        알림 발송
+
+        Args:
+            recipient (dict): 수신자 정보 (user_id, email)
+            title (str): 제목
+            message (str): 본문
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """채널 자원 정리"""
+
+
+class LogChannel(AlertChannel):
+    """로그로만 기록하는 채널 (기본값)"""
+
+    name = 'log'
+
+    def send(self, recipient, title, message):
+        logger.info("알림 발송 (사용자 %s): %s", recipient['user_id'], title)
+
+
+class EmailChannel(AlertChannel):
+    """SMTP 이메일 채널"""
+
+    name = 'email'
+
+    def __init__(self, host, port=587, username=None, password=None, sender=None, use_tls=True, timeout=10):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.sender = sender or username
+        self.use_tls = use_tls
+        self.timeout = timeout
+
+    def send(self, recipient, title, message):
+        if not recipient.get('email'):
+            return
+
+        mail = EmailMessage()
+        mail['Subject'] = title
+        mail['From'] = self.sender
+        mail['To'] = recipient['email']
+        mail.set_content(message)
+
+        with smtplib.SMTP(self.host, self.port, timeout=self.timeout) as smtp:
+            if self.use_tls:
+                smtp.starttls()
+            if self.username:
+                smtp.login(self.username, self.password)
+            smtp.send_message(mail)
+
+
+class WebhookChannel(AlertChannel):
+    """웹훅(HTTP POST JSON) 채널"""
+
+    name = 'webhook'
+
+    def __init__(self, url, timeout=5):
+        self.url = url
+        self.timeout = timeout
+        self.session = requests.Session()
+
+    def send(self, recipient, title, message):
+        response = self.session.post(self.url, json={
+            'user_id': recipient['user_id'],
+            'email': recipient.get('email'),
+            'title': title,
+            'message': message,
+        }, timeout=self.timeout)
+        response.raise_for_status()
+
+    def close(self):
+        self.session.close()
+
+
+class MemoryChannel(AlertChannel):
+    """발송 내용을 메모리에 보관하는 채널 (테스트/로컬 확인용)"""
+
+    name = 'memory'
+
+    def __init__(self):
+        self.sent = []
+        self._lock = threading.Lock()
+
+    def send(self, recipient, title, message):
+        with self._lock:
+            self.sent.append({'user_id': recipient['user_id'], 'title': title, 'message': message})
+
+
+class LocalWebhookReceiver:
+    """
+    웹훅 채널 테스트용 로컬 수신 서버
+    - 수신한 JSON 본문을 received 목록에 보관
+
+    사용 예:
+        receiver = LocalWebhookReceiver().start()
+        channel = WebhookChannel(receiver.url)
+        ...
+        receiver.stop()
+    """
+
+    def __init__(self, host='127.0.0.1', port=0):
+        self.received = []
+        receiver = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                logger.debug("%s - %s", self.address_string(), format % args)
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                try:
+                    receiver.received.append(json.loads(self.rfile.read(length) or b'{}'))
+                    self.send_response(204)
+                except ValueError:
+                    self.send_response(400)
+                self.end_headers()
+
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/alerts"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='alert-webhook', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+
+def create_channels(config):
+    """
+    설정(ALERT_CHANNELS 등)으로 알림 채널 목록 생성
+
+    Args:
+        config: app.config 또는 같은 키를 제공하는 dict
+
+    Returns:
+        list: AlertChannel 목록
+    """
+    names = [name.strip() for name in (config.get('ALERT_CHANNELS') or 'log').split(',') if name.strip()]
+    channels = []
+    for name in names:
+        if name == 'log':
+            channels.append(LogChannel())
+        elif name == 'memory':
+            channels.append(MemoryChannel())
+        elif name == 'email':
+            if not config.get('SMTP_HOST'):
+                logger.warning("SMTP_HOST가 설정되지 않아 이메일 채널을 사용하지 않습니다.")
+                continue
+            channels.append(EmailChannel(
+                config['SMTP_HOST'],
+                int(config.get('SMTP_PORT') or 587),
+                config.get('SMTP_USERNAME') or None,
+                config.get('SMTP_PASSWORD') or None,
+                config.get('SMTP_SENDER') or None,
+                bool(config.get('SMTP_USE_TLS', True)),
+            ))
+        elif name == 'webhook':
+            if not config.get('ALERT_WEBHOOK_URL'):
+                logger.warning("ALERT_WEBHOOK_URL이 설정되지 않아 웹훅 채널을 사용하지 않습니다.")
+                continue
+            channels.append(WebhookChannel(config['ALERT_WEBHOOK_URL']))
+        else:
+            logger.warning("지원하지 않는 알림 채널입니다: %s", name)
+    return channels
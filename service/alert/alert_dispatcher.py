@@ -0,0 +1,237 @@
+import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from models.user import db, User
+from models.alert_outbox import AlertOutbox
+
+logger = logging.getLogger(__name__)
+
+
+class AlertDispatcher:
+    """
+    알림 outbox 발송 디스패처
+    - 대기 알림을 배치 단위로 가져와(pending → sending) 사용자별로 하나의 메시지로 합침
+    - 채널 발송은 스레드 풀에서 병렬 처리 (DB 접근은 호출 스레드에서만 수행)
+    - 실패한 알림은 최대 시도 횟수까지 재시도 대기(retry_backoff × 2^시도 횟수)가 지난 뒤 다음 실행에서 재시도
+    - 채널별 발송 결과를 기록하여 재시도 시 이미 성공한 채널로는 다시 보내지 않음
+    """
+
+    def __init__(self, channels, max_workers=4, batch_size=500, max_attempts=3, stale_seconds=600, retry_backoff=60):
+        """
+        Args:
+            channels (list): AlertChannel 목록
+            max_workers (int): 발송 스레드 수
+            batch_size (int): 한 번에 가져올 알림 수
+            max_attempts (int): 알림별 최대 발송 시도 횟수
+            stale_seconds (int): sending 상태로 이 시간 이상 남은 알림은 중단된 것으로 보고 재시도
+            retry_backoff (int): 첫 재시도까지 대기 시간 (초, 이후 시도마다 2배)
+        """
+        self.channels = channels
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.stale_seconds = stale_seconds
+        self.retry_backoff = retry_backoff
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='alert-dispatch')
+
+    def dispatch_pending(self, max_batches=None):
+        """
+        대기 알림 발송 (app context 안에서 호출)
+
+        Args:
+            max_batches (int, optional): 최대 처리 배치 수 (None이면 대기 알림이 없을 때까지)
+
+        Returns:
+            dict: 발송 결과 (sent, failed, messages) - 알림은 한 번의 실행에서 한 번만 시도
+        """
+        summary = {'sent': 0, 'failed': 0, 'messages': 0}
+        self._requeue_stale()
+
+        # 이번 실행에서 실패한 알림은 재시도 대기와 관계없이 다시 가져오지 않음
+        attempted = set()
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            rows = self._claim_batch(attempted)
+            if not rows:
+                break
+            result = self._deliver_batch(rows)
+            attempted.update(result.pop('failed_ids'))
+            for key in summary:
+                summary[key] += result[key]
+            batches += 1
+
+        if summary['messages']:
+            logger.info(
+                "알림 발송 완료: 메시지 %s건 (알림 %s건 성공, %s건 실패)",
+                summary['messages'], summary['sent'], summary['failed']
+            )
+        return summary
+
+    def shutdown(self, wait=True):
+        """스레드 풀 및 채널 종료"""
+        self.executor.shutdown(wait=wait)
+        for channel in self.channels:
+            channel.close()
+
+    # ------ 내부 처리 ------
+
+    def _requeue_stale(self):
+        """발송 중 프로세스가 종료되어 sending 상태로 남은 알림 복구"""
+        try:
+            cutoff = datetime.utcnow() - timedelta(seconds=self.stale_seconds)
+            AlertOutbox.query.filter(
+                AlertOutbox.status == 'sending',
+                AlertOutbox.claimed_at < cutoff
+            ).update({'status': 'pending'}, synchronize_session=False)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error("중단된 알림 복구 중 오류 발생: %s", e)
+
+    def _claim_batch(self, exclude=()):
+        """재시도 대기가 끝난 대기 알림을 sending 상태로 변경하고 반환"""
+        try:
+            now = datetime.utcnow()
+            query = db.session.query(AlertOutbox.id).filter(
+                AlertOutbox.status == 'pending',
+                db.or_(AlertOutbox.next_attempt_at.is_(None), AlertOutbox.next_attempt_at <= now)
+            )
+            if exclude:
+                query = query.filter(AlertOutbox.id.notin_(list(exclude)))
+            ids = [row.id for row in query.order_by(AlertOutbox.id).limit(self.batch_size).all()]
+            if not ids:
+                return []
+
+            AlertOutbox.query.filter(
+                AlertOutbox.id.in_(ids),
+                AlertOutbox.status == 'pending'
+            ).update({'status': 'sending', 'claimed_at': now}, synchronize_session=False)
+            db.session.commit()
+
+            return db.session.query(
+                AlertOutbox.id, AlertOutbox.user_id, AlertOutbox.title, AlertOutbox.message,
+                AlertOutbox.attempts, AlertOutbox.delivered_channels
+            ).filter(
+                AlertOutbox.id.in_(ids),
+                AlertOutbox.status == 'sending',
+                AlertOutbox.claimed_at == now
+            ).order_by(AlertOutbox.id).all()
+        except Exception as e:
+            db.session.rollback()
+            logger.error("알림 배치 조회 중 오류 발생: %s", e)
+            return []
+
+    def _deliver_batch(self, rows):
+        """사용자별로 알림을 합쳐 병렬 발송 후 결과 반영 (이미 성공한 채널이 같은 알림끼리 합침)"""
+        groups = defaultdict(list)
+        for row in rows:
+            groups[(row.user_id, row.delivered_channels or '')].append(row)
+
+        # 수신자 정보 일괄 조회
+        user_ids = list({user_id for user_id, _ in groups})
+        recipients = {
+            user_id: {'user_id': user_id, 'email': email}
+            for user_id, email in db.session.query(User.id, User.email).filter(User.id.in_(user_ids)).all()
+        }
+
+        futures = {}
+        results = {}
+        for key, alerts in groups.items():
+            user_id, delivered = key
+            delivered = set(filter(None, delivered.split(',')))
+            recipient = recipients.get(user_id)
+            if recipient is None:
+                results[key] = (delivered, {'*': "사용자를 찾을 수 없습니다."})
+                continue
+            title, message = self.coalesce(alerts)
+            futures[key] = self.executor.submit(self._send, recipient, title, message, delivered)
+
+        for key, future in futures.items():
+            results[key] = future.result()
+
+        sent_ids, failed_ids = [], []
+        for key, (delivered, errors) in results.items():
+            alerts = groups[key]
+            if not errors:
+                sent_ids.extend(alert.id for alert in alerts)
+                continue
+            error = "; ".join(f"{name}: {message}" for name, message in errors.items())
+            logger.warning("알림 발송 실패 (사용자 %s): %s", key[0], error)
+            self._mark_failed(alerts, delivered, error)
+            failed_ids.extend(alert.id for alert in alerts)
+
+        self._mark_sent(sent_ids)
+        return {'sent': len(sent_ids), 'failed': len(failed_ids), 'messages': len(futures), 'failed_ids': failed_ids}
+
+    @staticmethod
+    def coalesce(alerts):
+        """
+        한 사용자의 여러 알림을 하나의 메시지로 합침
+
+        Args:
+            alerts (list): title, message 속성을 가진 알림 목록
+
+        Returns:
+            tuple: (제목, 본문)
+        """
+        if len(alerts) == 1:
+            return alerts[0].title, alerts[0].message
+
+        title = f"{alerts[0].title} 외 {len(alerts) - 1}건"
+        message = "\n\n".join(f"[{alert.title}]\n{alert.message}" for alert in alerts)
+        return title, message
+
+    def _send(self, recipient, title, message, delivered):
+        """
+        아직 성공하지 않은 채널로 발송
+
+        Returns:
+            tuple: (성공한 채널 이름 집합, {실패한 채널 이름: 오류})
+        """
+        delivered = set(delivered)
+        errors = {}
+        for channel in self.channels:
+            if channel.name in delivered:
+                continue
+            try:
+                channel.send(recipient, title, message)
+                delivered.add(channel.name)
+            except Exception as e:
+                errors[channel.name] = str(e)
+        return delivered, errors
+
+    def _mark_sent(self, ids):
+        if not ids:
+            return
+        try:
+            AlertOutbox.query.filter(AlertOutbox.id.in_(ids)).update({
+                'status': 'sent',
+                'sent_at': datetime.utcnow(),
+                'attempts': AlertOutbox.attempts + 1,
+            }, synchronize_session=False)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error("알림 발송 완료 처리 중 오류 발생: %s", e)
+
+    def _mark_failed(self, alerts, delivered, error):
+        """실패 기록 (성공한 채널 저장, 최대 시도 횟수 전이면 재시도 대기 후 pending)"""
+        try:
+            now = datetime.utcnow()
+            delivered = ','.join(sorted(delivered)) or None
+            updates = []
+            for alert in alerts:
+                attempts = (alert.attempts or 0) + 1
+                updates.append({
+                    'id': alert.id,
+                    'status': 'failed' if attempts >= self.max_attempts else 'pending',
+                    'attempts': attempts,
+                    'last_error': error[:1000],
+                    'delivered_channels': delivered,
+                    'next_attempt_at': now + timedelta(seconds=self.retry_backoff * 2 ** (attempts - 1)),
+                })
+            db.session.bulk_update_mappings(AlertOutbox, updates)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error("알림 발송 실패 처리 중 오류 발생: %s", e)
@@ -3,6 +3,9 @@ from datetime import datetime
 from models.user import db, User
 from models.trade import Trade
 from models.recommendation import Recommendation
+from models.alert_outbox import AlertOutbox
+from models.price_alert import PriceAlert
+from service.alert.price_alert_engine import PriceAlertEngine
 
 logger = logging.getLogger(__name__)
 
@@ -10,6 +13,7 @@ class AlertService:
     """
     알림 서비스 클래스
     - 가격 알림, 거래 알림, 추천 알림 등의 기능 제공
+    - 알림은 발송 대기열(AlertOutbox)에 추가만 하고, 발송은 AlertDispatcher가 일괄 처리
     """
     
     def __init__(self, user=None):
@@ -18,98 +22,196 @@ class AlertService:
     # 가격 알림 생성
     def create_price_alert(self, ticker, target_price, condition_type):
         """
-        가격 알림 생성
+        가격 알림 생성 (발동 검사는 스케줄러의 가격 알림 작업에서 처리)
         
         Args:
             ticker (str): 코인 티커
             target_price (float): 목표 가격
             condition_type (str): 조건 타입 ('above', 'below')
         """
-        # 여기서는 알림 생성에 관한 코드만 구현하고 실제 알림 발송은 스케줄러에서 처리
         try:
             if not self.user:
                 return {"error": "사용자 정보가 없습니다."}
             
-            # 가격 알림 생성 코드 구현
-            # (DB 테이블과 모델이 필요)
+            if condition_type not in ('above', 'below'):
+                return {"error": "조건 타입은 'above' 또는 'below'여야 합니다."}
             
-            return {"success": True, "message": "가격 알림이 생성되었습니다."}
+            target_price = float(target_price)
+            if target_price <= 0:
+                return {"error": "목표 가격은 0보다 커야 합니다."}
+            
+            price_alert = PriceAlert(
+                user_id=self.user.id,
+                ticker=ticker,
+                target_price=target_price,
+                condition_type=condition_type,
+                status='active'
+            )
+            db.session.add(price_alert)
+            db.session.commit()
+            
+            return {"success": True, "message": "가격 알림이 생성되었습니다.", "alert": price_alert.to_dict()}
         except Exception as e:
-            logger.error(f"가격 알림 생성 중 오류 발생: {e}")
+            db.session.rollback()
+            logger.error("가격 알림 생성 중 오류 발생: %s", e)
             return {"error": str(e)}
     
     # 가격 알림 조회
-    def get_price_alerts(self, user_id=None):
-        # 구현 필요
-        pass
-    
-    # 거래 알림 발송
-    def send_trade_alert(self, trade):
+    def get_price_alerts(self, user_id=None, status='active'):
+        """
+        가격 알림 조회
+        
+        Args:
+            user_id (int, optional): 사용자 ID (없으면 현재 사용자)
+            status (str, optional): 상태 필터 (None이면 전체)
+        """
         try:
-            if not trade or not trade.user_id:
-                return False
-            
-            user = User.query.get(trade.user_id)
-            if not user:
-                return False
+            if user_id is None and self.user:
+                user_id = self.user.id
+            if not user_id:
+                return []
             
-            # 이메일 또는 푸시 알림 발송 코드 구현
-            
-            return True
+            query = PriceAlert.query.filter_by(user_id=user_id)
+            if status:
+                query = query.filter_by(status=status)
+            return [alert.to_dict() for alert in query.order_by(PriceAlert.created_at.desc()).all()]
         except Exception as e:
-            logger.error(f"거래 알림 발송 중 오류 발생: {e}")
-            return False
-    # 추천 알림 발송
-    def send_recommendation_alert(self, recommendation):
+            logger.error("가격 알림 조회 중 오류 발생: %s", e)
+            return []
+    
+    # 가격 알림 취소
+    def cancel_price_alert(self, alert_id):
         try:
-            if not recommendation or not recommendation.user_id:
-                return False
-            
-            user = User.query.get(recommendation.user_id)
-            if not user:
-                return False
-            
-            # 이메일 또는 푸시 알림 발송 코드
-            message = f"{recommendation.ticker} 코인에 대한 새로운 추천이 있습니다.\n"
-            message += f"추천 유형: {recommendation.recommendation_type}\n"
-            message += f"현재 가격: {recommendation.price}\n"
-            message += f"추천 이유: {recommendation.reason}\n"
-            message += f"신뢰도: {recommendation.confidence * 100:.2f}%\n"
-            message += f"만료 시간: {recommendation.expiration.strftime('%Y-%m-%d %H:%M:%S')}"
-            
-            # 사용자 알림 설정에 따라 알림 방법 결정
-            if user.email_alerts_enabled:
-                self._send_email_alert(user.email, "코인 추천 알림", message)
-            
-            if user.push_alerts_enabled and user.device_token:
-                self._send_push_alert(user.device_token, "코인 추천 알림", message)
+            if not self.user:
+                return False, "사용자 정보가 없습니다."
             
-            # 알림 로그 기록
-            logger.info(f"사용자 {user.id}에게 {recommendation.ticker} 추천 알림 발송 완료")
-            return True
+            count = PriceAlert.query.filter_by(
+                id=alert_id, user_id=self.user.id, status='active'
+            ).update({'status': 'canceled'}, synchronize_session=False)
+            db.session.commit()
             
+            if not count:
+                return False, "취소할 수 있는 가격 알림이 없습니다."
+            PriceAlertEngine().remove(alert_id)
+            return True, "가격 알림이 취소되었습니다."
         except Exception as e:
-            logger.error(f"추천 알림 발송 중 오류 발생: {e}")
-            return False
+            db.session.rollback()
+            logger.error("가격 알림 취소 중 오류 발생: %s", e)
+            return False, str(e)
+    
+    # 알림 발송 요청 (outbox에 추가, 실제 발송은 AlertDispatcher가 처리)
+    def enqueue(self, user_id, category, title, message, commit=True):
+        """
+        알림을 발송 대기열에 추가
         
-    # 이메일 알림 발송 (내부 메서드) 
-    def _send_email_alert(self, email, subject, message):
+        Args:
+            user_id (int): 사용자 ID
+            category (str): 알림 종류 (trade, recommendation, price)
+            title (str): 제목
+            message (str): 본문
+            commit (bool): 즉시 커밋 여부 (False면 호출 측 트랜잭션에 포함)
+        """
         try:
-            # 이메일 발송 로직 구현
-            # (예: SMTP 서버를 통한 이메일 발송)
-            logger.info(f"이메일 알림 발송: {email}")
+            db.session.add(AlertOutbox(user_id=user_id, category=category, title=title, message=message))
+            if commit:
+                db.session.commit()
             return True
         except Exception as e:
-            logger.error(f"이메일 알림 발송 중 오류 발생: {e}")
+            if commit:
+                db.session.rollback()
+            logger.error("알림 등록 중 오류 발생: %s", e)
             return False
+    
+    def enqueue_many(self, alerts, commit=True):
+        """
+        여러 알림을 bulk insert 한 번으로 발송 대기열에 추가
         
-    # 푸시 알림 발송 (내부 메서드)
-    def _send_push_alert(self, device_token, title, message):
+        Args:
+            alerts (list): user_id, category, title, message 키를 가진 dict 목록
+            commit (bool): 즉시 커밋 여부
+        """
         try:
-            # 푸시 알림 발송 로직 구현
-            # (예: Firebase Cloud Messaging을 통한 푸시 알림)
-            logger.info(f"푸시 알림 발송: {device_token[:10]}...")
+            if alerts:
+                now = datetime.utcnow()
+                db.session.bulk_insert_mappings(AlertOutbox, [
+                    dict(alert, status='pending', attempts=0, created_at=now) for alert in alerts
+                ])
+            if commit:
+                db.session.commit()
             return True
         except Exception as e:
-            logger.error(f"푸시 알림 발송 중 오류 발생: {e}")
-            return False
\ No newline at end of file
+            if commit:
+                db.session.rollback()
+            logger.error("알림 일괄 등록 중 오류 발생: %s", e)
+            return False
+    
+    # 거래 알림 발송
+    def send_trade_alert(self, trade, commit=True):
+        if not trade or not trade.user_id:
+            return False
+        
+        alert = self.trade_alert(trade)
+        return self.enqueue(alert['user_id'], alert['category'], alert['title'], alert['message'], commit=commit)
+    
+    # 추천 알림 발송
+    def send_recommendation_alert(self, recommendation, commit=True):
+        if not recommendation or not recommendation.user_id:
+            return False
+        
+        alert = self.recommendation_alert(recommendation)
+        return self.enqueue(alert['user_id'], alert['category'], alert['title'], alert['message'], commit=commit)
+    
+    # ------ 알림 메시지 생성 ------
+    
+    @staticmethod
+    def trade_alert(trade):
+        """거래 알림 내용 생성"""
+        trade_name = "매수" if trade.trade_type == 'buy' else "매도"
+        message = f"{trade.ticker} {trade_name}가 체결되었습니다.\n"
+        message += f"가격: {trade.price}\n"
+        message += f"수량: {trade.amount}\n"
+        message += f"총액: {trade.total}"
+        return {
+            'user_id': trade.user_id,
+            'category': 'trade',
+            'title': f"{trade.ticker} {trade_name} 알림",
+            'message': message,
+        }
+    
+    @staticmethod
+    def price_alert(user_id, ticker, target_price, condition_type, price):
+        """가격 알림 내용 생성"""
+        condition_name = "이상" if condition_type == 'above' else "이하"
+        return {
+            'user_id': user_id,
+            'category': 'price',
+            'title': f"{ticker} 가격 알림",
+            'message': f"{ticker} 현재 가격 {price}원이 목표 가격 {target_price}원 {condition_name}에 도달했습니다.",
+        }
+    
+    @staticmethod
+    def recommendation_alert(recommendation):
+        """
+        추천 알림 내용 생성
+        
+        Args:
+            recommendation: Recommendation 객체 또는 같은 키를 가진 dict
+        """
+        if isinstance(recommendation, dict):
+            get = recommendation.get
+        else:
+            get = lambda name: getattr(recommendation, name, None)
+        
+        message = f"{get('ticker')} 코인에 대한 새로운 추천이 있습니다.\n"
+        message += f"추천 유형: {get('recommendation_type')}\n"
+        message += f"현재 가격: {get('price')}\n"
+        message += f"추천 이유: {get('reason')}\n"
+        message += f"신뢰도: {get('confidence') * 100:.2f}%"
+        if get('expiration'):
+            message += f"\n만료 시간: {get('expiration').strftime('%Y-%m-%d %H:%M:%S')}"
+        return {
+            'user_id': get('user_id'),
+            'category': 'recommendation',
+            'title': "코인 추천 알림",
+            'message': message,
+        }
@@ -0,0 +1,271 @@
+import bisect
+import logging
+import threading
+from datetime import datetime
+from models.user import db
+from models.price_alert import PriceAlert
+
+logger = logging.getLogger(__name__)
+
+ABOVE = 'above'
+BELOW = 'below'
+
+
+class _TickerIndex:
+    """
+    티커별 가격 알림 정렬 인덱스
+    - above(가격 >= 목표): 목표가를 음수로 저장한 오름차순 배열 → 발동 대상은 항상 배열의 뒷부분
+    - below(가격 <= 목표): 목표가 오름차순 배열 → 발동 대상은 항상 배열의 뒷부분
+    - 틱마다 bisect로 경계를 찾고 뒷부분을 잘라내므로 O(log n + k)
+    """
+
+    __slots__ = ('above_keys', 'above_ids', 'below_keys', 'below_ids')
+
+    def __init__(self):
+        self.above_keys = []
+        self.above_ids = []
+        self.below_keys = []
+        self.below_ids = []
+
+    def __len__(self):
+        return len(self.above_ids) + len(self.below_ids)
+
+    def add(self, alert_id, target_price, condition_type):
+        if condition_type == ABOVE:
+            keys, ids, key = self.above_keys, self.above_ids, -target_price
+        else:
+            keys, ids, key = self.below_keys, self.below_ids, target_price
+        index = bisect.bisect_right(keys, key)
+        keys.insert(index, key)
+        ids.insert(index, alert_id)
+
+    def extend(self, entries):
+        """
+        여러 알림 일괄 추가 (한 번 정렬)
+
+        Args:
+            entries (list): (alert_id, target_price, condition_type) 목록
+        """
+        above = [(-target, alert_id) for alert_id, target, condition in entries if condition == ABOVE]
+        below = [(target, alert_id) for alert_id, target, condition in entries if condition != ABOVE]
+        if above:
+            merged = sorted(list(zip(self.above_keys, self.above_ids)) + above)
+            self.above_keys = [key for key, _ in merged]
+            self.above_ids = [alert_id for _, alert_id in merged]
+        if below:
+            merged = sorted(list(zip(self.below_keys, self.below_ids)) + below)
+            self.below_keys = [key for key, _ in merged]
+            self.below_ids = [alert_id for _, alert_id in merged]
+
+    def pop_triggered(self, price):
+        """
+        현재가로 발동되는 알림을 인덱스에서 제거하고 반환
+
+        Args:
+            price (float): 현재가
+
+        Returns:
+            list: 발동된 알림 ID 목록
+        """
+        triggered = []
+
+        index = bisect.bisect_left(self.above_keys, -price)
+        if index < len(self.above_keys):
+            triggered.extend(self.above_ids[index:])
+            del self.above_keys[index:]
+            del self.above_ids[index:]
+
+        index = bisect.bisect_left(self.below_keys, price)
+        if index < len(self.below_keys):
+            triggered.extend(self.below_ids[index:])
+            del self.below_keys[index:]
+            del self.below_ids[index:]
+
+        return triggered
+
+
+class PriceAlertEngine:
+    """
+    실시간 가격 알림 엔진 (싱글톤)
+    - 활성 알림을 티커별 정렬 배열로 메모리에 유지하고 가격 틱마다 발동 알림을 찾음
+    - DB의 price_alerts 테이블이 원본이며, sync()로 새 알림을 증분 적재
+    - 발동 시 DB 상태를 조건부 UPDATE(active → triggered)로 변경하고 알림 outbox에 등록
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        """싱글톤 패턴 구현"""
+        if cls._instance is None:
+            cls._instance = super(PriceAlertEngine, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """가격 알림 엔진 초기화"""
+        if self._initialized:
+            return
+
+        self._indexes = {}
+        self._meta = {}          # alert_id → (user_id, ticker, target_price, condition_type)
+        self._canceled = set()   # 인덱스에서 지연 삭제할 알림 ID
+        self._last_id = 0
+        self._lock = threading.RLock()
+        self._initialized = True
+
+    def __len__(self):
+        return len(self._meta)
+
+    # ------ 인덱스 관리 ------
+
+    def add(self, alert_id, user_id, ticker, target_price, condition_type):
+        """알림 1건 추가"""
+        with self._lock:
+            self._meta[alert_id] = (user_id, ticker, float(target_price), condition_type)
+            self._indexes.setdefault(ticker, _TickerIndex()).add(alert_id, float(target_price), condition_type)
+            self._last_id = max(self._last_id, alert_id)
+
+    def add_many(self, alerts):
+        """
+        알림 일괄 추가
+
+        Args:
+            alerts (list): (alert_id, user_id, ticker, target_price, condition_type) 목록
+        """
+        by_ticker = {}
+        with self._lock:
+            for alert_id, user_id, ticker, target_price, condition_type in alerts:
+                self._meta[alert_id] = (user_id, ticker, float(target_price), condition_type)
+                by_ticker.setdefault(ticker, []).append((alert_id, float(target_price), condition_type))
+                self._last_id = max(self._last_id, alert_id)
+            for ticker, entries in by_ticker.items():
+                self._indexes.setdefault(ticker, _TickerIndex()).extend(entries)
+
+    def remove(self, alert_id):
+        """알림 제거 (인덱스에서는 발동 시점에 지연 삭제)"""
+        with self._lock:
+            if self._meta.pop(alert_id, None) is not None:
+                self._canceled.add(alert_id)
+
+    def clear(self):
+        """인덱스 초기화"""
+        with self._lock:
+            self._indexes.clear()
+            self._meta.clear()
+            self._canceled.clear()
+            self._last_id = 0
+
+    def tickers(self):
+        """활성 알림이 있는 티커 목록"""
+        with self._lock:
+            return [ticker for ticker, index in self._indexes.items() if len(index)]
+
+    def match(self, ticker, price):
+        """
+        가격 틱에 대해 발동된 알림을 인덱스에서 꺼내 반환
+
+        Args:
+            ticker (str): 코인 티커
+            price (float): 현재가
+
+        Returns:
+            list: (alert_id, user_id, ticker, target_price, condition_type) 목록
+        """
+        with self._lock:
+            index = self._indexes.get(ticker)
+            if index is None or price is None:
+                return []
+
+            triggered = []
+            for alert_id in index.pop_triggered(float(price)):
+                if alert_id in self._canceled:
+                    self._canceled.discard(alert_id)
+                    continue
+                meta = self._meta.pop(alert_id, None)
+                if meta is not None:
+                    triggered.append((alert_id,) + meta)
+            return triggered
+
+    # ------ DB 연동 (app context 필요) ------
+
+    def sync(self):
+        """
+        DB에서 마지막 적재 이후 생성된 활성 알림을 증분 적재
+
+        Returns:
+            int: 적재된 알림 수
+        """
+        try:
+            rows = db.session.query(
+                PriceAlert.id, PriceAlert.user_id, PriceAlert.ticker,
+                PriceAlert.target_price, PriceAlert.condition_type
+            ).filter(
+                PriceAlert.status == 'active',
+                PriceAlert.id > self._last_id
+            ).order_by(PriceAlert.id).all()
+            if rows:
+                self.add_many([tuple(row) for row in rows])
+                logger.info("가격 알림 %s건 적재 (총 %s건)", len(rows), len(self))
+            return len(rows)
+        except Exception as e:
+            logger.error("가격 알림 적재 중 오류 발생: %s", e)
+            return 0
+
+    def process_prices(self, prices):
+        """
+        가격 틱 처리: 발동 알림을 DB에 반영하고 알림 outbox에 등록
+
+        Args:
+            prices (dict): 티커별 현재가
+
+        Returns:
+            list: 발동된 알림 ID 목록
+        """
+        from service.alert.alert_service import AlertService
+
+        candidates = {}
+        for ticker, price in prices.items():
+            for alert_id, user_id, alert_ticker, target_price, condition_type in self.match(ticker, price):
+                candidates[alert_id] = (user_id, alert_ticker, target_price, condition_type, price)
+        if not candidates:
+            return []
+
+        try:
+            # 다른 프로세스에서 취소/발동된 알림 제외
+            active_ids = [row.id for row in db.session.query(PriceAlert.id).filter(
+                PriceAlert.id.in_(list(candidates)),
+                PriceAlert.status == 'active'
+            ).all()]
+            if not active_ids:
+                return []
+
+            # 같은 티커의 알림은 같은 가격으로 발동되므로 티커별 UPDATE 한 번
+            by_price = {}
+            for alert_id in active_ids:
+                by_price.setdefault(candidates[alert_id][4], []).append(alert_id)
+
+            now = datetime.utcnow()
+            for price, ids in by_price.items():
+                PriceAlert.query.filter(
+                    PriceAlert.id.in_(ids),
+                    PriceAlert.status == 'active'
+                ).update({
+                    'status': 'triggered',
+                    'triggered_at': now,
+                    'triggered_price': price,
+                }, synchronize_session=False)
+
+            AlertService().enqueue_many(
+                [AlertService.price_alert(*candidates[alert_id]) for alert_id in active_ids],
+                commit=False
+            )
+            db.session.commit()
+
+            logger.info("가격 알림 %s건 발동", len(active_ids))
+            return active_ids
+        except Exception as e:
+            db.session.rollback()
+            logger.error("가격 알림 처리 중 오류 발생: %s", e)
+            # 처리하지 못한 알림은 다음 틱에서 다시 검사
+            self.add_many([(alert_id,) + candidate[:4] for alert_id, candidate in candidates.items()])
+            return []
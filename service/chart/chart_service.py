@@ -0,0 +1,205 @@
+import logging
+from service.upbit.upbit_service import UpbitService
+from utils.manager_cache.manager_cache import CacheManager
+
+logger = logging.getLogger(__name__)
+
+COLUMNS = ('time', 'open', 'high', 'low', 'close', 'volume')
+DOWNSAMPLE_METHODS = ('lttb', 'minmax', 'none')
+
+
+def lttb_indices(x, y, threshold):
+    """
+    LTTB(Largest-Triangle-Three-Buckets) 다운샘플링으로 남길 인덱스 선택
+    - 첫/마지막 점은 항상 유지하고, 나머지 버킷마다 이전 선택점·다음 버킷 평균점과
+      이루는 삼각형 넓이가 가장 큰 점을 선택 → 선 모양(추세, 급등락)이 보존됨
+
+    Args:
+        x (np.ndarray): x 좌표 (시간)
+        y (np.ndarray): y 좌표 (가격)
+        threshold (int): 결과 점 개수
+
+    Returns:
+        np.ndarray: 선택된 인덱스 (오름차순)
+    """
+    import numpy as np
+
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = x.astype(np.float64)
+    y = y.astype(np.float64)
+    # 첫/마지막 점을 제외한 구간을 threshold - 2개 버킷으로 분할
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    selected = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        # 다음 버킷 평균점 (마지막 버킷은 마지막 점)
+        next_start, next_end = end, edges[bucket + 2] if bucket + 2 < len(edges) else n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        ax, ay = x[selected], y[selected]
+        areas = np.abs((ax - avg_x) * (y[start:end] - ay) - (ax - x[start:end]) * (avg_y - ay))
+        selected = start + int(np.argmax(areas))
+        indices[bucket + 1] = selected
+    return indices
+
+
+def minmax_aggregate(columns, buckets):
+    """
+    버킷 단위 OHLCV 집계 (min/max 다운샘플링)
+    - 각 버킷을 하나의 캔들로 합침: 시가=첫 시가, 고가=최댓값, 저가=최솟값, 종가=마지막 종가, 거래량=합계
+    - 고가/저가의 극값이 그대로 보존되어 캔들 차트에 적합
+
+    Args:
+        columns (dict): 컬럼별 np.ndarray (COLUMNS)
+        buckets (int): 결과 캔들 수
+
+    Returns:
+        dict: 집계된 컬럼별 np.ndarray
+    """
+    import numpy as np
+
+    n = len(columns['close'])
+    if buckets >= n or buckets < 1:
+        return columns
+
+    starts = np.linspace(0, n, buckets, endpoint=False).astype(np.int64)
+    ends = np.append(starts[1:], n) - 1
+    return {
+        'time': columns['time'][starts],
+        'open': columns['open'][starts],
+        'high': np.maximum.reduceat(columns['high'], starts),
+        'low': np.minimum.reduceat(columns['low'], starts),
+        'close': columns['close'][ends],
+        'volume': np.add.reduceat(columns['volume'], starts),
+    }
+
+
+class ChartService:
+    """
+    차트 데이터 서비스 (numpy는 첫 조회 시 로드)
+    - 캔들을 컬럼 배열(time, open, high, low, close, volume)로 제공 (레코드 배열 대비 JSON 크기 감소)
+    - 요청 픽셀 폭에 맞춰 LTTB 또는 min/max 다운샘플링
+    - 원본 캔들은 (티커, 인터벌, 범위) 단위로 캐시하고 다운샘플링만 요청마다 수행
+    """
+
+    CACHE_NAME = 'chart'
+
+    def __init__(self, upbit_service=None, cache_ttl=30, max_count=5000):
+        """
+        Args:
+            upbit_service (UpbitService, optional): 시세 조회 서비스
+            cache_ttl (float): 캔들 캐시 시간 (초)
+            max_count (int): 요청 가능한 최대 캔들 수
+        """
+        self.upbit_service = upbit_service or UpbitService()
+        self.cache = CacheManager().get_cache(self.CACHE_NAME, ttl=cache_ttl, maxsize=256)
+        self.cache_ttl = cache_ttl
+        self.max_count = max_count
+
+    def get_ohlcv_data(self, ticker, interval='day', count=30, to=None):
+        """
+        OHLCV 데이터 조회 (DataFrame, 기존 호출 호환용)
+
+        Returns:
+            pandas.DataFrame: OHLCV 데이터 또는 None
+        """
+        return self.upbit_service.get_ohlcv(ticker, interval=interval, count=min(count, self.max_count), to=to)
+
+    def get_columns(self, ticker, interval='day', count=200, to=None):
+        """
+        캔들 컬럼 배열 조회 (캐시)
+
+        Args:
+            ticker (str): 코인 티커
+            interval (str): 캔들 간격 (day, minute1, ...)
+            count (int): 캔들 수
+            to (str, optional): 마지막 캔들 시각
+
+        Returns:
+            dict: 컬럼별 np.ndarray (time은 epoch 밀리초) 또는 None
+        """
+        count = max(1, min(int(count), self.max_count))
+        return self.cache.get_or_load(
+            (ticker, interval, count, to),
+            lambda: self._load_columns(ticker, interval, count, to),
+            ttl=self.cache_ttl,
+            cache_if=lambda value: value is not None
+        )
+
+    def _load_columns(self, ticker, interval, count, to):
+        # 응답을 구조화 배열로 바로 디코딩 (DataFrame 생성/변환 없음, 컬럼은 배열의 뷰)
+        candles = self.upbit_service.get_candles(ticker, interval=interval, count=count, to=to)
+        if candles is None or len(candles) == 0:
+            return None
+        return {name: candles[name] for name in COLUMNS}
+
+    def get_chart(self, ticker, interval='day', count=200, to=None, width=None, method='lttb'):
+        """
+        차트 데이터 조회 및 다운샘플링
+
+        Args:
+            ticker (str): 코인 티커
+            interval (str): 캔들 간격
+            count (int): 캔들 수
+            to (str, optional): 마지막 캔들 시각
+            width (int, optional): 차트 픽셀 폭 (결과 점 개수 상한, None이면 다운샘플링 안 함)
+            method (str): lttb (선 차트) / minmax (캔들 차트) / none
+
+        Returns:
+            dict: 컬럼별 np.ndarray와 메타 정보 또는 {"error": ...}
+        """
+        if method not in DOWNSAMPLE_METHODS:
+            return {"error": f"지원하지 않는 다운샘플링 방식입니다: {method}"}
+
+        columns = self.get_columns(ticker, interval, count, to)
+        if columns is None:
+            return {"error": "데이터를 불러올 수 없습니다."}
+
+        total = len(columns['time'])
+        if width and method != 'none' and width < total:
+            if method == 'lttb':
+                indices = lttb_indices(columns['time'], columns['close'], width)
+                columns = {name: values[indices] for name, values in columns.items()}
+            else:
+                columns = minmax_aggregate(columns, width)
+
+        return {
+            'ticker': ticker,
+            'interval': interval,
+            'method': method if len(columns['time']) < total else 'none',
+            'total': total,
+            'length': len(columns['time']),
+            'columns': columns,
+        }
+
+    @staticmethod
+    def to_json(chart):
+        """컬럼 배열을 JSON 직렬화 가능한 리스트로 변환"""
+        result = {key: value for key, value in chart.items() if key != 'columns'}
+        for name, values in chart['columns'].items():
+            result[name] = values.tolist()
+        return result
+
+    @staticmethod
+    def to_binary(chart):
+        """
+        컴팩트 바이너리 인코딩 (리틀 엔디언)
+        - time: int64 × length, 이어서 open/high/low/close/volume: float32 × length
+        - JSON 대비 약 1/4 크기이며, 클라이언트는 length로 각 컬럼을 TypedArray로 바로 읽을 수 있음
+
+        Returns:
+            bytes: 인코딩된 본문
+        """
+        columns = chart['columns']
+        parts = [columns['time'].astype('<i8').tobytes()]
+        for name in COLUMNS[1:]:
+            parts.append(columns[name].astype('<f4').tobytes())
+        return b''.join(parts)
@@ -0,0 +1,168 @@
+import hashlib
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from flask import current_app
+from models.user import db, User
+from models.trade import Trade
+from models.recommendation import Recommendation
+from service.upbit.upbit_service import UpbitService
+from utils.manager_cache.manager_cache import CacheManager
+from utils.manager_encryption.manager_encryption import EncryptionManager
+
+logger = logging.getLogger(__name__)
+
+# 거래소 잔고 캐시 이름 (거래 실행 시 TradingService에서 무효화)
+BALANCE_CACHE = 'balance'
+
+
+def invalidate_balance(user_id):
+    """사용자 잔고 캐시 무효화"""
+    CacheManager().get_cache(BALANCE_CACHE).invalidate(user_id)
+
+
+def compute_etag(data):
+    """
+    응답 데이터의 ETag 계산
+
+    Args:
+        data: JSON 직렬화 가능한 데이터
+
+    Returns:
+        str: sha1 해시
+    """
+    payload = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class DashboardService:
+    """
+    대시보드 데이터 조립 서비스
+    - 잔고(거래소 API), 최근 거래, 대기 추천을 스레드 풀에서 동시에 조회
+      → 응답 시간이 각 조회 시간의 합이 아니라 가장 느린 조회 시간으로 제한됨
+    - 거래소 잔고는 사용자별 짧은 TTL 캐시 사용
+    - 각 파트에 ETag를 붙여 변경된 파트만 다시 받을 수 있도록 함
+    """
+
+    PARTS = ('balance', 'trades', 'recommendations')
+
+    _executor = None
+    _executor_lock = threading.Lock()
+
+    def __init__(self, user_id, trade_limit=10, recommendation_limit=5):
+        """
+        Args:
+            user_id (int): 사용자 ID (ORM 객체는 요청 세션에 묶여 있으므로 ID만 전달)
+            trade_limit (int): 최근 거래 조회 수
+            recommendation_limit (int): 대기 추천 조회 수
+        """
+        self.user_id = user_id
+        self.trade_limit = trade_limit
+        self.recommendation_limit = recommendation_limit
+
+    @classmethod
+    def _get_executor(cls, max_workers):
+        if cls._executor is None:
+            with cls._executor_lock:
+                if cls._executor is None:
+                    cls._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='dashboard')
+        return cls._executor
+
+    def assemble(self, parts=None):
+        """
+        대시보드 파트 동시 조회 (app context 안에서 호출)
+
+        Args:
+            parts (list, optional): 조회할 파트 목록 (None이면 전체)
+
+        Returns:
+            dict: 파트별 {'etag': ..., 'data': ...} 또는 {'etag': ..., 'error': ...}
+        """
+        parts = [part for part in (parts or self.PARTS) if part in self.PARTS]
+        app = current_app._get_current_object()
+        executor = self._get_executor(app.config.get('DASHBOARD_WORKERS', 8))
+
+        futures = {part: executor.submit(self._run_part, app, part) for part in parts}
+
+        result = {}
+        for part, future in futures.items():
+            try:
+                data = future.result()
+                if isinstance(data, dict) and 'error' in data:
+                    result[part] = {'etag': compute_etag(data), 'error': data['error']}
+                else:
+                    result[part] = {'etag': compute_etag(data), 'data': data}
+            except Exception as e:
+                logger.error("대시보드 %s 조회 중 오류 발생: %s", part, e)
+                result[part] = {'etag': None, 'error': str(e)}
+        return result
+
+    def _run_part(self, app, part):
+        # 작업 스레드마다 별도 app context (세션은 스레드별로 분리되고 종료 시 정리됨)
+        with app.app_context():
+            return getattr(self, f'get_{part}')()
+
+    # ------ 파트별 조회 ------
+
+    def get_balance(self):
+        """거래소 잔고 조회 (사용자별 TTL 캐시)"""
+        ttl = current_app.config.get('DASHBOARD_BALANCE_TTL', 10)
+        cache = CacheManager().get_cache(BALANCE_CACHE, ttl=ttl)
+        return cache.get_or_load(
+            self.user_id,
+            self._load_balance,
+            ttl=ttl,
+            cache_if=lambda value: not (isinstance(value, dict) and 'error' in value)
+        )
+
+    def _load_balance(self):
+        keys = db.session.query(User.upbit_access_key, User.upbit_secret_key).filter(User.id == self.user_id).first()
+        if keys is None or not keys.upbit_access_key or not keys.upbit_secret_key:
+            return {"error": "API 키가 설정되지 않았습니다."}
+
+        encryption_manager = EncryptionManager()
+        access_key = encryption_manager.decrypt(keys.upbit_access_key)
+        secret_key = encryption_manager.decrypt(keys.upbit_secret_key)
+        if not access_key or not secret_key:
+            return {"error": "API 키를 복호화할 수 없습니다."}
+
+        return UpbitService(access_key, secret_key).get_balance()
+
+    def get_trades(self):
+        """최근 거래 내역 조회"""
+        trades = Trade.query.filter_by(user_id=self.user_id).order_by(
+            Trade.timestamp.desc()
+        ).limit(self.trade_limit).all()
+        return [{
+            "id": trade.id,
+            "ticker": trade.ticker,
+            "trade_type": trade.trade_type,
+            "price": trade.price,
+            "amount": trade.amount,
+            "total": trade.total,
+            "fee": trade.fee,
+            "status": trade.status,
+            "timestamp": trade.timestamp.isoformat() if trade.timestamp else None
+        } for trade in trades]
+
+    def get_recommendations(self):
+        """유효한 대기 추천 조회 (만료 처리 작업 전이라도 만료된 추천은 제외)"""
+        now = datetime.utcnow()
+        recommendations = Recommendation.query.filter(
+            Recommendation.user_id == self.user_id,
+            Recommendation.status == 'pending',
+            db.or_(Recommendation.expiration.is_(None), Recommendation.expiration > now)
+        ).order_by(Recommendation.timestamp.desc()).limit(self.recommendation_limit).all()
+        return [{
+            "id": recommendation.id,
+            "ticker": recommendation.ticker,
+            "recommendation_type": recommendation.recommendation_type,
+            "price": recommendation.price,
+            "confidence": recommendation.confidence,
+            "strategy": recommendation.strategy,
+            "reason": recommendation.reason,
+            "timestamp": recommendation.timestamp.isoformat() if recommendation.timestamp else None,
+            "expiration": recommendation.expiration.isoformat() if recommendation.expiration else None
+        } for recommendation in recommendations]
@@ -0,0 +1,311 @@
+import logging
+from contextlib import closing
+from datetime import datetime, timezone
+from models.user import db, User
+from models.history import HistoryRecord, HistorySyncState
+from utils.manager_encryption.manager_encryption import EncryptionManager
+from utils.upbit_api.utils.pagination import PageFetchError
+
+logger = logging.getLogger(__name__)
+
+# 내역 종류 → 거래소 순회 함수 (UpbitAPI 인스턴스와 인증 키를 받아 최신순 레코드 제너레이터 반환)
+STREAMS = {
+    'deposit': lambda api, credentials=None: api.deposits.iter_deposits(credentials=credentials),
+    'withdraw': lambda api, credentials=None: api.withdrawals.iter_withdraws(credentials=credentials),
+    'order': lambda api, credentials=None: api.orders.iter_closed_orders(credentials=credentials),
+}
+
+# 이후 상태가 바뀌지 않는 상태 (그 외 상태의 레코드는 다음 동기화에서 다시 조회하여 갱신)
+FINAL_STATES = {
+    'deposit': {'accepted', 'rejected', 'canceled', 'cancelled', 'refunded', 'done'},
+    'withdraw': {'done', 'failed', 'rejected', 'canceled', 'cancelled'},
+    'order': {'done', 'cancel'},
+}
+
+def parse_exchange_time(value):
+    """
+    거래소 시간 문자열(ISO 8601, 시간대 포함)을 UTC naive datetime으로 변환
+
+    Returns:
+        datetime: UTC 시간 (값이 없거나 형식이 잘못된 경우 None)
+    """
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _float(value):
+    try:
+        return float(value) if value is not None else 0.0
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def normalize_record(stream, record):
+    """
+    거래소 응답 레코드를 history_records 행(dict)으로 변환
+
+    Args:
+        stream (str): 내역 종류 (deposit, withdraw, order)
+        record (dict): 거래소 응답 레코드
+
+    Returns:
+        dict: HistoryRecord 컬럼 값 (생성 시간을 알 수 없으면 None)
+    """
+    created_at = parse_exchange_time(record.get('created_at'))
+    if not record.get('uuid') or created_at is None:
+        return None
+
+    row = {
+        'stream': stream,
+        'uuid': record['uuid'],
+        'state': (record.get('state') or '').lower(),
+        'created_at': created_at,
+        'done_at': parse_exchange_time(record.get('done_at')),
+        'raw': record,
+    }
+    if stream == 'order':
+        market = record.get('market') or ''
+        row.update({
+            'currency': market.split('-')[-1],
+            'market': market,
+            'side': record.get('side'),
+            'amount': _float(record.get('executed_volume')),
+            'price': _float(record.get('price')) if record.get('price') is not None else None,
+            'fee': _float(record.get('paid_fee')),
+            'txid': None,
+        })
+    else:
+        row.update({
+            'currency': record.get('currency') or '',
+            'market': None,
+            'side': record.get('transaction_type') or record.get('type'),
+            'amount': _float(record.get('amount')),
+            'price': None,
+            'fee': _float(record.get('fee')),
+            'txid': record.get('txid'),
+        })
+    return row
+
+
+class HistoryService:
+    """
+    거래소 계정 내역 로컬 사본 서비스
+    - 입금/출금/종료된 주문을 내역 종류별로 증분 동기화 (최신순으로 받다가 마지막 동기화 위치에 도달하면 중단)
+    - 아직 진행 중인 입출금은 완료될 때까지 다음 동기화에서 다시 받아 상태 갱신
+    - 페이지 단위 bulk upsert, 조회는 (사용자, 화폐/상태/종류, 시간) 인덱스 사용
+    """
+
+    def __init__(self, user_id, api=None, batch_size=100):
+        """
+        Args:
+            user_id (int): 사용자 ID
+            api (UpbitAPI, optional): 인증 키가 설정된 업비트 API (None이면 사용자 키로 UpbitAPI 사용)
+            batch_size (int): upsert 단위
+        """
+        self.user_id = user_id
+        self.api = api
+        self.batch_size = batch_size
+
+    # ------ 동기화 ------
+
+    def sync(self, streams=None):
+        """
+        거래소 내역 증분 동기화
+
+        Args:
+            streams (list, optional): 동기화할 내역 종류 (None이면 전체)
+
+        Returns:
+            dict: 내역 종류별 저장 건수 또는 {"error": ...}
+        """
+        streams = list(streams or STREAMS)
+        unknown = [stream for stream in streams if stream not in STREAMS]
+        if unknown:
+            return {"error": f"지원하지 않는 내역 종류입니다: {', '.join(unknown)}"}
+
+        if self.api is not None:
+            return self._sync_streams(self.api, streams)
+
+        keys = db.session.query(User.upbit_access_key, User.upbit_secret_key).filter(User.id == self.user_id).first()
+        if keys is None or not keys.upbit_access_key or not keys.upbit_secret_key:
+            return {"error": "API 키가 설정되지 않았습니다."}
+
+        encryption_manager = EncryptionManager()
+        access_key = encryption_manager.decrypt(keys.upbit_access_key)
+        secret_key = encryption_manager.decrypt(keys.upbit_secret_key)
+        if not access_key or not secret_key:
+            return {"error": "API 키를 복호화할 수 없습니다."}
+
+        from utils.upbit_api.upbit_api import UpbitAPI
+
+        # 싱글톤의 키를 바꾸지 않고 페이지 조회마다 사용자 키로 서명
+        return self._sync_streams(UpbitAPI(), streams, credentials=(access_key, secret_key))
+
+    def _sync_streams(self, api, streams, credentials=None):
+        result = {}
+        for stream in streams:
+            try:
+                result[stream] = self.sync_stream(api, stream, credentials)
+            except PageFetchError as e:
+                db.session.rollback()
+                logger.error("내역 동기화 실패 (사용자 %s, %s): %s", self.user_id, stream, e)
+                result[stream] = {"error": str(e.error)}
+            except Exception as e:
+                db.session.rollback()
+                logger.error("내역 동기화 중 오류 발생 (사용자 %s, %s): %s", self.user_id, stream, e)
+                result[stream] = {"error": str(e)}
+        return result
+
+    def sync_stream(self, api, stream, credentials=None):
+        """
+        내역 종류 하나 동기화
+
+        Args:
+            api (UpbitAPI): 업비트 API
+            stream (str): 내역 종류
+            credentials (tuple, optional): (access_key, secret_key) - 지정하지 않으면 api의 키
+
+        Returns:
+            int: 저장(추가/갱신)한 레코드 수
+        """
+        state = HistorySyncState.query.filter_by(user_id=self.user_id, stream=stream).first()
+        if state is None:
+            state = HistorySyncState(user_id=self.user_id, stream=stream)
+            db.session.add(state)
+
+        # 진행 중인 레코드가 있으면 그 시점까지 다시 받아 상태 갱신
+        watermark = state.last_created_at
+        oldest_open = db.session.query(db.func.min(HistoryRecord.created_at)).filter(
+            HistoryRecord.user_id == self.user_id,
+            HistoryRecord.stream == stream,
+            HistoryRecord.state.notin_(FINAL_STATES[stream])
+        ).scalar()
+        if oldest_open is not None and (watermark is None or oldest_open < watermark):
+            watermark = oldest_open
+        stop_uuid = state.last_uuid if oldest_open is None else None
+
+        newest = None
+        batch = []
+        count = 0
+        with closing(STREAMS[stream](api, credentials)) as records:
+            for record in records:
+                row = normalize_record(stream, record)
+                if row is None:
+                    continue
+                if row['uuid'] == stop_uuid or (watermark is not None and row['created_at'] < watermark):
+                    break
+                if newest is None or row['created_at'] > newest['created_at']:
+                    newest = row
+                batch.append(row)
+                if len(batch) >= self.batch_size:
+                    count += self._upsert(batch)
+                    batch = []
+        count += self._upsert(batch)
+
+        if newest is not None and (state.last_created_at is None or newest['created_at'] >= state.last_created_at):
+            state.last_uuid = newest['uuid']
+            state.last_created_at = newest['created_at']
+        state.synced_at = datetime.utcnow()
+        db.session.commit()
+        logger.info("내역 동기화 완료 (사용자 %s, %s): %s건", self.user_id, stream, count)
+        return count
+
+    def _upsert(self, rows):
+        """
+        레코드 bulk upsert (이미 있는 uuid는 갱신, 없으면 추가)
+
+        Returns:
+            int: 처리한 레코드 수
+        """
+        if not rows:
+            return 0
+        stream = rows[0]['stream']
+        rows = list({row['uuid']: row for row in rows}.values())
+        existing = dict(db.session.query(HistoryRecord.uuid, HistoryRecord.id).filter(
+            HistoryRecord.user_id == self.user_id,
+            HistoryRecord.stream == stream,
+            HistoryRecord.uuid.in_([row['uuid'] for row in rows])
+        ).all())
+
+        now = datetime.utcnow()
+        inserts, updates = [], []
+        for row in rows:
+            row = dict(row, user_id=self.user_id, synced_at=now)
+            if row['uuid'] in existing:
+                updates.append(dict(row, id=existing[row['uuid']]))
+            else:
+                inserts.append(row)
+        if inserts:
+            db.session.bulk_insert_mappings(HistoryRecord, inserts)
+        if updates:
+            db.session.bulk_update_mappings(HistoryRecord, updates)
+        db.session.flush()
+        return len(rows)
+
+    # ------ 조회 ------
+
+    def query(self, stream=None, currency=None, state=None, start=None, end=None, limit=100, offset=0):
+        """
+        로컬 내역 조회 (최신순)
+
+        Args:
+            stream (str, optional): 내역 종류 (deposit, withdraw, order)
+            currency (str, optional): 화폐 코드 (예: BTC, KRW)
+            state (str, optional): 상태
+            start (datetime, optional): 조회 시작 시간 (UTC, 포함)
+            end (datetime, optional): 조회 종료 시간 (UTC, 미포함)
+            limit (int): 최대 조회 수
+            offset (int): 건너뛸 수
+
+        Returns:
+            list: 내역 dict 목록
+        """
+        query = HistoryRecord.query.filter(HistoryRecord.user_id == self.user_id)
+        if stream:
+            query = query.filter(HistoryRecord.stream == stream)
+        if currency:
+            query = query.filter(HistoryRecord.currency == currency.upper())
+        if state:
+            query = query.filter(HistoryRecord.state == state.lower())
+        if start:
+            query = query.filter(HistoryRecord.created_at >= start)
+        if end:
+            query = query.filter(HistoryRecord.created_at < end)
+
+        records = query.order_by(HistoryRecord.created_at.desc(), HistoryRecord.id.desc()).offset(offset).limit(limit).all()
+        return [self.to_dict(record) for record in records]
+
+    def sync_status(self):
+        """내역 종류별 마지막 동기화 정보"""
+        states = HistorySyncState.query.filter_by(user_id=self.user_id).all()
+        return {
+            state.stream: {
+                "last_uuid": state.last_uuid,
+                "last_created_at": state.last_created_at.isoformat() if state.last_created_at else None,
+                "synced_at": state.synced_at.isoformat() if state.synced_at else None
+            } for state in states
+        }
+
+    @staticmethod
+    def to_dict(record):
+        return {
+            "stream": record.stream,
+            "uuid": record.uuid,
+            "currency": record.currency,
+            "market": record.market,
+            "side": record.side,
+            "state": record.state,
+            "amount": record.amount,
+            "price": record.price,
+            "fee": record.fee,
+            "txid": record.txid,
+            "created_at": record.created_at.isoformat() if record.created_at else None,
+            "done_at": record.done_at.isoformat() if record.done_at else None
+        }
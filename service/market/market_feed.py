@@ -0,0 +1,265 @@
+import logging
+import threading
+import time
+from service.upbit.upbit_service import UpbitService
+from utils.manager_metrics.manager_metrics import MARKET_FEED_CLIENTS, MARKET_FEED_UPDATES
+
+logger = logging.getLogger(__name__)
+
+
+class FeedCapacityError(ValueError):
+    """구독 수가 최대치에 도달한 경우"""
+
+
+class Subscription:
+    """
+    시세 스트림 구독 (클라이언트 1개)
+    - 아직 전달되지 않은 업데이트는 마켓별 최신 가격 하나만 보관 (느린 클라이언트도 메모리가 마켓 수 이상 늘지 않음)
+    - 전달 간격은 min_interval 이상으로 제한하고, 그 사이에 들어온 업데이트는 합쳐서 전달
+    """
+
+    def __init__(self, feed, markets, min_interval):
+        self.feed = feed
+        self.markets = frozenset(markets)
+        self.min_interval = min_interval
+        self.closed = False
+        self._pending = {}
+        self._last_sent = 0.0
+        self._cond = threading.Condition()
+
+    def offer(self, market, price):
+        """업데이트 추가 (전달 전 같은 마켓 업데이트는 덮어씀)"""
+        with self._cond:
+            if market in self._pending:
+                MARKET_FEED_UPDATES.labels('coalesced').inc()
+            self._pending[market] = price
+            self._cond.notify()
+
+    def next(self, timeout=15.0):
+        """
+        다음 업데이트 묶음 대기
+
+        Args:
+            timeout (float): 최대 대기 시간 (초)
+
+        Returns:
+            dict: 마켓별 가격 (timeout 또는 구독 종료 시 None)
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while not self._pending and not self.closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self._cond.wait(remaining)
+
+            # 최대 전달 빈도 제한 (대기 중 들어온 업데이트는 _pending에 합쳐짐)
+            wait = self._last_sent + self.min_interval - time.monotonic()
+            while wait > 0 and not self.closed:
+                self._cond.wait(wait)
+                wait = self._last_sent + self.min_interval - time.monotonic()
+
+            if self.closed:
+                return None
+
+            updates, self._pending = self._pending, {}
+            self._last_sent = time.monotonic()
+        MARKET_FEED_UPDATES.labels('sent').inc(len(updates))
+        return updates
+
+    def close(self):
+        """구독 해제"""
+        with self._cond:
+            if self.closed:
+                return
+            self.closed = True
+            self._cond.notify_all()
+        self.feed.unsubscribe(self)
+
+
+class MarketFeed:
+    """
+    실시간 시세 피드 (싱글톤)
+    - 구독 중인 모든 클라이언트의 마켓을 합쳐 업비트 시세를 한 번에 조회하는 단일 폴러
+      → 연결된 대시보드 수와 무관하게 업스트림 요청은 주기당 1회
+    - 가격이 바뀐 마켓만 해당 마켓을 구독한 클라이언트에게 전달
+    - 구독자가 없으면 폴러 스레드는 종료되고, 다음 구독 시 다시 시작
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        """싱글톤 패턴 구현"""
+        if cls._instance is None:
+            cls._instance = super(MarketFeed, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """시세 피드 초기화"""
+        if self._initialized:
+            return
+
+        self.interval = 1.0
+        self.max_clients = 500
+        self.max_markets = 50
+        self.upbit_service = None
+        self._subscriptions = set()
+        self._by_market = {}     # 마켓 → 구독 집합
+        self._prices = {}        # 마켓 → (가격, 갱신 시각)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._initialized = True
+
+    def configure(self, interval=None, max_clients=None, max_markets=None, upbit_service=None):
+        """
+        피드 설정
+
+        Args:
+            interval (float, optional): 업스트림 조회 주기 (초)
+            max_clients (int, optional): 최대 구독 수
+            max_markets (int, optional): 구독 1개당 최대 마켓 수
+            upbit_service (UpbitService, optional): 시세 조회 서비스
+        """
+        if interval is not None:
+            self.interval = interval
+        if max_clients is not None:
+            self.max_clients = max_clients
+        if max_markets is not None:
+            self.max_markets = max_markets
+        if upbit_service is not None:
+            self.upbit_service = upbit_service
+        return self
+
+    def configure_from_config(self, config):
+        """app.config 값으로 설정"""
+        return self.configure(
+            interval=config.get('MARKET_FEED_INTERVAL', 1.0),
+            max_clients=config.get('MARKET_FEED_MAX_CLIENTS', 500),
+            max_markets=config.get('MARKET_FEED_MAX_MARKETS', 50)
+        )
+
+    # ------ 구독 관리 ------
+
+    def subscribe(self, markets, min_interval=1.0):
+        """
+        마켓 시세 구독
+
+        Args:
+            markets (list): 마켓 코드 목록
+            min_interval (float): 클라이언트로의 최소 전달 간격 (초)
+
+        Returns:
+            Subscription: 구독 객체 (사용 후 close() 호출)
+
+        Raises:
+            ValueError: 구독할 마켓이 없거나 마켓 수 제한 초과
+            FeedCapacityError: 구독 수 제한 초과
+        """
+        markets = [market for market in dict.fromkeys(markets) if market]
+        if not markets:
+            raise ValueError("구독할 마켓이 없습니다.")
+        if len(markets) > self.max_markets:
+            raise ValueError(f"한 번에 구독할 수 있는 마켓은 최대 {self.max_markets}개입니다.")
+
+        subscription = Subscription(self, markets, max(min_interval, 0.0))
+        with self._lock:
+            if len(self._subscriptions) >= self.max_clients:
+                raise FeedCapacityError("시세 스트림 구독 수가 최대치에 도달했습니다.")
+            self._subscriptions.add(subscription)
+            for market in markets:
+                self._by_market.setdefault(market, set()).add(subscription)
+            # 이미 알고 있는 가격은 첫 업데이트로 바로 전달
+            for market in markets:
+                if market in self._prices:
+                    subscription.offer(market, self._prices[market][0])
+            self._ensure_running()
+            MARKET_FEED_CLIENTS.set(len(self._subscriptions))
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """구독 해제 (Subscription.close()에서 호출)"""
+        with self._lock:
+            if subscription not in self._subscriptions:
+                return
+            self._subscriptions.discard(subscription)
+            for market in subscription.markets:
+                subscribers = self._by_market.get(market)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._by_market[market]
+            MARKET_FEED_CLIENTS.set(len(self._subscriptions))
+
+    def markets(self):
+        """구독 중인 마켓 목록"""
+        with self._lock:
+            return sorted(self._by_market)
+
+    # ------ 업데이트 전파 ------
+
+    def publish(self, prices):
+        """
+        새 가격을 반영하고 가격이 바뀐 마켓의 구독자에게 전달
+
+        Args:
+            prices (dict): 마켓별 가격
+        """
+        now = time.monotonic()
+        deliveries = []
+        with self._lock:
+            for market, price in prices.items():
+                if price is None:
+                    continue
+                previous = self._prices.get(market)
+                self._prices[market] = (price, now)
+                if previous is not None and previous[0] == price:
+                    continue
+                for subscription in self._by_market.get(market, ()):
+                    deliveries.append((subscription, market, price))
+
+        # 구독별 잠금은 피드 잠금 밖에서 사용
+        for subscription, market, price in deliveries:
+            subscription.offer(market, price)
+
+    # ------ 폴러 ------
+
+    def _ensure_running(self):
+        """폴러 스레드 시작 (self._lock 보유 상태에서 호출)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._poll_loop, name='market-feed', daemon=True)
+        self._thread.start()
+
+    def _poll_loop(self):
+        upbit_service = self.upbit_service or UpbitService()
+        logger.info("시세 피드 폴러 시작 (주기 %s초)", self.interval)
+        while not self._stop.is_set():
+            with self._lock:
+                markets = sorted(self._by_market)
+                if not markets:
+                    # 구독자가 없으면 종료 (다음 구독 시 재시작)
+                    self._thread = None
+                    break
+
+            started = time.monotonic()
+            try:
+                self.publish(upbit_service.get_ticker_prices(markets))
+            except Exception as e:
+                logger.error("시세 피드 조회 중 오류 발생: %s", e)
+
+            self._stop.wait(max(0.0, self.interval - (time.monotonic() - started)))
+        logger.info("시세 피드 폴러 종료")
+
+    def stop(self, timeout=5):
+        """폴러 종료 및 모든 구독 해제"""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=timeout)
+        for subscription in list(self._subscriptions):
+            subscription.close()
+        with self._lock:
+            self._thread = None
@@ -2,8 +2,8 @@ import logging
 from datetime import datetime, timedelta
 from models.user import db
 from models.recommendation import Recommendation
-from services.upbit_service import UpbitService
-from utils.manager_trading_algorithm.manager_trading_algorithm import TradingAlgorithmManager
+from service.upbit.upbit_service import UpbitService
+from service.alert.alert_service import AlertService
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +16,12 @@ class RecommendationService:
     def __init__(self, user=None):
         self.user = user
         self.upbit_service = UpbitService()
-        self.trading_algorithm_manager = TradingAlgorithmManager()
+    
+    @property
+    def trading_algorithm_manager(self):
+        """매매 알고리즘 관리자 (pandas/numpy 로딩 비용이 커서 첫 사용 시 로드)"""
+        from utils.manager_trading_algorithm.manager_trading_algorithm import TradingAlgorithmManager
+        return TradingAlgorithmManager()
     
     def generate_recommendations(self, limit=5):
         """
@@ -27,55 +32,153 @@ class RecommendationService:
             if not self.user:
                 return []
             
-            # 사용자의 전략 설정
-            strategy = self.user.strategy
-            risk_level = self.user.risk_level
-            
             # 거래량 상위 코인 가져오기
             top_coins = self.upbit_service.get_top_volume_tickers(limit=20)
+            picks = self._pick_buy_signals(self.user.strategy, top_coins, {}, {}, limit)
             
+            expiration = datetime.utcnow() + timedelta(hours=24)
             recommendations = []
-            for coin_info in top_coins:
-                ticker = coin_info['ticker']
-                
-                # OHLCV 데이터 가져오기
-                ohlcv_data = self.upbit_service.get_ohlcv(ticker, interval="day", count=30)
-                if ohlcv_data is None or len(ohlcv_data) < 30:
-                    continue
-                
-                # 매매 신호 확인
-                signal = self.trading_algorithm_manager.get_signal(strategy, ohlcv_data)
-                
-                if signal and signal['action'] == 'buy':
-                    # 추천 생성
-                    recommendation = Recommendation(
-                        user_id=self.user.id,
-                        ticker=ticker,
-                        recommendation_type='buy',
-                        price=coin_info['price'],
-                        confidence=signal.get('confidence', 0.5),
-                        strategy=strategy,
-                        reason=signal['reason'],
-                        technical_indicators=signal.get('indicators', {}),
-                        status='pending',
-                        expiration=datetime.utcnow() + timedelta(hours=24)
-                    )
-                    
-                    db.session.add(recommendation)
-                    recommendations.append(recommendation)
-                    
-                    # 최대 추천 개수 제한
-                    if len(recommendations) >= limit:
-                        break
+            for coin_info, signal in picks:
+                recommendation = Recommendation(**self._recommendation_fields(
+                    self.user.id, coin_info, self.user.strategy, signal, expiration
+                ))
+                db.session.add(recommendation)
+                recommendations.append(recommendation)
             
+            # 추천 알림 등록 (발송은 디스패처가 처리)
+            AlertService().enqueue_many(
+                [AlertService.recommendation_alert(recommendation) for recommendation in recommendations],
+                commit=False
+            )
             db.session.commit()
             return recommendations
             
         except Exception as e:
             db.session.rollback()
-            logger.error(f"추천 생성 중 오류 발생: {e}")
+            logger.error("추천 생성 중 오류 발생: %s", e)
             return []
     
+    def generate_recommendations_for_users(self, users, limit=5, run_cache=None):
+        """
+        여러 사용자에 대한 추천 일괄 생성
+        - 사용자를 (전략, 위험 수준) 그룹으로 묶어 그룹당 한 번만 신호 계산
+        - 거래량 상위 코인/OHLCV는 실행당 한 번만 조회하고 전략 간 공유
+        - 추천 행은 bulk insert 한 번으로 저장
+        
+        Args:
+            users (list): 사용자 목록
+            limit (int): 사용자별 최대 추천 개수
+            run_cache (dict, optional): 같은 실행의 배치 간 공유 캐시 (거래량 상위 코인, OHLCV, 신호)
+            
+        Returns:
+            dict: 사용자 ID별 생성된 추천 개수
+        """
+        counts = {user.id: 0 for user in users}
+        if not users:
+            return counts
+        
+        try:
+            # 사용자 그룹화 (사용자별 전략 파라미터가 없으므로 전략 기본값 사용)
+            groups = {}
+            for user in users:
+                groups.setdefault((user.strategy, user.risk_level), []).append(user.id)
+            
+            run_cache = {} if run_cache is None else run_cache
+            if 'top_coins' not in run_cache:
+                run_cache['top_coins'] = self.upbit_service.get_top_volume_tickers(limit=20)
+            top_coins = run_cache['top_coins']
+            ohlcv_cache = run_cache.setdefault('ohlcv', {})
+            signal_cache = run_cache.setdefault('signals', {})
+            expiration = datetime.utcnow() + timedelta(hours=24)
+            
+            mappings = []
+            for (strategy, _), user_ids in groups.items():
+                picks = self._pick_buy_signals(strategy, top_coins, ohlcv_cache, signal_cache, limit)
+                if not picks:
+                    continue
+                
+                for user_id in user_ids:
+                    for coin_info, signal in picks:
+                        mappings.append(self._recommendation_fields(user_id, coin_info, strategy, signal, expiration))
+                    counts[user_id] = len(picks)
+            
+            if mappings:
+                db.session.bulk_insert_mappings(Recommendation, mappings)
+                
+                # 추천 알림 등록 (사용자별 합치기/발송은 디스패처가 처리)
+                AlertService().enqueue_many(
+                    [AlertService.recommendation_alert(mapping) for mapping in mappings],
+                    commit=False
+                )
+            db.session.commit()
+            
+            logger.info(
+                "추천 일괄 생성 완료: 사용자 %s명, 그룹 %s개, 추천 %s건", len(users), len(groups), len(mappings)
+            )
+            return counts
+            
+        except Exception as e:
+            db.session.rollback()
+            logger.error("추천 일괄 생성 중 오류 발생: %s", e)
+            return {user.id: 0 for user in users}
+    
+    def _pick_buy_signals(self, strategy, top_coins, ohlcv_cache, signal_cache, limit):
+        """
+        거래량 상위 코인 중 매수 신호가 있는 코인 선택
+        
+        Args:
+            strategy (str): 전략 이름
+            top_coins (list): 거래량 상위 코인 정보 목록 (TickerVolume)
+            ohlcv_cache (dict): 티커별 OHLCV 구조화 배열 캐시 (호출 간 공유)
+            signal_cache (dict): (전략, 티커)별 신호 캐시 (호출 간 공유)
+            limit (int): 최대 선택 개수
+            
+        Returns:
+            list: (코인 정보, 신호) 목록
+        """
+        picks = []
+        for coin_info in top_coins:
+            ticker = coin_info.ticker
+            
+            key = (strategy, ticker)
+            if key not in signal_cache:
+                # OHLCV 데이터 가져오기
+                if ticker not in ohlcv_cache:
+                    ohlcv_cache[ticker] = self.upbit_service.get_candle_window(ticker, interval="day", count=30)
+                ohlcv_data = ohlcv_cache[ticker]
+                
+                # 매매 신호 확인
+                if ohlcv_data is None or len(ohlcv_data) < 30:
+                    signal_cache[key] = None
+                else:
+                    signal_cache[key] = self.trading_algorithm_manager.get_signal(strategy, ohlcv_data)
+            
+            signal = signal_cache[key]
+            if signal and signal['action'] == 'buy':
+                picks.append((coin_info, signal))
+                
+                # 최대 추천 개수 제한
+                if len(picks) >= limit:
+                    break
+        return picks
+    
+    @staticmethod
+    def _recommendation_fields(user_id, coin_info, strategy, signal, expiration):
+        """추천 행 컬럼 값"""
+        return {
+            'user_id': user_id,
+            'ticker': coin_info.ticker,
+            'recommendation_type': 'buy',
+            'price': coin_info.price,
+            'confidence': signal.get('confidence', 0.5),
+            'strategy': strategy,
+            'reason': signal['reason'],
+            'technical_indicators': signal.get('indicators', {}),
+            'status': 'pending',
+            'timestamp': datetime.utcnow(),
+            'expiration': expiration,
+        }
+    
     def get_recommendations(self, user_id=None, status='pending', limit=10):
         """추천 내역 조회"""
         try:
@@ -91,7 +194,7 @@ class RecommendationService:
             
             return recommendations
         except Exception as e:
-            logger.error(f"추천 내역 조회 중 오류 발생: {e}")
+            logger.error("추천 내역 조회 중 오류 발생: %s", e)
             return []
     
     def update_recommendation_status(self, recommendation_id, status):
@@ -108,5 +211,67 @@ class RecommendationService:
             return True, f"추천 상태가 '{status}'로 업데이트되었습니다."
         except Exception as e:
             db.session.rollback()
-            logger.error(f"추천 상태 업데이트 중 오류 발생: {e}")
-            return False, str(e)
\ No newline at end of file
+            logger.error("추천 상태 업데이트 중 오류 발생: %s", e)
+            return False, str(e)
+    
+    def expire_overdue(self):
+        """
+        만료 시간이 지난 대기(pending) 추천을 UPDATE 한 번으로 일괄 만료 처리
+        
+        Returns:
+            int: 만료 처리된 추천 수
+        """
+        try:
+            now = datetime.utcnow()
+            count = Recommendation.query.filter(
+                Recommendation.status == 'pending',
+                Recommendation.expiration.isnot(None),
+                Recommendation.expiration < now
+            ).update({'status': 'expired', 'action_timestamp': now}, synchronize_session=False)
+            db.session.commit()
+            
+            if count:
+                logger.info("만료된 추천 %s건 처리", count)
+            return count
+        except Exception as e:
+            db.session.rollback()
+            logger.error("추천 만료 처리 중 오류 발생: %s", e)
+            return 0
+    
+    def prune_old(self, retention_days=30, batch_size=1000):
+        """
+        보관 기간이 지난 처리 완료(pending 외) 추천을 배치 단위로 삭제
+        - 배치마다 커밋하여 잠금 시간을 짧게 유지
+        
+        Args:
+            retention_days (int): 보관 기간 (일)
+            batch_size (int): 배치당 삭제 건수
+            
+        Returns:
+            int: 삭제된 추천 수
+        """
+        total = 0
+        try:
+            cutoff = datetime.utcnow() - timedelta(days=retention_days)
+            while True:
+                ids = [row.id for row in db.session.query(Recommendation.id).filter(
+                    Recommendation.status != 'pending',
+                    Recommendation.timestamp < cutoff
+                ).order_by(Recommendation.id).limit(batch_size).all()]
+                if not ids:
+                    break
+                
+                Recommendation.query.filter(Recommendation.id.in_(ids)).delete(synchronize_session=False)
+                db.session.commit()
+                total += len(ids)
+                
+                if len(ids) < batch_size:
+                    break
+            
+            if total:
+                logger.info("오래된 추천 %s건 삭제", total)
+            return total
+        except Exception as e:
+            db.session.rollback()
+            logger.error("오래된 추천 삭제 중 오류 발생: %s", e)
+            return total
@@ -0,0 +1,40 @@
+"""
+자동 매매 기록 재현 스크립트
+
+    python -m service.replay records/20240102
+    python -m service.replay records/20240102/090000_000000-u1.json --strategy macd_crossover --repeat 20
+"""
+import argparse
+import json
+import logging
+
+from .replay_engine import ReplayEngine
+
+
+def main():
+    parser = argparse.ArgumentParser(description="자동 매매 기록 재현")
+    parser.add_argument('paths', nargs='+', help="기록 파일 또는 디렉터리 (REPLAY_RECORD_DIR 하위)")
+    parser.add_argument('--strategy', help="기록된 전략 대신 사용할 전략")
+    parser.add_argument('--repeat', type=int, default=1, help="반복 횟수 (앞 회차는 예열, 실행 시간은 마지막 회차)")
+    parser.add_argument('--json', action='store_true', help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    engine = ReplayEngine(strategy=args.strategy)
+    report = engine.replay(engine.load(args.paths), repeat=args.repeat)
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2, default=str))
+        return
+
+    for run in report['runs']:
+        status = '일치' if run['matched'] else '불일치'
+        print(f"{run['started_at']}  사용자 {run['user_id']}  {run['strategy']}  {status}  "
+              f"판단 {run['decisions']}  누락 입력 {len(run['misses'])}건  {run['elapsed'] * 1000:.1f}ms")
+    speedup = f"{report['speedup']:.0f}배" if report['speedup'] else '-'
+    print(f"\n재현 {len(report['runs'])}건: 일치 {report['matched']}, 불일치 {report['mismatched']}, "
+          f"재현 {report['elapsed'] * 1000:.1f}ms / 기록 {report['recorded_elapsed'] * 1000:.1f}ms ({speedup})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,204 @@
+"""
+자동 매매 재현 엔진
+- ReplayRecorder가 남긴 기록 파일의 입력을 TradingService/TradingAlgorithmManager에 그대로 다시 넣어
+  매매 판단을 재현 (거래소/DB 접근 없음, 대기 없이 연속 실행하므로 실제 시간보다 빠름)
+- 기록과 다른 전략으로 같은 입력을 재현해 판단 차이와 실행 시간을 비교할 수 있음
+"""
+import json
+import logging
+import os
+import time
+from collections import defaultdict, deque
+
+from service.trading.trading_service import TradingService
+from service.replay.replay_recorder import decode, encode
+
+logger = logging.getLogger(__name__)
+
+# 기록에 없는 입력을 요청받았을 때 반환값 (UpbitService의 조회 실패 값과 같은 형태)
+MISSING_RESULTS = {
+    'get_top_volume_tickers': [],
+    'get_ticker_prices': {},
+    'get_balance': {"error": "기록에 없는 입력입니다."},
+    'buy_market_order': {"error": "기록에 없는 입력입니다."},
+    'sell_market_order': {"error": "기록에 없는 입력입니다."},
+}
+
+
+def _call_key(method, args, kwargs):
+    return method, json.dumps([args, kwargs], sort_keys=True)
+
+
+class ReplayUpbitService:
+    """
+    기록된 호출 결과를 돌려주는 UpbitService 대체 객체
+    - 같은 (메서드, 인자) 호출은 기록 순서대로 결과를 돌려주고, 기록보다 많이 호출되면 마지막 결과를 재사용
+    - 기록에 없는 호출은 misses에 남기고 조회 실패 값을 반환
+    """
+
+    def __init__(self, calls):
+        """
+        Args:
+            calls (list): 기록 파일의 calls 목록
+        """
+        self._results = defaultdict(deque)
+        for call in calls:
+            self._results[_call_key(call['method'], call['args'], call['kwargs'])].append(call['result'])
+        self.misses = []
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        def call(*args, **kwargs):
+            args, kwargs = encode(list(args)), encode(kwargs)
+            results = self._results.get(_call_key(name, args, kwargs))
+            if not results:
+                self.misses.append({'method': name, 'args': args, 'kwargs': kwargs})
+                return decode(MISSING_RESULTS.get(name))
+            return decode(results.popleft() if len(results) > 1 else results[0])
+        return call
+
+
+class ReplayUser:
+    """재현용 사용자 (기록 파일의 사용자 정보, API 키 없음)"""
+
+    def __init__(self, record, strategy=None):
+        self.id = record.get('user_id')
+        self.strategy = strategy or record.get('strategy')
+        self.investment_amount = record.get('investment_amount') or 100000
+        self.auto_trading_enabled = True
+        self.upbit_access_key = None
+        self.upbit_secret_key = None
+
+
+class ReplayTradingService(TradingService):
+    """
+    기록된 입력으로 자동 매매를 실행하는 TradingService
+    - execute_trade는 주문/DB 저장 대신 판단을 decisions에 남기고, 기록된 같은 거래의 결과를 반환
+      (기록에 없는 거래는 주문이 체결된 것으로 간주)
+    """
+
+    def __init__(self, record, strategy=None):
+        super().__init__(user=ReplayUser(record, strategy))
+        self.upbit_service = ReplayUpbitService(record.get('calls', []))
+        self.decisions = []
+        self._trade_results = defaultdict(deque)
+        for trade in (record.get('result') or {}).get('trades', []):
+            self._trade_results[(trade['ticker'], trade['action'])].append(decode(trade['result']))
+
+    def execute_trade(self, ticker, trade_type, amount=None, price=None, strategy=None):
+        self.decisions.append({'ticker': ticker, 'action': trade_type, 'amount': amount})
+        results = self._trade_results.get((ticker, trade_type))
+        if results:
+            return results.popleft()
+        return {"success": True, "simulated": True, "ticker": ticker, "amount": amount}
+
+    def execute_auto_trading(self):
+        # 재현 중에는 기록하지 않음
+        return self._run_auto_trading()
+
+
+class ReplayEngine:
+    """
+    기록 파일 재현
+    """
+
+    def __init__(self, strategy=None):
+        """
+        Args:
+            strategy (str, optional): 기록된 전략 대신 사용할 전략
+        """
+        self.strategy = strategy
+
+    @staticmethod
+    def load(paths):
+        """
+        기록 파일 읽기
+
+        Args:
+            paths (list): 기록 파일 또는 디렉터리 (디렉터리는 하위 .json 파일 전체)
+
+        Returns:
+            list: 기록 목록 (시작 시각 순, 각 기록에 'path' 추가)
+        """
+        files = []
+        for path in paths:
+            if os.path.isdir(path):
+                for directory, _, names in os.walk(path):
+                    files.extend(os.path.join(directory, name) for name in names if name.endswith('.json'))
+            else:
+                files.append(path)
+
+        records = []
+        for file in files:
+            with open(file, encoding='utf-8') as f:
+                record = json.load(f)
+            record['path'] = file
+            records.append(record)
+        records.sort(key=lambda record: record.get('started_at') or '')
+        return records
+
+    @staticmethod
+    def recorded_decisions(record):
+        """기록된 매매 판단 [(티커, 액션), ...]"""
+        return [(trade['ticker'], trade['action']) for trade in (record.get('result') or {}).get('trades', [])]
+
+    def replay_run(self, record):
+        """
+        기록 1개 재현
+
+        Returns:
+            dict: 재현 결과 (판단, 기록과 일치 여부, 누락 입력, 실행 시간)
+        """
+        service = ReplayTradingService(record, self.strategy)
+        start = time.perf_counter()
+        result = service.execute_auto_trading()
+        elapsed = time.perf_counter() - start
+
+        decisions = [(decision['ticker'], decision['action']) for decision in service.decisions]
+        recorded = self.recorded_decisions(record)
+        return {
+            'path': record.get('path'),
+            'user_id': record.get('user_id'),
+            'strategy': service.user.strategy,
+            'started_at': record.get('started_at'),
+            'decisions': decisions,
+            'recorded_decisions': recorded,
+            'matched': decisions == recorded,
+            'misses': service.upbit_service.misses,
+            'error': result.get('error'),
+            'elapsed': elapsed,
+            'recorded_elapsed': record.get('elapsed'),
+        }
+
+    def replay(self, records, repeat=1):
+        """
+        기록 목록 재현
+
+        Args:
+            records (list): load() 결과
+            repeat (int): 반복 횟수 (앞 회차는 예열, 결과와 실행 시간은 마지막 회차)
+
+        Returns:
+            dict: {'runs': [...], 'matched', 'mismatched', 'elapsed', 'recorded_elapsed', 'speedup'}
+        """
+        runs = []
+        for _ in range(max(1, repeat)):
+            runs = [self.replay_run(record) for record in records]
+        elapsed = sum(run['elapsed'] for run in runs)
+
+        recorded_elapsed = sum(run['recorded_elapsed'] or 0 for run in runs)
+        matched = sum(1 for run in runs if run['matched'])
+        for run in runs:
+            if not run['matched']:
+                logger.info("매매 판단 불일치 (%s): 기록 %s, 재현 %s",
+                            run['path'], run['recorded_decisions'], run['decisions'])
+        return {
+            'runs': runs,
+            'matched': matched,
+            'mismatched': len(runs) - matched,
+            'elapsed': elapsed,
+            'recorded_elapsed': recorded_elapsed,
+            'speedup': recorded_elapsed / elapsed if elapsed > 0 else None,
+        }
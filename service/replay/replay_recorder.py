@@ -0,0 +1,197 @@
+"""
+자동 매매 입력 기록
+- REPLAY_RECORD_DIR을 지정하면 execute_auto_trading 1회마다 UpbitService 호출과 결과
+  (거래량 상위 티커, 캔들 구간, 현재가, 잔고, 주문 응답)를 호출 순서대로 JSON 파일 1개에 기록
+- 기록 파일은 ReplayEngine으로 같은 입력을 다시 넣어 매매 판단을 재현하는 데 사용
+"""
+import json
+import logging
+import os
+import time
+from datetime import datetime
+
+from utils.market_data.records import TickerVolume
+
+logger = logging.getLogger(__name__)
+
+RECORD_VERSION = 2
+
+
+def encode(value):
+    """
+    기록용 JSON 값으로 변환
+    - 구조화 배열 → {'__array__': {'dtype': [[필드, 타입], ...], 'rows': [[...], ...]}} (캔들/체결/호가 모두 dtype 그대로 복원)
+    - TickerVolume → {'__ticker_volume__': [ticker, volume, price]}
+    """
+    if isinstance(value, TickerVolume):
+        return {'__ticker_volume__': [value.ticker, value.volume, value.price]}
+    if getattr(value, 'dtype', None) is not None and value.dtype.names:
+        return {'__array__': {
+            'dtype': [[name, value.dtype.fields[name][0].str] for name in value.dtype.names],
+            'rows': [list(row) for row in value.tolist()],
+        }}
+    if isinstance(value, dict):
+        return {str(key): encode(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [encode(item) for item in value]
+    if hasattr(value, 'item'):
+        # NumPy 스칼라
+        return value.item()
+    return value
+
+
+def decode(value):
+    """encode()로 기록한 값 복원"""
+    if isinstance(value, dict):
+        if '__ticker_volume__' in value:
+            return TickerVolume(*value['__ticker_volume__'])
+        if '__array__' in value:
+            import numpy as np
+            dtype = np.dtype([(name, kind) for name, kind in value['__array__']['dtype']])
+            return np.array([tuple(row) for row in value['__array__']['rows']], dtype=dtype)
+        if '__candles__' in value:
+            # 버전 1 기록 (캔들 배열만 기록)
+            import numpy as np
+            from utils.upbit_api.utils.decoding import candle_dtype
+            return np.array([tuple(row) for row in value['__candles__']], dtype=candle_dtype())
+        return {key: decode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [decode(item) for item in value]
+    return value
+
+
+class RecordingUpbitService:
+    """
+    UpbitService 호출을 기록하는 대리 객체 (기록 대상이 아닌 속성은 그대로 전달)
+    """
+
+    # 매매 판단에 쓰이는 입력과 주문 응답 (JSON으로 기록할 수 없는 DataFrame을 반환하는 get_ohlcv는 제외)
+    RECORDED_METHODS = frozenset({
+        'get_top_volume_tickers', 'get_candle_window', 'get_candles',
+        'get_ticker_price', 'get_ticker_prices', 'get_balance', 'get_orderbook',
+        'buy_market_order', 'sell_market_order',
+    })
+
+    def __init__(self, upbit_service, calls):
+        """
+        Args:
+            upbit_service (UpbitService): 실제 서비스
+            calls (list): 호출 기록을 추가할 목록
+        """
+        self._upbit_service = upbit_service
+        self._calls = calls
+
+    def __getattr__(self, name):
+        attr = getattr(self._upbit_service, name)
+        if name not in self.RECORDED_METHODS or not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            self._calls.append({
+                'method': name,
+                'args': encode(list(args)),
+                'kwargs': encode(kwargs),
+                'result': encode(result),
+            })
+            return result
+        return call
+
+
+class ReplayRecorder:
+    """
+    자동 매매 입력 기록기 (싱글톤)
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        """싱글톤 패턴 구현"""
+        if cls._instance is None:
+            cls._instance = super(ReplayRecorder, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """기록기 초기화 (기본: 비활성화)"""
+        if self._initialized:
+            return
+
+        self.record_dir = None
+        self._initialized = True
+
+    @property
+    def enabled(self):
+        return bool(self.record_dir)
+
+    def configure(self, record_dir=None):
+        """
+        기록기 설정
+
+        Args:
+            record_dir (str, optional): 기록 디렉터리 (비어 있으면 기록하지 않음)
+        """
+        self.record_dir = record_dir or None
+        return self
+
+    def configure_from_config(self, config):
+        """app.config 값으로 설정"""
+        return self.configure(record_dir=config.get('REPLAY_RECORD_DIR'))
+
+    def run(self, trading_service, func):
+        """
+        자동 매매 1회 실행 및 입력 기록
+
+        Args:
+            trading_service (TradingService): 실행할 서비스 (실행 중에만 upbit_service를 기록 대리 객체로 교체)
+            func (callable): 매매 실행 함수 (결과 dict 반환)
+
+        Returns:
+            dict: func 실행 결과
+        """
+        user = trading_service.user
+        upbit_service = trading_service.upbit_service
+        if not self.enabled or user is None or upbit_service is None:
+            return func()
+
+        calls = []
+        started_at = datetime.now()
+        start = time.perf_counter()
+        trading_service.upbit_service = RecordingUpbitService(upbit_service, calls)
+        try:
+            result = func()
+        finally:
+            trading_service.upbit_service = upbit_service
+
+        record = {
+            'version': RECORD_VERSION,
+            'user_id': user.id,
+            'strategy': user.strategy,
+            'investment_amount': getattr(user, 'investment_amount', None),
+            'started_at': started_at.isoformat(),
+            'elapsed': time.perf_counter() - start,
+            'calls': calls,
+            'result': encode(result),
+        }
+        try:
+            path = self.save(record, started_at)
+            logger.debug("자동 매매 입력 기록 (사용자 %s): %s", user.id, path)
+        except Exception as e:
+            logger.error("자동 매매 입력 기록 실패 (사용자 %s): %s", user.id, e)
+        return result
+
+    def save(self, record, started_at):
+        """
+        기록 파일 저장 ({record_dir}/YYYYMMDD/HHMMSS_ffffff-u{사용자 ID}.json)
+
+        Returns:
+            str: 저장한 파일 경로
+        """
+        directory = os.path.join(self.record_dir, started_at.strftime('%Y%m%d'))
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{started_at.strftime('%H%M%S_%f')}-u{record['user_id']}.json")
+        temp = f"{path}.tmp"
+        with open(temp, 'w', encoding='utf-8') as f:
+            json.dump(record, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp, path)
+        return path
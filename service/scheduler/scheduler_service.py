@@ -0,0 +1,479 @@
+import logging
+import os
+import socket
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+from models.user import db, User
+from models.job_lease import JobLease
+from service.trading.trading_service import TradingService
+from service.recommendation.recommendation_service import RecommendationService
+from service.alert.alert_channels import create_channels
+from service.alert.alert_dispatcher import AlertDispatcher
+from service.alert.price_alert_engine import PriceAlertEngine
+from service.history.history_service import HistoryService
+from service.upbit.upbit_service import UpbitService
+from utils.market_data.archive import MarketDataArchive
+from utils.market_data.resampler import KST_OFFSET_MS, MINUTE_MS
+from utils.manager_metrics.manager_metrics import JOB_DEFERRED_USERS, JOB_OVERRUNS, JOB_SKIPPED, run_job
+
+logger = logging.getLogger(__name__)
+
+# 스케줄러 모드
+MODE_LOCAL = 'local'              # 단일 프로세스: 모든 사용자를 직접 처리 (기존 동작)
+MODE_DISTRIBUTED = 'distributed'  # 다중 워커: job_leases 테이블로 샤드를 임대하여 처리
+MODE_OFF = 'off'                  # 스케줄러 비활성화 (웹 전용 프로세스 등)
+
+
+def default_worker_id():
+    """호스트 이름과 PID로 워커 ID 생성"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def run_auto_trading(users, run_state=None):
+    """
+    자동 매매 작업: 주어진 사용자들에 대해 자동 매매 실행
+
+    Args:
+        users (list): 처리할 사용자 목록
+        run_state (dict, optional): 실행 1회의 배치 간 공유 상태 (사용하지 않음)
+    """
+    for user in users:
+        # 각 사용자에 대한 자동 매매 실행
+        trading_service = TradingService(user)
+        result = trading_service.execute_auto_trading()
+        if 'error' in result:
+            logger.info("자동 매매 결과 (사용자 %s): %s", user.id, result['error'])
+        else:
+            logger.info("자동 매매 결과 (사용자 %s): 거래 %s건", user.id, len(result.get('trades', [])))
+
+
+def run_recommendations(users, run_state=None):
+    """
+    추천 작업: 주어진 사용자들을 전략별로 묶어 추천 일괄 생성
+
+    Args:
+        users (list): 처리할 사용자 목록
+        run_state (dict, optional): 실행 1회의 배치 간 공유 상태 (거래량 상위 코인/OHLCV/신호를 배치마다 다시 조회하지 않음)
+    """
+    counts = RecommendationService().generate_recommendations_for_users(users, run_cache=run_state)
+    for user_id, count in counts.items():
+        logger.debug("추천 생성 완료 (사용자 %s): %s개", user_id, count)
+
+
+def run_recommendation_sweep():
+    """추천 정리 작업: 만료 추천 일괄 만료 처리 및 오래된 추천 배치 삭제"""
+    from flask import current_app
+    
+    recommendation_service = RecommendationService()
+    recommendation_service.expire_overdue()
+    recommendation_service.prune_old(
+        retention_days=current_app.config.get('RECOMMENDATION_RETENTION_DAYS', 30)
+    )
+
+
+def run_alert_dispatch():
+    """알림 발송 작업: outbox의 대기 알림을 사용자별로 합쳐 발송"""
+    from flask import current_app
+    
+    dispatcher = current_app.extensions.get('alert_dispatcher')
+    if dispatcher is None:
+        config = current_app.config
+        dispatcher = AlertDispatcher(
+            create_channels(config),
+            max_workers=config.get('ALERT_WORKERS', 4),
+            batch_size=config.get('ALERT_BATCH_SIZE', 500),
+            max_attempts=config.get('ALERT_MAX_ATTEMPTS', 3),
+            retry_backoff=config.get('ALERT_RETRY_BACKOFF', 60)
+        )
+        current_app.extensions['alert_dispatcher'] = dispatcher
+    dispatcher.dispatch_pending()
+
+
+def run_price_alerts():
+    """가격 알림 작업: 새 알림을 엔진에 적재하고 현재가로 발동 알림 처리"""
+    engine = PriceAlertEngine()
+    engine.sync()
+    tickers = engine.tickers()
+    if not tickers:
+        return
+    
+    # 워커 프로세스에는 실시간 시세 피드(웹 프로세스의 SSE 구독)가 없으므로 현재가를 직접 일괄 조회
+    engine.process_prices(UpbitService().get_ticker_prices(tickers))
+
+
+def run_history_sync(users, run_state=None):
+    """
+    내역 동기화 작업: API 키가 있는 사용자의 입금/출금/종료 주문 내역을 로컬 DB로 증분 동기화
+
+    Args:
+        users (list): 처리할 사용자 목록
+        run_state (dict, optional): 실행 1회의 배치 간 공유 상태 (사용하지 않음)
+    """
+    for user in users:
+        result = HistoryService(user.id).sync()
+        logger.debug("내역 동기화 결과 (사용자 %s): %s", user.id, result)
+
+
+def run_market_archive():
+    """시세 아카이브 작업: 대상 마켓의 1분 캔들, 최근 체결, 호가 스냅샷을 아카이브에 추가"""
+    from flask import current_app
+    
+    config = current_app.config
+    root = config.get('MARKET_ARCHIVE_DIR')
+    if not root:
+        return
+    archive = current_app.extensions.get('market_archive')
+    if archive is None:
+        archive = current_app.extensions['market_archive'] = MarketDataArchive(root)
+    
+    upbit_service = UpbitService()
+    markets = [market.strip() for market in (config.get('MARKET_ARCHIVE_MARKETS') or '').split(',') if market.strip()]
+    if not markets:
+        markets = [item.ticker for item in upbit_service.get_top_volume_tickers(limit=config.get('MARKET_ARCHIVE_TOP', 10))]
+    if not markets:
+        return
+    
+    now = int(time.time() * 1000) + KST_OFFSET_MS
+    # 매니페스트는 실행당 한 번만 저장
+    with archive.batch():
+        for market in markets:
+            # 마지막으로 보관한 1분 캔들(진행 중이었을 수 있음)부터 다시 받음 (최대 하루)
+            partitions = archive.partitions('candles/minute1', market)
+            count = 200 if not partitions else (now - partitions[-1][1]['end']) // MINUTE_MS + 1
+            candles = upbit_service.get_candles(market, interval='minute1', count=max(1, min(count, 1440)))
+            archive.append_candles(market, 'minute1', candles)
+            archive.append_trades(market, upbit_service.get_trades(market, count=500))
+        
+        for market, book in upbit_service.get_orderbooks(markets).items():
+            archive.append_orderbook(market, book)
+
+
+class SchedulerService:
+    """
+    주기 작업 스케줄링을 담당하는 서비스 클래스
+    - local 모드: 프로세스 내 스케줄러가 모든 사용자를 처리
+    - distributed 모드: 여러 워커 프로세스/호스트가 (작업, 샤드) 임대를 원자적 UPDATE로 획득하여
+      user.id % SCHEDULER_SHARDS 단위로 사용자를 나눠 처리 (주기당 샤드별 최대 1회 실행)
+    - 작업별 정책(JOB_POLICIES)으로 중복 실행/밀린 실행을 제한하고, 마감 시간을 넘기면 남은 사용자를
+      다음 실행으로 이월 (이월 목록은 프로세스 메모리에 보관되므로 분산 모드에서 다른 워커가 샤드를
+      가져가면 그 워커는 기본 순서로 처리)
+    """
+
+    # 작업 정의: 이름 → (실행 함수, 대상 사용자 조회 조건, 실행 주기(분, 소수 가능))
+    # 사용자 조회 조건이 None인 작업은 사용자 없이 실행되며 샤드를 나누지 않음
+    JOBS = {
+        'auto_trading': (run_auto_trading, lambda query: query.filter(User.auto_trading_enabled.is_(True)), 5),
+        'recommendations': (run_recommendations, lambda query: query, 30),
+        'recommendation_sweep': (run_recommendation_sweep, None, 10),
+        'alert_dispatch': (run_alert_dispatch, None, 1),
+        'price_alerts': (run_price_alerts, None, 0.25),
+        'history_sync': (run_history_sync, lambda query: query.filter(User.upbit_access_key.isnot(None)), 60),
+        'market_archive': (run_market_archive, None, 1),
+    }
+
+    # 작업별 실행 정책 (지정하지 않은 값은 DEFAULT_JOB_POLICY 사용)
+    # - max_instances: 동시 실행 수 (이전 실행이 끝나지 않았으면 이번 실행은 건너뛰고 skipped로 기록)
+    # - coalesce: 밀린 실행이 여러 번이어도 한 번만 실행
+    # - misfire_grace: 예정 시각보다 이 시간(초) 이상 늦으면 실행하지 않음
+    # - deadline: 사용자 작업의 처리 제한 시간(초), 초과 시 남은 사용자는 다음 실행에서 먼저 처리
+    # - batch_size: 마감 시간을 확인하는 사용자 단위 (배치 사이에 분산 모드 임대 연장)
+    DEFAULT_JOB_POLICY = {'max_instances': 1, 'coalesce': True, 'misfire_grace': 30, 'deadline': None, 'batch_size': None}
+    JOB_POLICIES = {
+        'auto_trading': {'misfire_grace': 60, 'deadline': 240, 'batch_size': 10},
+        'recommendations': {'misfire_grace': 300, 'deadline': 1500, 'batch_size': 200},
+        'recommendation_sweep': {'misfire_grace': 120},
+        'alert_dispatch': {'misfire_grace': 30},
+        'price_alerts': {'misfire_grace': 5},
+        'history_sync': {'misfire_grace': 600, 'deadline': 3000, 'batch_size': 20},
+        'market_archive': {'misfire_grace': 30},
+    }
+
+    def __init__(self, app, mode=None, shards=None, lease_seconds=None, worker_id=None, jobs=None):
+        """
+        Args:
+            app (Flask): 애플리케이션 (app context 및 설정 사용)
+            mode (str, optional): local / distributed / off (기본: SCHEDULER_MODE 설정)
+            shards (int, optional): 사용자 샤드 수 (기본: SCHEDULER_SHARDS 설정)
+            lease_seconds (int, optional): 임대 유지 시간 (기본: SCHEDULER_LEASE_SECONDS 설정)
+            worker_id (str, optional): 워커 ID (기본: WORKER_ID 설정 또는 호스트:PID)
+            jobs (list, optional): 실행할 작업 이름 목록 (기본: 전체)
+        """
+        unknown = [job_name for job_name in (jobs or []) if job_name not in self.JOBS]
+        if unknown:
+            raise ValueError(f"알 수 없는 작업입니다: {', '.join(unknown)}")
+
+        self.app = app
+        self.mode = (mode or app.config.get('SCHEDULER_MODE') or MODE_LOCAL).lower()
+        self.shards = max(1, int(shards or app.config.get('SCHEDULER_SHARDS') or 1))
+        self.lease_seconds = int(lease_seconds or app.config.get('SCHEDULER_LEASE_SECONDS') or 600)
+        self.worker_id = worker_id or app.config.get('WORKER_ID') or default_worker_id()
+        self.jobs = list(jobs or self.JOBS)
+        self.scheduler = None
+        self._deferred = {}  # (작업, 샤드) → 다음 실행으로 이월된 사용자 ID 목록
+
+    def start(self):
+        """
+        모드에 맞게 스케줄러 시작
+
+        Returns:
+            BackgroundScheduler: 시작된 스케줄러 (off 모드면 None)
+        """
+        if self.mode == MODE_OFF:
+            logger.info("스케줄러가 비활성화되어 있습니다.")
+            return None
+
+        if self.mode not in (MODE_LOCAL, MODE_DISTRIBUTED):
+            raise ValueError(f"지원하지 않는 스케줄러 모드입니다: {self.mode}")
+
+        from apscheduler.events import EVENT_JOB_MAX_INSTANCES, EVENT_JOB_MISSED
+        from apscheduler.schedulers.background import BackgroundScheduler
+
+        self.scheduler = BackgroundScheduler()
+        self.scheduler.add_listener(self._on_job_skipped, EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES)
+        for job_name in self.jobs:
+            minutes = self.JOBS[job_name][2]
+            policy = self.policy(job_name)
+            self.scheduler.add_job(
+                self.run, 'interval', minutes=minutes, args=[job_name], id=job_name, name=job_name,
+                max_instances=policy['max_instances'],
+                coalesce=policy['coalesce'],
+                misfire_grace_time=policy['misfire_grace']
+            )
+
+        self.scheduler.start()
+        logger.info(
+            "스케줄러 시작: 모드=%s, 샤드=%s, 워커=%s, 작업=%s",
+            self.mode, self.shards, self.worker_id, ','.join(self.jobs)
+        )
+        return self.scheduler
+
+    def shutdown(self, wait=True):
+        """스케줄러 종료"""
+        if self.scheduler:
+            self.scheduler.shutdown(wait=wait)
+            self.scheduler = None
+
+    @classmethod
+    def policy(cls, job_name):
+        """작업 실행 정책 (기본값에 작업별 정책을 덮어씀)"""
+        return {**cls.DEFAULT_JOB_POLICY, **cls.JOB_POLICIES.get(job_name, {})}
+
+    def run(self, job_name):
+        """
+        작업 1회 실행 (스케줄러 트리거 진입점)
+
+        Args:
+            job_name (str): 작업 이름
+        """
+        start = time.monotonic()
+        try:
+            run_job(job_name, self._run, job_name)
+        finally:
+            elapsed = time.monotonic() - start
+            interval = self.JOBS[job_name][2] * 60
+            if elapsed > interval:
+                JOB_OVERRUNS.labels(job_name, 'interval').inc()
+                logger.warning("작업 실행 시간이 주기를 초과했습니다 (%s): %.1f초 > %.0f초", job_name, elapsed, interval)
+
+    def _on_job_skipped(self, event):
+        """APScheduler 이벤트 리스너: 실행 시각을 놓쳤거나 이전 실행이 끝나지 않아 건너뛴 작업 기록"""
+        from apscheduler.events import EVENT_JOB_MAX_INSTANCES
+
+        reason = 'max_instances' if event.code == EVENT_JOB_MAX_INSTANCES else 'misfire'
+        JOB_SKIPPED.labels(event.job_id, reason).inc()
+        logger.warning("작업 실행 건너뜀 (%s): %s", event.job_id, reason)
+
+    def _run(self, job_name):
+        with self.app.app_context():
+            if self.mode == MODE_DISTRIBUTED:
+                self._run_distributed(job_name)
+            else:
+                self.run_shard(job_name, 0, 1)
+
+    def run_shard(self, job_name, shard, shards, renew=None):
+        """
+        샤드에 속한 사용자들에 대해 작업 실행
+        - 사용자 작업 함수는 func(users, run_state)로 호출되며, run_state는 실행 1회의 배치 간 공유 dict
+
+        Args:
+            job_name (str): 작업 이름
+            shard (int): 샤드 번호
+            shards (int): 전체 샤드 수
+            renew (callable, optional): 배치 사이에 호출하는 임대 연장 함수 (False를 반환하면 중단)
+        """
+        func, user_filter, _ = self.JOBS[job_name]
+        if user_filter is None:
+            func()
+            return
+        
+        query = user_filter(User.query)
+        if shards > 1:
+            query = query.filter(User.id % shards == shard)
+        users = query.order_by(User.id).all()
+
+        # 지난 실행에서 이월된 사용자를 먼저 처리
+        deferred = self._deferred.pop((job_name, shard), None)
+        if deferred:
+            order = {user_id: index for index, user_id in enumerate(deferred)}
+            users.sort(key=lambda user: (0, order[user.id]) if user.id in order else (1, user.id))
+
+        run_state = {}
+        policy = self.policy(job_name)
+        if policy['deadline'] is None:
+            func(users, run_state)
+            return
+
+        deadline = time.monotonic() + policy['deadline']
+        batch_size = policy['batch_size'] or len(users) or 1
+        for start in range(0, len(users), batch_size):
+            if start and renew is not None and not renew():
+                logger.warning("작업 임대를 잃어 중단합니다 (%s#%s): 남은 사용자 %s명", job_name, shard, len(users) - start)
+                return
+            if time.monotonic() >= deadline:
+                remaining = [user.id for user in users[start:]]
+                self._deferred[(job_name, shard)] = remaining
+                JOB_OVERRUNS.labels(job_name, 'deadline').inc()
+                JOB_DEFERRED_USERS.labels(job_name).inc(len(remaining))
+                logger.warning(
+                    "작업 마감 시간 초과 (%s#%s): 사용자 %s명을 다음 실행으로 이월", job_name, shard, len(remaining)
+                )
+                return
+            func(users[start:start + batch_size], run_state)
+
+    # ------ 분산 모드 ------
+
+    def _run_distributed(self, job_name):
+        """임대 가능한 샤드를 하나씩 획득하여 처리 (다른 워커와 작업을 나눠 가짐)"""
+        _, user_filter, minutes = self.JOBS[job_name]
+        shards = self.shards if user_filter is not None else 1
+        tick = self._current_tick(minutes)
+        self._ensure_leases(job_name, shards)
+
+        # 워커마다 다른 샤드부터 시도하여 경합 감소
+        offset = hash(self.worker_id) % shards
+        for i in range(shards):
+            shard = (offset + i) % shards
+            if not self.claim(job_name, shard, tick):
+                continue
+
+            try:
+                self.run_shard(job_name, shard, shards, renew=lambda shard=shard: self.renew(job_name, shard))
+            except Exception as e:
+                db.session.rollback()
+                logger.error("작업 실행 중 오류 발생 (%s#%s): %s", job_name, shard, e)
+            finally:
+                self.release(job_name, shard)
+
+    @staticmethod
+    def _current_tick(minutes):
+        """현재 시각이 속한 실행 주기의 시작 시간 (UTC, 주기 단위로 내림)"""
+        epoch = datetime(1970, 1, 1)
+        interval = minutes * 60
+        elapsed = int((datetime.utcnow() - epoch).total_seconds())
+        return epoch + timedelta(seconds=elapsed - elapsed % interval)
+
+    def _ensure_leases(self, job_name, shards):
+        """작업의 샤드별 임대 행 생성 (이미 있으면 무시)"""
+        existing = {
+            shard for (shard,) in db.session.query(JobLease.shard).filter_by(job_name=job_name).all()
+        }
+        for shard in range(shards):
+            if shard in existing:
+                continue
+            try:
+                db.session.add(JobLease(job_name=job_name, shard=shard))
+                db.session.commit()
+            except IntegrityError:
+                # 다른 워커가 먼저 생성
+                db.session.rollback()
+
+    def claim(self, job_name, shard, tick):
+        """
+        (작업, 샤드) 임대 획득 - 단일 UPDATE 문의 WHERE 조건으로 원자적으로 판정
+        - 이번 주기(tick)에 아직 실행되지 않았고
+        - 다른 워커의 임대가 없거나 만료된 경우에만 획득
+
+        Args:
+            job_name (str): 작업 이름
+            shard (int): 샤드 번호
+            tick (datetime): 이번 실행 주기 시작 시간
+
+        Returns:
+            bool: 획득 여부
+        """
+        now = datetime.utcnow()
+        try:
+            result = db.session.execute(
+                JobLease.__table__.update()
+                .where(JobLease.job_name == job_name)
+                .where(JobLease.shard == shard)
+                .where(or_(JobLease.last_tick.is_(None), JobLease.last_tick < tick))
+                .where(or_(JobLease.lease_until.is_(None), JobLease.lease_until < now))
+                .values(
+                    owner=self.worker_id,
+                    lease_until=now + timedelta(seconds=self.lease_seconds),
+                    last_tick=tick,
+                    updated_at=now
+                )
+            )
+            db.session.commit()
+            claimed = result.rowcount == 1
+            if claimed:
+                logger.info("작업 임대 획득: %s#%s (워커 %s)", job_name, shard, self.worker_id)
+            return claimed
+        except Exception as e:
+            db.session.rollback()
+            logger.error("작업 임대 획득 중 오류 발생 (%s#%s): %s", job_name, shard, e)
+            return False
+
+    def renew(self, job_name, shard):
+        """
+        보유 중인 임대 연장 (마감 시간이 임대 시간보다 긴 작업이 처리 중에 다른 워커에게 넘어가지 않도록)
+
+        Args:
+            job_name (str): 작업 이름
+            shard (int): 샤드 번호
+
+        Returns:
+            bool: 연장 여부 (다른 워커가 임대를 가져갔으면 False)
+        """
+        now = datetime.utcnow()
+        try:
+            result = db.session.execute(
+                JobLease.__table__.update()
+                .where(JobLease.job_name == job_name)
+                .where(JobLease.shard == shard)
+                .where(JobLease.owner == self.worker_id)
+                .values(lease_until=now + timedelta(seconds=self.lease_seconds), updated_at=now)
+            )
+            db.session.commit()
+            return result.rowcount == 1
+        except Exception as e:
+            db.session.rollback()
+            logger.error("작업 임대 연장 중 오류 발생 (%s#%s): %s", job_name, shard, e)
+            # 일시적인 DB 오류로 처리를 중단하지 않음 (임대가 만료되면 다음 연장에서 확인)
+            return True
+
+    def release(self, job_name, shard):
+        """
+        임대 반납 (last_tick은 유지되어 같은 주기에 재실행되지 않음)
+
+        Args:
+            job_name (str): 작업 이름
+            shard (int): 샤드 번호
+        """
+        now = datetime.utcnow()
+        try:
+            db.session.execute(
+                JobLease.__table__.update()
+                .where(JobLease.job_name == job_name)
+                .where(JobLease.shard == shard)
+                .where(JobLease.owner == self.worker_id)
+                .values(lease_until=now, updated_at=now)
+            )
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error("작업 임대 반납 중 오류 발생 (%s#%s): %s", job_name, shard, e)
@@ -3,17 +3,19 @@ from datetime import datetime, timedelta
 from models.user import db
 from models.trade import Trade
 from service.upbit.upbit_service import UpbitService
+from service.alert.alert_service import AlertService
+from service.dashboard.dashboard_service import invalidate_balance
+from service.replay.replay_recorder import ReplayRecorder
 from utils.manager_encryption.manager_encryption import EncryptionManager
-from utils.manager_trading_algorithm.manager_trading_algorithm import TradingAlgorithmManager
+from utils.upbit_api.utils.validators import validate_ticker
 
 logger = logging.getLogger(__name__)
 
 class TradingService:
-    def __init__(self, user=None):
+    def __init__(self, user=None, upbit_client=None):
         self.user = user
         self.upbit_service = None
         self.encryption_manager = EncryptionManager()
-        self.trading_algorithm_manager = TradingAlgorithmManager()
         
         if user and user.upbit_access_key and user.upbit_secret_key:
             # 암호화된 API 키 복호화
@@ -22,17 +24,27 @@ class TradingService:
                 secret_key = self.encryption_manager.decrypt(user.upbit_secret_key)
                 
                 # 업비트 서비스 초기화
-                self.upbit_service = UpbitService(access_key, secret_key)
+                self.upbit_service = UpbitService(access_key, secret_key, client=upbit_client)
             except Exception as e:
-                logger.error(f"업비트 서비스 초기화 실패: {e}")
+                logger.error("업비트 서비스 초기화 실패: %s", e)
                 self.upbit_service = None
     
+    @property
+    def trading_algorithm_manager(self):
+        """매매 알고리즘 관리자 (pandas/numpy 로딩 비용이 커서 첫 사용 시 로드)"""
+        from utils.manager_trading_algorithm.manager_trading_algorithm import TradingAlgorithmManager
+        return TradingAlgorithmManager()
+    
     # 거래 실행
     def execute_trade(self, ticker, trade_type, amount=None, price=None, strategy=None):
         try:
             if self.upbit_service is None:
                 return {"error": "업비트 서비스가 초기화되지 않았습니다."}
             
+            # 상장되지 않은 마켓은 거래소 요청 전에 거절
+            if not validate_ticker(ticker):
+                return {"error": f"거래할 수 없는 마켓입니다: {ticker}"}
+            
             # 현재 시세 조회
             current_price = self.upbit_service.get_ticker_price(ticker)
             if current_price is None:
@@ -87,9 +99,17 @@ class TradingService:
             )
             
             db.session.add(trade)
+            
+            # 거래 알림 등록 (같은 트랜잭션으로 저장, 발송은 디스패처가 처리)
+            if trade.user_id:
+                AlertService().send_trade_alert(trade, commit=False)
             db.session.commit()
             
-            logger.info(f"거래 완료: {trade}")
+            # 잔고가 바뀌었으므로 대시보드 잔고 캐시 무효화
+            if trade.user_id:
+                invalidate_balance(trade.user_id)
+            
+            logger.info("거래 완료: %s", trade)
             return {
                 "success": True,
                 "trade_id": trade.id,
@@ -103,7 +123,7 @@ class TradingService:
             
         except Exception as e:
             db.session.rollback()
-            logger.error(f"거래 실행 중 오류 발생: {e}")
+            logger.error("거래 실행 중 오류 발생: %s", e)
             return {"error": str(e)}
     
     # 거래 내역 조회
@@ -116,11 +136,14 @@ class TradingService:
             
             return trades
         except Exception as e:
-            logger.error(f"거래 내역 조회 중 오류 발생: {e}")
+            logger.error("거래 내역 조회 중 오류 발생: %s", e)
             return []
     
-    # 자동 매매 실행
+    # 자동 매매 실행 (REPLAY_RECORD_DIR 설정 시 입력 기록)
     def execute_auto_trading(self):
+        return ReplayRecorder().run(self, self._run_auto_trading)
+    
+    def _run_auto_trading(self):
         try:
             if not self.user:
                 return {"error": "사용자 정보가 없습니다."}
@@ -141,31 +164,31 @@ class TradingService:
             results = []
             
             for ticker_info in top_tickers:
-                ticker = ticker_info['ticker']
+                ticker = ticker_info.ticker
                 
-                # OHLCV 데이터 가져오기
-                ohlcv_data = self.upbit_service.get_ohlcv(ticker, interval="day", count=30)
+                # OHLCV 데이터 가져오기 (구조화 배열, 캔들 저장소 공유)
+                ohlcv_data = self.upbit_service.get_candle_window(ticker, interval="day", count=30)
                 if ohlcv_data is None or len(ohlcv_data) < 30:
-                    logger.warning(f"{ticker}의 OHLCV 데이터를 가져올 수 없습니다.")
+                    logger.warning("%s의 OHLCV 데이터를 가져올 수 없습니다.", ticker)
                     continue
                     
                 # 매매 알고리즘 실행
                 signal = self.trading_algorithm_manager.get_signal(strategy, ohlcv_data)
                 
                 if signal:
-                    logger.info(f"{ticker}에 대한 매매 신호 감지: {signal['action']} - {signal['reason']}")
+                    logger.info("%s에 대한 매매 신호 감지: %s - %s", ticker, signal['action'], signal['reason'])
                     
                     # 매수 신호인 경우, 잔고 확인 및 투자 금액 계산
                     if signal['action'] == 'buy':
                         # KRW 잔고 확인
                         krw_balance = self.upbit_service.get_balance("KRW")
                         if isinstance(krw_balance, dict) and 'error' in krw_balance:
-                            logger.error(f"KRW 잔고 조회 실패: {krw_balance['error']}")
+                            logger.error("KRW 잔고 조회 실패: %s", krw_balance['error'])
                             continue
                         
                         # 잔고가 없거나 부족한 경우
                         if not krw_balance or float(krw_balance) < 5000:
-                            logger.warning(f"매수 가능한 KRW 잔고가 부족합니다: {krw_balance}")
+                            logger.warning("매수 가능한 KRW 잔고가 부족합니다: %s", krw_balance)
                             continue
                         
                         # 투자 금액 계산 (KRW 잔고의 10%)
@@ -186,19 +209,19 @@ class TradingService:
                         coin_balance = self.upbit_service.get_balance(coin_currency)
                         
                         if isinstance(coin_balance, dict) and 'error' in coin_balance:
-                            logger.error(f"{coin_currency} 보유량 조회 실패: {coin_balance['error']}")
+                            logger.error("%s 보유량 조회 실패: %s", coin_currency, coin_balance['error'])
                             continue
                         
                         # 보유량이 없는 경우
                         if not coin_balance or float(coin_balance) <= 0:
-                            logger.warning(f"{coin_currency}의 보유량이 없습니다.")
+                            logger.warning("%s의 보유량이 없습니다.", coin_currency)
                             continue
                         
                         # 매도 수량은 전체 보유량
                         amount = float(coin_balance)
                     else:
                         # 알 수 없는 액션
-                        logger.warning(f"알 수 없는 매매 액션: {signal['action']}")
+                        logger.warning("알 수 없는 매매 액션: %s", signal['action'])
                         continue
                     
                     # 매매 실행
@@ -220,7 +243,7 @@ class TradingService:
                     
                     # 매수 거래가 완료되면 다음 코인으로 넘어가지 않고 종료 (자금 관리)
                     if signal['action'] == 'buy' and not isinstance(trade_result, dict) or ('error' not in trade_result):
-                        logger.info(f"{ticker} 매수 완료, 더 이상의 매수는 이번 회차에서 진행하지 않습니다.")
+                        logger.info("%s 매수 완료, 더 이상의 매수는 이번 회차에서 진행하지 않습니다.", ticker)
                         break
             
             # 거래 내역이 없는 경우
@@ -238,7 +261,7 @@ class TradingService:
             }
             
         except Exception as e:
-            logger.error(f"자동 매매 실행 중 오류 발생: {e}")
+            logger.error("자동 매매 실행 중 오류 발생: %s", e)
             return {"error": str(e)}
     
     # 손익 계산
@@ -296,5 +319,5 @@ class TradingService:
             }
             
         except Exception as e:
-            logger.error(f"손익 계산 중 오류 발생: {e}")
+            logger.error("손익 계산 중 오류 발생: %s", e)
             return {"error": str(e)}
\ No newline at end of file
@@ -1,20 +1,53 @@
-import pyupbit
 import logging
 import time
 from utils.manager_encryption.manager_encryption import EncryptionManager
+from utils.upbit_api.market_catalog import MarketCatalog
+from utils.market_data.records import TickerVolume
+from utils.market_data.candle_store import CandleStore
+from utils.manager_metrics.manager_metrics import (
+    UPBIT_REQUEST_SECONDS, UPBIT_REQUEST_ERRORS, RATE_LIMIT_WAIT_SECONDS
+)
 
 logger = logging.getLogger(__name__)
 
+
+def _load_pyupbit():
+    """pyupbit 지연 로딩 (pandas를 함께 불러와 import 비용이 크므로 실제 사용 시점에 로드)"""
+    import pyupbit
+    return pyupbit
+
+
 class UpbitService:
     """
     업비트 API 연동을 위한 서비스 클래스
     - 시세 조회, 매수/매도, 잔고 조회 등 업비트 API 관련 기능 제공
+    - client로 pyupbit 호환 객체(예: 모의 거래소 클라이언트)를 주입하면 실제 거래소 대신 사용
     """
     
-    def __init__(self, access_key=None, secret_key=None):
+    # 기본 클라이언트 (None이면 pyupbit 사용) 및 연속 시세 조회 간격
+    _default_client = None
+    _request_interval = 0.1
+    
+    @classmethod
+    def set_default_client(cls, client, request_interval=0.1):
+        """
+        새로 생성되는 UpbitService가 사용할 기본 클라이언트 설정
+        
+        Args:
+            client: pyupbit 모듈과 같은 인터페이스의 객체 (None이면 pyupbit 복원)
+            request_interval (float): 연속 시세 조회 사이 대기 시간 (초)
+        """
+        cls._default_client = client
+        cls._request_interval = request_interval
+    
+    def __init__(self, access_key=None, secret_key=None, client=None):
         self.access_key = access_key
         self.secret_key = secret_key
         self.upbit = None
+        # 클라이언트를 주입하지 않으면 시세 구조화 배열 조회는 UpbitAPI 시세 모듈을 직접 사용
+        self.use_quotation_api = client is None and UpbitService._default_client is None
+        self.client = client or UpbitService._default_client or _load_pyupbit()
+        self.request_interval = UpbitService._request_interval
         self.encryption_manager = EncryptionManager()
         
         if access_key and secret_key:
@@ -23,29 +56,124 @@ class UpbitService:
     # 업비트 API 객체 초기화
     def initialize_upbit(self):
         try:
-            self.upbit = pyupbit.Upbit(self.access_key, self.secret_key)
+            self.upbit = self.client.Upbit(self.access_key, self.secret_key)
             logger.info("Upbit API 초기화 성공")
         except Exception as e:
-            logger.error(f"Upbit API 초기화 실패: {e}")
+            logger.error("Upbit API 초기화 실패: %s", e)
             self.upbit = None
     
+    def _call(self, group, func, *args, **kwargs):
+        """
+        업비트 호출 실행 및 엔드포인트 그룹별 소요 시간/실패 기록
+        
+        Args:
+            group (str): 엔드포인트 그룹 (ticker, candles, accounts, orders 등)
+            func (callable): 실행할 클라이언트 메서드
+        """
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            UPBIT_REQUEST_ERRORS.labels(group).inc()
+            raise
+        finally:
+            UPBIT_REQUEST_SECONDS.labels(group).observe(time.perf_counter() - start)
+    
     # 시세 정보 관련 메서드 / 현재 시세 조회
     def get_ticker_price(self, ticker):
         try:
-            return pyupbit.get_current_price(ticker)
+            return self._call('ticker', self.client.get_current_price, ticker)
         except Exception as e:
-            logger.error(f"시세 조회 실패: {e}")
+            logger.error("시세 조회 실패: %s", e)
             return None
     
+    # 여러 코인 현재 시세 일괄 조회 (요청당 최대 chunk_size개)
+    def get_ticker_prices(self, tickers, chunk_size=100):
+        prices = {}
+        tickers = list(tickers)
+        for start in range(0, len(tickers), chunk_size):
+            chunk = tickers[start:start + chunk_size]
+            try:
+                result = self._call('ticker', self.client.get_current_price, chunk)
+            except Exception as e:
+                logger.error("시세 일괄 조회 실패: %s", e)
+                continue
+            if isinstance(result, dict):
+                prices.update(result)
+            elif result is not None:
+                # pyupbit는 티커가 1개면 가격만 반환
+                prices[chunk[0]] = result
+        return prices
+    
     # OHLCV(시가, 고가, 저가, 종가, 거래량) 데이터 조회
-    def get_ohlcv(self, ticker, interval="day", count=30):
+    def get_ohlcv(self, ticker, interval="day", count=30, to=None):
         try:
-            df = pyupbit.get_ohlcv(ticker, interval=interval, count=count)
+            # count가 200을 넘으면 클라이언트가 to를 옮겨가며 여러 번 조회
+            kwargs = {'to': to} if to else {}
+            df = self._call('candles', self.client.get_ohlcv, ticker, interval=interval, count=count, **kwargs)
             return df
         except Exception as e:
-            logger.error(f"OHLCV 데이터 조회 실패: {e}")
+            logger.error("OHLCV 데이터 조회 실패: %s", e)
+            return None
+    
+    # OHLCV 구조화 배열 조회 (DataFrame을 거치지 않음)
+    def get_candles(self, ticker, interval="day", count=30, to=None):
+        """
+        OHLCV 구조화 배열 조회
+        - pyupbit 대신 UpbitAPI 시세 모듈로 응답을 바로 구조화 배열로 디코딩
+        - get_candles를 제공하지 않는 pyupbit 호환 클라이언트는 DataFrame에서 변환
+        
+        Returns:
+            np.ndarray: candle_dtype 배열 (오래된 순) 또는 None
+        """
+        try:
+            if self.use_quotation_api:
+                # 요청 시간은 공용 세션의 응답 훅이 HTTP 요청마다 기록
+                from utils.upbit_api.upbit_api import UpbitAPI
+                candles = UpbitAPI().quotation.get_candles(ticker, interval=interval, count=count, to=to)
+            elif hasattr(self.client, 'get_candles'):
+                candles = self._call('candles', self.client.get_candles, ticker, interval=interval, count=count, to=to)
+            else:
+                from utils.upbit_api.utils.decoding import candles_from_dataframe
+                df = self.get_ohlcv(ticker, interval=interval, count=count, to=to)
+                return None if df is None else candles_from_dataframe(df)
+            
+            if isinstance(candles, dict):
+                logger.error("OHLCV 데이터 조회 실패: %s", candles.get('error'))
+                return None
+            return candles
+        except Exception as e:
+            logger.error("OHLCV 데이터 조회 실패: %s", e)
             return None
     
+    # 최근 캔들 구간 조회 (캔들 저장소 공유)
+    def get_candle_window(self, ticker, interval="day", count=30):
+        """
+        최근 count개 캔들 구조화 배열 (CandleStore에 최근 갱신된 버퍼가 있으면 거래소 조회 없음)
+        
+        Returns:
+            np.ndarray: candle_dtype 배열 (오래된 순) 또는 None
+        """
+        return CandleStore().window(
+            ticker, interval, count, lambda n: self.get_candles(ticker, interval=interval, count=n)
+        )
+    
+    # 다중 타임프레임 캔들 구간 조회 (1분 캔들 리샘플링)
+    def get_timeframe_windows(self, ticker, intervals, count=30):
+        """
+        여러 타임프레임의 최근 count개 캔들 구조화 배열
+        - 거래소에서는 1분 캔들만 갱신하고 상위 타임프레임은 CandleStore 리샘플러에서 계산
+        - 1분 캔들로 덮지 못한 과거 구간만 타임프레임별로 처음 한 번 조회
+        
+        Returns:
+            dict: 타임프레임 → candle_dtype 배열 (오래된 순) 또는 None
+        """
+        return CandleStore().timeframe_windows(
+            ticker, intervals, count,
+            lambda n: self.get_candles(ticker, interval='minute1', count=n),
+            lambda interval, n: self.get_candles(ticker, interval=interval, count=n),
+        )
+    
     # 잔고 관련 메서드 / 계좌 잔고 조회
     def get_balance(self, ticker=None):
         try:
@@ -54,12 +182,12 @@ class UpbitService:
                 
             if ticker:
                 # 특정 코인 잔고 조회
-                return self.upbit.get_balance(ticker)
+                return self._call('accounts', self.upbit.get_balance, ticker)
             else:
                 # 전체 잔고 조회
-                return self.upbit.get_balances()
+                return self._call('accounts', self.upbit.get_balances)
         except Exception as e:
-            logger.error(f"잔고 조회 실패: {e}")
+            logger.error("잔고 조회 실패: %s", e)
             return {"error": str(e)}
     
     # 주문 관련 메서드 / 시장가 매수
@@ -68,11 +196,11 @@ class UpbitService:
             if self.upbit is None:
                 return {"error": "Upbit API가 초기화되지 않았습니다."}
                 
-            result = self.upbit.buy_market_order(ticker, amount)
-            logger.info(f"시장가 매수 요청: {ticker}, {amount}")
+            result = self._call('orders', self.upbit.buy_market_order, ticker, amount)
+            logger.info("시장가 매수 요청: %s, %s", ticker, amount)
             return result
         except Exception as e:
-            logger.error(f"시장가 매수 실패: {e}")
+            logger.error("시장가 매수 실패: %s", e)
             return {"error": str(e)}
     # 시장가 매도
     def sell_market_order(self, ticker, amount):
@@ -80,44 +208,94 @@ class UpbitService:
             if self.upbit is None:
                 return {"error": "Upbit API가 초기화되지 않았습니다."}
                 
-            result = self.upbit.sell_market_order(ticker, amount)
-            logger.info(f"시장가 매도 요청: {ticker}, {amount}")
+            result = self._call('orders', self.upbit.sell_market_order, ticker, amount)
+            logger.info("시장가 매도 요청: %s, %s", ticker, amount)
             return result
         except Exception as e:
-            logger.error(f"시장가 매도 실패: {e}")
+            logger.error("시장가 매도 실패: %s", e)
             return {"error": str(e)}
     
     # 기타 업비트 API 관련 메서드
     def get_orderbook(self, ticker):
         """호가창 조회"""
         try:
-            return pyupbit.get_orderbook(ticker)
+            return self._call('orderbook', self.client.get_orderbook, ticker)
+        except Exception as e:
+            logger.error("호가창 조회 실패: %s", e)
+            return None
+    
+    # 여러 마켓 호가 구조화 배열 조회
+    def get_orderbooks(self, tickers):
+        """
+        호가 조회 (마켓별 구조화 배열)
+        
+        Returns:
+            dict: 마켓 → {'timestamp', 'total_ask_size', 'total_bid_size', 'units': orderbook_dtype 배열}
+                  (조회 실패 시 빈 dict)
+        """
+        try:
+            if self.use_quotation_api:
+                # 요청 시간은 공용 세션의 응답 훅이 기록
+                from utils.upbit_api.upbit_api import UpbitAPI
+                books = UpbitAPI().quotation.get_orderbook(list(tickers))
+                if 'error' in books:
+                    logger.error("호가 조회 실패: %s", books['error'])
+                    return {}
+                return books
+            from utils.upbit_api.utils.decoding import orderbooks_from_records
+            return orderbooks_from_records(self._call('orderbook', self.client.get_orderbook, list(tickers)) or [])
+        except Exception as e:
+            logger.error("호가 조회 실패: %s", e)
+            return {}
+    
+    # 최근 체결 구조화 배열 조회
+    def get_trades(self, ticker, count=200):
+        """
+        최근 체결 조회 (pyupbit 호환 클라이언트는 get_trades를 제공할 때만 지원)
+        
+        Returns:
+            np.ndarray: trade_dtype 배열 (오래된 순) 또는 None
+        """
+        try:
+            if self.use_quotation_api:
+                # 요청 시간은 공용 세션의 응답 훅이 기록
+                from utils.upbit_api.upbit_api import UpbitAPI
+                trades = UpbitAPI().quotation.get_trades(ticker, count=count)
+            elif hasattr(self.client, 'get_trades'):
+                trades = self._call('trades', self.client.get_trades, ticker, count=count)
+            else:
+                return None
+            
+            if isinstance(trades, dict):
+                logger.error("체결 조회 실패: %s", trades.get('error'))
+                return None
+            return trades
         except Exception as e:
-            logger.error(f"호가창 조회 실패: {e}")
+            logger.error("체결 조회 실패: %s", e)
             return None
     
-    # 거래량 기준 상위 코인 조회
+    # 거래량 기준 상위 코인 조회 (TickerVolume 목록)
     def get_top_volume_tickers(self, limit=10):
         try:
-            tickers = pyupbit.get_tickers(fiat="KRW")
+            # 마켓 카탈로그의 KRW 마켓 (유의 종목 제외), 카탈로그를 불러올 수 없으면 거래소에서 조회
+            tickers = MarketCatalog().tickers('KRW', include_warning=False)
+            if not tickers:
+                tickers = self._call('market', self.client.get_tickers, fiat="KRW")
             volume_data = []
             
             for ticker in tickers[:30]:
-                time.sleep(0.1)  # API 호출 제한 방지
+                if self.request_interval:
+                    time.sleep(self.request_interval)  # API 호출 제한 방지
+                    RATE_LIMIT_WAIT_SECONDS.labels('upbit_quotation').observe(self.request_interval)
                 current_price = self.get_ticker_price(ticker)
                 if current_price:
-                    ohlcv = self.get_ohlcv(ticker, interval="day", count=1)
-                    if ohlcv is not None and not ohlcv.empty:
-                        volume = ohlcv.iloc[0]['volume']
-                        volume_data.append({
-                            'ticker': ticker,
-                            'volume': volume,
-                            'price': current_price
-                        })
+                    candles = self.get_candle_window(ticker, interval="day", count=1)
+                    if candles is not None and len(candles):
+                        volume_data.append(TickerVolume(ticker, candles['volume'][-1], current_price))
             
             # 거래량 기준 정렬
-            volume_data.sort(key=lambda x: x['volume'], reverse=True)
+            volume_data.sort(key=lambda x: x.volume, reverse=True)
             return volume_data[:limit]
         except Exception as e:
-            logger.error(f"거래량 상위 코인 조회 실패: {e}")
+            logger.error("거래량 상위 코인 조회 실패: %s", e)
             return []
\ No newline at end of file
@@ -0,0 +1,207 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from utils.manager_metrics.manager_metrics import record_cache
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    만료 시간(TTL)과 최대 크기를 가진 스레드 안전 캐시
+    - 가득 차면 가장 오래 사용하지 않은 항목부터 제거 (LRU)
+    - get_or_load는 같은 키에 대한 동시 로드를 하나로 합침 (single-flight)
+    - refresh_ahead를 주면 만료 직전 조회 시 기존 값을 반환하고 백그라운드에서 갱신 (refresh-ahead)
+    """
+
+    def __init__(self, name, ttl=10, maxsize=1024):
+        """
+        Args:
+            name (str): 캐시 이름 (메트릭 레이블)
+            ttl (float): 기본 만료 시간 (초)
+            maxsize (int): 최대 항목 수
+        """
+        self.name = name
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data = OrderedDict()   # key → (만료 시각, 값)
+        self._lock = threading.Lock()
+        self._loading = {}           # key → 로드 중인 키 잠금
+        self._refreshing = set()     # 백그라운드 갱신 중인 키
+        self._generation = 0         # 무효화할 때마다 증가 (무효화 이전에 시작한 로드 결과는 저장하지 않음)
+
+    def __len__(self):
+        return len(self._data)
+
+    def _lookup(self, key):
+        entry = self._data.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return _MISSING
+        self._data.move_to_end(key)
+        return value
+
+    def get(self, key, default=None):
+        """캐시 조회 (없거나 만료되면 default)"""
+        with self._lock:
+            value = self._lookup(key)
+        record_cache(self.name, value is not _MISSING)
+        return default if value is _MISSING else value
+
+    def set(self, key, value, ttl=None, generation=None):
+        """캐시 저장"""
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key):
+        """항목 삭제"""
+        with self._lock:
+            self._data.pop(key, None)
+            self._generation += 1
+
+    def invalidate_where(self, predicate):
+        """
+        조건에 맞는 키의 항목 모두 삭제
+
+        Args:
+            predicate (callable): 키를 받아 삭제 여부를 반환하는 함수
+
+        Returns:
+            int: 삭제한 항목 수
+        """
+        with self._lock:
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                del self._data[key]
+            self._generation += 1
+        return len(keys)
+
+    def clear(self):
+        """전체 삭제"""
+        with self._lock:
+            self._data.clear()
+            self._generation += 1
+
+    def get_or_load(self, key, loader, ttl=None, cache_if=None, refresh_ahead=None):
+        """
+        캐시 조회 후 없으면 loader()로 값을 만들어 저장
+
+        Args:
+            key: 캐시 키
+            loader (callable): 값 생성 함수
+            ttl (float, optional): 항목별 만료 시간
+            cache_if (callable, optional): 값을 저장할지 판단하는 함수 (예: 오류 응답 제외)
+            refresh_ahead (float, optional): 만료까지 남은 시간이 이 값(초)보다 짧으면 백그라운드 갱신
+
+        Returns:
+            캐시된 값 또는 새로 로드한 값
+        """
+        refresh = False
+        with self._lock:
+            value = self._lookup(key)
+            generation = self._generation
+            if value is _MISSING:
+                key_lock = self._loading.setdefault(key, threading.Lock())
+            elif (refresh_ahead and key not in self._refreshing
+                    and self._data[key][0] - time.monotonic() < refresh_ahead):
+                self._refreshing.add(key)
+                refresh = True
+        if value is not _MISSING:
+            record_cache(self.name, True)
+            if refresh:
+                threading.Thread(
+                    target=self._refresh, args=(key, loader, ttl, cache_if, generation),
+                    name=f'cache-refresh-{self.name}', daemon=True
+                ).start()
+            return value
+
+        with key_lock:
+            # 다른 스레드가 먼저 로드했는지 확인
+            with self._lock:
+                value = self._lookup(key)
+                generation = self._generation
+            if value is not _MISSING:
+                record_cache(self.name, True)
+                return value
+
+            record_cache(self.name, False)
+            try:
+                value = loader()
+                if cache_if is None or cache_if(value):
+                    self.set(key, value, ttl, generation)
+                return value
+            finally:
+                with self._lock:
+                    if self._loading.get(key) is key_lock:
+                        del self._loading[key]
+
+    def _refresh(self, key, loader, ttl, cache_if, generation):
+        """백그라운드 갱신 (실패하면 기존 값이 만료될 때까지 유지)"""
+        try:
+            value = loader()
+            if cache_if is None or cache_if(value):
+                self.set(key, value, ttl, generation)
+        except Exception as e:
+            logger.error("캐시 백그라운드 갱신 실패 (%s): %s", self.name, e)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+
+class CacheManager:
+    """
+    이름별 TTL 캐시를 관리하는 싱글톤 클래스
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        """싱글톤 패턴 구현"""
+        if cls._instance is None:
+            cls._instance = super(CacheManager, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """캐시 관리자 초기화"""
+        if self._initialized:
+            return
+
+        self._caches = {}
+        self._lock = threading.Lock()
+        self._initialized = True
+
+    def get_cache(self, name, ttl=10, maxsize=1024):
+        """
+        이름에 해당하는 캐시 반환 (없으면 생성)
+
+        Args:
+            name (str): 캐시 이름
+            ttl (float): 기본 만료 시간 (초, 생성 시에만 적용)
+            maxsize (int): 최대 항목 수 (생성 시에만 적용)
+        """
+        cache = self._caches.get(name)
+        if cache is None:
+            with self._lock:
+                cache = self._caches.get(name)
+                if cache is None:
+                    cache = self._caches[name] = TTLCache(name, ttl, maxsize)
+        return cache
+
+    def clear_all(self):
+        """모든 캐시 비우기"""
+        for cache in list(self._caches.values()):
+            cache.clear()
@@ -3,6 +3,8 @@ from sqlite3 import Error
 import logging
 import os
 
+from utils.manager_metrics.manager_metrics import DB_QUERY_SECONDS, timed
+
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
@@ -47,7 +49,7 @@ class DBManager:
                 conn.close()
                 logger.info("데이터베이스 초기화 완료")
         except Error as e:
-            logger.error(f"데이터베이스 초기화 중 오류 발생: {e}")
+            logger.error("데이터베이스 초기화 중 오류 발생: %s", e)
     
     def get_connection(self):
         """
@@ -60,9 +62,10 @@ class DBManager:
             conn = sqlite3.connect(self.db_path)
             return conn
         except Error as e:
-            logger.error(f"데이터베이스 연결 중 오류 발생: {e}")
+            logger.error("데이터베이스 연결 중 오류 발생: %s", e)
             return None
     
+    @timed(DB_QUERY_SECONDS, 'sqlite', 'execute')
     def execute_query(self, query, params=None):
         """
         SQL 쿼리 실행 (INSERT, UPDATE, DELETE 등)
@@ -90,9 +93,10 @@ class DBManager:
             conn.close()
             return True
         except Error as e:
-            logger.error(f"쿼리 실행 중 오류 발생: {e}\n쿼리: {query}\n파라미터: {params}")
+            logger.error("쿼리 실행 중 오류 발생: %s\n쿼리: %s\n파라미터: %s", e, query, params)
             return False
     
+    @timed(DB_QUERY_SECONDS, 'sqlite', 'select')
     def execute_select(self, query, params=None):
         """
         SELECT 쿼리 실행 및 결과 반환
@@ -120,9 +124,10 @@ class DBManager:
             conn.close()
             return rows
         except Error as e:
-            logger.error(f"SELECT 쿼리 실행 중 오류 발생: {e}\n쿼리: {query}\n파라미터: {params}")
+            logger.error("SELECT 쿼리 실행 중 오류 발생: %s\n쿼리: %s\n파라미터: %s", e, query, params)
             return []
     
+    @timed(DB_QUERY_SECONDS, 'sqlite', 'select_one')
     def execute_select_one(self, query, params=None):
         """
         SELECT 쿼리 실행 및 단일 결과 반환
@@ -150,7 +155,7 @@ class DBManager:
             conn.close()
             return row
         except Error as e:
-            logger.error(f"SELECT 쿼리 실행 중 오류 발생: {e}\n쿼리: {query}\n파라미터: {params}")
+            logger.error("SELECT 쿼리 실행 중 오류 발생: %s\n쿼리: %s\n파라미터: %s", e, query, params)
             return None
     
     def get_table_columns(self, table_name):
@@ -175,5 +180,5 @@ class DBManager:
             conn.close()
             return columns
         except Error as e:
-            logger.error(f"테이블 컬럼 조회 중 오류 발생: {e}\n테이블: {table_name}")
+            logger.error("테이블 컬럼 조회 중 오류 발생: %s\n테이블: %s", e, table_name)
             return []
\ No newline at end of file
@@ -0,0 +1,172 @@
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+from datetime import datetime, timezone
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# LogRecord 기본 속성 (extra로 전달된 필드 구분용)
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    로그 레코드를 한 줄 JSON으로 변환하는 포매터
+    - logger.info("...", extra={'user_id': 1}) 형태의 추가 필드도 함께 기록
+    """
+
+    def format(self, record):
+        data = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'module': record.module,
+            'line': record.lineno,
+            'thread': record.threadName,
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith('_'):
+                data[key] = value
+        if record.exc_info:
+            data['exc_info'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            data['exc_info'] = record.exc_text
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """
+    메시지 인자만 확정하여 큐에 넣는 핸들러
+    - 포매팅(JSON 변환, 예외 트레이스백 문자열화)은 리스너 스레드에서 수행
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class LoggingManager:
+    """
+    애플리케이션 로깅 파이프라인을 관리하는 싱글톤 클래스
+    - 호출 스레드는 큐에 레코드만 넣고(QueueHandler), 파일/콘솔 기록은 백그라운드 리스너가 담당
+    - 크기(RotatingFileHandler) 또는 시간(TimedRotatingFileHandler) 기준 로그 순환
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        """싱글톤 패턴 구현"""
+        if cls._instance is None:
+            cls._instance = super(LoggingManager, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """로깅 관리자 초기화"""
+        if self._initialized:
+            return
+
+        self.listener = None
+        self.queue_handler = None
+        atexit.register(self.shutdown)
+        self._initialized = True
+
+    def configure(self, level='INFO', log_file='app.log', log_format='text',
+                  max_bytes=10 * 1024 * 1024, backup_count=5, rotate_when=None, console=True):
+        """
+        루트 로거에 큐 기반 로깅 파이프라인 설정 (재호출 시 기존 설정 교체)
+
+        Args:
+            level (str): 로그 레벨
+            log_file (str): 로그 파일 경로 (None이면 파일 기록 안 함)
+            log_format (str): 'text' 또는 'json'
+            max_bytes (int): 크기 기준 순환 시 파일 최대 크기
+            backup_count (int): 보관할 이전 로그 파일 수
+            rotate_when (str, optional): 시간 기준 순환 주기 ('midnight', 'H' 등, 지정 시 크기 기준 대신 사용)
+            console (bool): 콘솔 출력 여부
+        """
+        self.shutdown()
+
+        formatter = JsonFormatter() if str(log_format).lower() == 'json' else logging.Formatter(TEXT_FORMAT)
+        handlers = []
+
+        if log_file:
+            log_dir = os.path.dirname(log_file)
+            if log_dir and not os.path.exists(log_dir):
+                os.makedirs(log_dir)
+
+            if rotate_when:
+                file_handler = logging.handlers.TimedRotatingFileHandler(
+                    log_file, when=rotate_when, backupCount=backup_count, encoding='utf-8'
+                )
+            else:
+                file_handler = logging.handlers.RotatingFileHandler(
+                    log_file, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8'
+                )
+            handlers.append(file_handler)
+
+        if console:
+            handlers.append(logging.StreamHandler())
+
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        log_queue = queue.SimpleQueue()
+        self.queue_handler = _QueueHandler(log_queue)
+        self.listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.addHandler(self.queue_handler)
+        root.setLevel(level)
+
+        self.listener.start()
+        return self
+
+    def configure_from_config(self, config):
+        """
+        설정 객체(config.Config 또는 app.config)의 LOG_* 값으로 로깅 설정
+
+        Args:
+            config: 속성 또는 키로 LOG_* 값을 제공하는 객체
+        """
+        def get(name, default=None):
+            if isinstance(config, dict):
+                return config.get(name, default)
+            return getattr(config, name, default)
+
+        return self.configure(
+            level=get('LOG_LEVEL', 'INFO'),
+            log_file=get('LOG_FILE', 'app.log'),
+            log_format=get('LOG_FORMAT', 'text'),
+            max_bytes=int(get('LOG_MAX_BYTES', 10 * 1024 * 1024)),
+            backup_count=int(get('LOG_BACKUP_COUNT', 5)),
+            rotate_when=get('LOG_ROTATE_WHEN') or None,
+        )
+
+    def shutdown(self):
+        """백그라운드 리스너 종료 (큐에 남은 레코드 기록 후 파일 닫기)"""
+        if self.listener is None:
+            return
+
+        root = logging.getLogger()
+        if self.queue_handler in root.handlers:
+            root.removeHandler(self.queue_handler)
+
+        self.listener.stop()
+        for handler in self.listener.handlers:
+            handler.close()
+
+        self.listener = None
+        self.queue_handler = None
@@ -0,0 +1,413 @@
+import bisect
+import functools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 기본 지연시간 버킷 (초)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=None):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _CounterChild:
+    __slots__ = ('value', '_lock')
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+
+
+class _GaugeChild:
+    __slots__ = ('value', '_lock')
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value):
+        self.value = value
+
+    def inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount=1):
+        with self._lock:
+            self.value -= amount
+
+    def set_to_current_time(self):
+        self.value = time.time()
+
+
+class _HistogramChild:
+    __slots__ = ('bounds', 'counts', 'sum', 'count', '_lock')
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        # 마지막 칸은 +Inf 버킷
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        index = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    @contextmanager
+    def time(self):
+        """블록 실행 시간 관측"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+
+class _Metric:
+    """레이블별 자식 값을 보관하는 메트릭 기본 클래스"""
+
+    metric_type = None
+
+    def __init__(self, name, documentation, label_names=()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._children = {}
+        self._lock = threading.Lock()
+        if not self.label_names:
+            self._default = self.labels()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values):
+        """
+        레이블 값에 해당하는 자식 메트릭 반환 (핫패스에서는 반환값을 캐싱하여 재사용)
+
+        Args:
+            *values: label_names 순서의 레이블 값
+        """
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.label_names):
+                raise ValueError(f"{self.name}: 레이블 개수가 맞지 않습니다. {self.label_names}")
+            with self._lock:
+                child = self._children.get(values)
+                if child is None:
+                    child = self._children[values] = self._new_child()
+        return child
+
+    def render(self):
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.metric_type}",
+        ]
+        for values, child in list(self._children.items()):
+            lines.extend(self._render_child(values, child))
+        return lines
+
+    def _render_child(self, values, child):
+        return [f"{self.name}{_format_labels(self.label_names, values)} {_format_value(child.value)}"]
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    metric_type = 'counter'
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount=1):
+        self._default.inc(amount)
+
+
+class Gauge(_Metric):
+    """임의 값 게이지"""
+
+    metric_type = 'gauge'
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def set(self, value):
+        self._default.set(value)
+
+    def inc(self, amount=1):
+        self._default.inc(amount)
+
+    def dec(self, amount=1):
+        self._default.dec(amount)
+
+
+class Histogram(_Metric):
+    """고정 버킷 히스토그램"""
+
+    metric_type = 'histogram'
+
+    def __init__(self, name, documentation, label_names=(), buckets=DEFAULT_BUCKETS):
+        self.bounds = tuple(sorted(buckets))
+        super().__init__(name, documentation, label_names)
+
+    def _new_child(self):
+        return _HistogramChild(self.bounds)
+
+    def observe(self, value):
+        self._default.observe(value)
+
+    def time(self):
+        return self._default.time()
+
+    def _render_child(self, values, child):
+        lines = []
+        cumulative = 0
+        with child._lock:
+            counts = list(child.counts)
+            total, count = child.sum, child.count
+        for bound, bucket_count in zip(self.bounds + (float('inf'),), counts):
+            cumulative += bucket_count
+            le = f'le="{_format_value(bound)}"'
+            lines.append(f"{self.name}_bucket{_format_labels(self.label_names, values, le)} {cumulative}")
+        labels = _format_labels(self.label_names, values)
+        lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+        lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class MetricsManager:
+    """
+    애플리케이션 메트릭(카운터/게이지/히스토그램)을 관리하는 싱글톤 클래스
+    - Prometheus 텍스트 형식으로 노출
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        """싱글톤 패턴 구현"""
+        if cls._instance is None:
+            cls._instance = super(MetricsManager, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """메트릭 관리자 초기화"""
+        if self._initialized:
+            return
+
+        self._metrics = {}
+        self._lock = threading.Lock()
+        self._initialized = True
+
+    def _get_or_create(self, cls, name, documentation, label_names, **kwargs):
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(name)
+                if metric is None:
+                    metric = self._metrics[name] = cls(name, documentation, label_names, **kwargs)
+        elif not isinstance(metric, cls):
+            raise ValueError(f"{name} 메트릭이 다른 타입으로 이미 등록되어 있습니다.")
+        return metric
+
+    def counter(self, name, documentation, label_names=()):
+        """카운터 조회 또는 생성"""
+        return self._get_or_create(Counter, name, documentation, label_names)
+
+    def gauge(self, name, documentation, label_names=()):
+        """게이지 조회 또는 생성"""
+        return self._get_or_create(Gauge, name, documentation, label_names)
+
+    def histogram(self, name, documentation, label_names=(), buckets=DEFAULT_BUCKETS):
+        """히스토그램 조회 또는 생성"""
+        return self._get_or_create(Histogram, name, documentation, label_names, buckets=buckets)
+
+    def render(self):
+        """
+        Prometheus 텍스트 노출 형식으로 변환
+
+        Returns:
+            str: 메트릭 텍스트
+        """
+        lines = []
+        for name in sorted(self._metrics):
+            lines.extend(self._metrics[name].render())
+        return "\n".join(lines) + "\n"
+
+
+# ------ 공용 메트릭 ------
+
+metrics = MetricsManager()
+
+UPBIT_REQUEST_SECONDS = metrics.histogram(
+    'upbit_request_seconds', "업비트 API 요청 소요 시간", ('group',)
+)
+UPBIT_REQUEST_ERRORS = metrics.counter(
+    'upbit_request_errors_total', "업비트 API 요청 실패 횟수", ('group',)
+)
+DB_QUERY_SECONDS = metrics.histogram(
+    'db_query_seconds', "DB 쿼리 소요 시간", ('source', 'operation')
+)
+INDICATOR_SECONDS = metrics.histogram(
+    'indicator_seconds', "기술적 지표/전략 신호 계산 소요 시간", ('indicator',)
+)
+JOB_SECONDS = metrics.histogram(
+    'scheduler_job_seconds', "스케줄러 작업 소요 시간", ('job',)
+)
+JOB_RUNS = metrics.counter(
+    'scheduler_job_runs_total', "스케줄러 작업 실행 횟수", ('job', 'status')
+)
+JOB_LAST_SUCCESS = metrics.gauge(
+    'scheduler_job_last_success_timestamp_seconds', "스케줄러 작업 마지막 성공 시각", ('job',)
+)
+JOB_OVERRUNS = metrics.counter(
+    'scheduler_job_overruns_total', "스케줄러 작업 시간 초과 횟수 (interval: 실행 주기 초과, deadline: 마감 시간 도달)", ('job', 'reason')
+)
+JOB_SKIPPED = metrics.counter(
+    'scheduler_job_skipped_total', "실행되지 않은 스케줄러 작업 횟수 (misfire / max_instances)", ('job', 'reason')
+)
+JOB_DEFERRED_USERS = metrics.counter(
+    'scheduler_job_deferred_users_total', "마감 시간 초과로 다음 실행에 이월된 사용자 수", ('job',)
+)
+CACHE_REQUESTS = metrics.counter(
+    'cache_requests_total', "캐시 조회 횟수 (hit/miss)", ('cache', 'result')
+)
+RATE_LIMIT_WAIT_SECONDS = metrics.histogram(
+    'rate_limiter_wait_seconds', "요청 제한으로 대기한 시간", ('limiter',)
+)
+MARKET_FEED_CLIENTS = metrics.gauge(
+    'market_feed_clients', "실시간 시세 스트림 구독 클라이언트 수"
+)
+MARKET_FEED_UPDATES = metrics.counter(
+    'market_feed_updates_total', "실시간 시세 업데이트 수 (sent/coalesced)", ('result',)
+)
+
+
+def timed(histogram, *label_values):
+    """
+    함수 실행 시간을 히스토그램에 기록하는 데코레이터
+
+    Args:
+        histogram (Histogram): 기록할 히스토그램
+        *label_values: 레이블 값
+    """
+    child = histogram.labels(*label_values)
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                child.observe(time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def record_cache(cache_name, hit):
+    """캐시 조회 결과 기록"""
+    CACHE_REQUESTS.labels(cache_name, 'hit' if hit else 'miss').inc()
+
+
+def run_job(job_name, func, *args, **kwargs):
+    """
+    스케줄러 작업 실행 및 소요 시간/성공 여부 기록
+
+    Args:
+        job_name (str): 작업 이름
+        func (callable): 실행할 함수
+    """
+    start = time.perf_counter()
+    try:
+        result = func(*args, **kwargs)
+        JOB_RUNS.labels(job_name, 'success').inc()
+        JOB_LAST_SUCCESS.labels(job_name).set_to_current_time()
+        return result
+    except Exception:
+        JOB_RUNS.labels(job_name, 'error').inc()
+        raise
+    finally:
+        JOB_SECONDS.labels(job_name).observe(time.perf_counter() - start)
+
+
+def upbit_endpoint_group(path):
+    """
+    API 경로에서 엔드포인트 그룹 추출 (예: /v1/orders/chance → orders)
+
+    Args:
+        path (str): 요청 URL 또는 경로
+    """
+    path = path.split('://', 1)[-1]
+    parts = [part for part in path.split('?', 1)[0].split('/') if part]
+    try:
+        segment = parts[parts.index('v1') + 1]
+    except (ValueError, IndexError):
+        return 'other'
+    return {'order': 'orders', 'deposit': 'deposits', 'withdraw': 'withdraws'}.get(segment, segment)
+
+
+def observe_upbit_response(response, *args, **kwargs):
+    """requests 응답 훅: 업비트 API 요청 시간/실패 기록"""
+    group = upbit_endpoint_group(response.url)
+    UPBIT_REQUEST_SECONDS.labels(group).observe(response.elapsed.total_seconds())
+    if response.status_code >= 400:
+        UPBIT_REQUEST_ERRORS.labels(group).inc()
+
+
+def instrument_sqlalchemy(engine):
+    """
+    SQLAlchemy 엔진에 쿼리 시간 측정 이벤트 등록
+
+    Args:
+        engine (Engine): SQLAlchemy 엔진
+    """
+    from sqlalchemy import event
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('query_start', []).append((statement, time.perf_counter()))
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        _, start = conn.info['query_start'].pop()
+        operation = statement.lstrip().split(None, 1)[0].lower() if statement.strip() else 'other'
+        DB_QUERY_SECONDS.labels('sqlalchemy', operation).observe(time.perf_counter() - start)
+
+    @event.listens_for(engine, 'handle_error')
+    def _error(exception_context):
+        # 실패한 문장은 after_cursor_execute가 호출되지 않으므로 시작 시각을 버려 이후 쿼리와 어긋나지 않게 함
+        # (before_cursor_execute 전에 실패한 경우는 쌓인 항목이 없으므로 같은 문장일 때만 버림)
+        conn = exception_context.connection
+        starts = conn.info.get('query_start') if conn is not None else None
+        if starts and starts[-1][0] == exception_context.statement:
+            starts.pop()
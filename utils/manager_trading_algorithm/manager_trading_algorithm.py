@@ -2,6 +2,8 @@ import logging
 import numpy as np
 import pandas as pd
 
+from utils.manager_metrics.manager_metrics import INDICATOR_SECONDS, timed
+
 logger = logging.getLogger(__name__)
 
 class TradingAlgorithmManager:
@@ -12,6 +14,18 @@ class TradingAlgorithmManager:
     
     _instance = None
     
+    # 전략 → 매매 신호 생성 메서드 이름
+    STRATEGY_HANDLERS = {
+        'rsi_oversold': '_rsi_strategy',
+        'macd_crossover': '_macd_strategy',
+        'bollinger_bands': '_bollinger_bands_strategy',
+        'swing_trading': '_swing_trading_strategy',
+        'trend_following': '_trend_following_strategy',
+        'average_price': '_average_price_strategy',
+        'momentum_trading': '_momentum_strategy',
+        'scalping': '_scalping_strategy',
+    }
+    
     def __new__(cls, *args, **kwargs):
         """싱글톤 패턴 구현"""
         if cls._instance is None:
@@ -79,43 +93,35 @@ class TradingAlgorithmManager:
         
         Args:
             strategy (str): 사용할 전략 이름
-            ohlcv_data (pandas.DataFrame): OHLCV 데이터
+            ohlcv_data (pandas.DataFrame | np.ndarray): OHLCV 데이터 (DataFrame 또는 candle_dtype 구조화 배열)
             parameters (dict, optional): 전략별 파라미터 (없으면 기본값 사용)
             
         Returns:
             dict: 매매 신호 정보 (action, reason, confidence)
         """
         if strategy not in self.available_strategies:
-            logger.warning(f"지원하지 않는 전략입니다: {strategy}")
+            logger.warning("지원하지 않는 전략입니다: %s", strategy)
             return None
+        
+        # 구조화 배열/링 버퍼는 전략이 사용하는 종가만 Series로 변환
+        if not isinstance(ohlcv_data, pd.DataFrame):
+            ohlcv_data = pd.DataFrame({'close': np.asarray(ohlcv_data['close'], dtype=np.float64)})
             
         # 파라미터 설정
         params = self.default_parameters[strategy].copy()
         if parameters:
             params.update(parameters)
             
-        # 전략별 매매 신호 생성
-        if strategy == 'rsi_oversold':
-            return self._rsi_strategy(ohlcv_data, params)
-        elif strategy == 'macd_crossover':
-            return self._macd_strategy(ohlcv_data, params)
-        elif strategy == 'bollinger_bands':
-            return self._bollinger_bands_strategy(ohlcv_data, params)
-        elif strategy == 'swing_trading':
-            return self._swing_trading_strategy(ohlcv_data, params)
-        elif strategy == 'trend_following':
-            return self._trend_following_strategy(ohlcv_data, params)
-        elif strategy == 'average_price':
-            return self._average_price_strategy(ohlcv_data, params)
-        elif strategy == 'momentum_trading':
-            return self._momentum_strategy(ohlcv_data, params)
-        elif strategy == 'scalping':
-            return self._scalping_strategy(ohlcv_data, params)
-        
-        return None
+        # 전략별 매매 신호 생성 (구현되지 않은 전략은 신호 없음)
+        handler = getattr(self, self.STRATEGY_HANDLERS[strategy], None)
+        if handler is None:
+            logger.debug("구현되지 않은 전략입니다: %s", strategy)
+            return None
+        return handler(ohlcv_data, params)
     
     # ------ 기술적 지표 계산 함수들 ------
     
+    @timed(INDICATOR_SECONDS, 'rsi')
     def calculate_rsi(self, prices, period=14):
         """
         상대강도지수(RSI) 계산
@@ -151,9 +157,10 @@ class TradingAlgorithmManager:
             # 마지막 값 반환
             return rsi.iloc[-1]
         except Exception as e:
-            logger.error(f"RSI 계산 중 오류 발생: {e}")
+            logger.error("RSI 계산 중 오류 발생: %s", e)
             return 50  # 오류 발생 시 중립값 반환
     
+    @timed(INDICATOR_SECONDS, 'macd')
     def calculate_macd(self, prices, fast_period=12, slow_period=26, signal_period=9):
         """
         이동평균수렴발산(MACD) 계산
@@ -185,6 +192,6 @@ class TradingAlgorithmManager:
             
             return macd_line.values, signal_line.values, macd_histogram.values
         except Exception as e:
-            logger.error(f"MACD 계산 중 오류 발생: {e}")
+            logger.error("MACD 계산 중 오류 발생: %s", e)
             return np.zeros(len(prices)), np.zeros(len(prices)), np.zeros(len(prices))
     
@@ -0,0 +1,13 @@
+"""
+시세 데이터 패키지
+- __slots__ 레코드 타입 (TickerVolume, Candle)
+- 고정 크기 캔들 링 버퍼 (CandleRingBuffer)
+- (티커, 인터벌)별 링 버퍼 저장소 (CandleStore)
+- 1분 캔들 기반 다중 타임프레임 리샘플링 (resample, TimeframeResampler)
+- 캔들/체결/호가 스냅샷 디스크 아카이브 (MarketDataArchive)
+"""
+from .records import TickerVolume, Candle
+from .ring_buffer import CandleRingBuffer
+from .resampler import TIMEFRAMES, bucket_start, resample, TimeframeResampler
+from .candle_store import CandleStore
+from .archive import MarketDataArchive, orderbook_snapshot_dtype
@@ -0,0 +1,370 @@
+"""
+시세 아카이브 (열 지향 디스크 저장소)
+- 캔들/체결/호가 스냅샷을 (데이터셋, 마켓, KST 날짜)별 .npy 파일 1개에 구조화 배열로 이어 붙여 저장
+  (파일은 표준 .npy 형식이므로 np.load(path, mmap_mode='r')로 바로 메모리 매핑 가능)
+- manifest.json에 파티션별 행 수와 시각 범위를 기록하고, 조회 시 범위 밖 파티션은 열지 않음
+  (batch() 안의 추가는 매니페스트를 마지막에 한 번만 저장)
+- 파티션 안에서는 time 정렬 순서를 이용해 searchsorted로 구간만 잘라 반환 (메모리 매핑 뷰, 복사 없음)
+- 쓰기는 프로세스 1개(워커의 market_archive 작업)에서 한다고 가정 (읽기는 여러 프로세스 가능)
+
+디렉터리 구조:
+    {root}/manifest.json
+    {root}/candles/minute1/KRW-BTC/20240102.npy
+    {root}/trades/KRW-BTC/20240102.npy
+    {root}/orderbook/KRW-BTC/20240102.npy
+"""
+import contextlib
+import functools
+import json
+import logging
+import os
+import struct
+import threading
+from datetime import datetime, timedelta, timezone
+
+from utils.upbit_api.utils.decoding import candle_dtype, trade_dtype, KST_OFFSET_MS
+
+logger = logging.getLogger(__name__)
+
+DAY_MS = 24 * 60 * 60 * 1000
+# 호가 스냅샷에 저장하는 호가 단위 수 (부족하면 NaN, 넘치면 버림)
+ORDERBOOK_DEPTH = 15
+# .npy 헤더 여유 공간 (행 수 자릿수가 늘어도 헤더 크기가 바뀌지 않도록)
+HEADER_SLACK = 32
+
+KST = timezone(timedelta(hours=9))
+
+
+@functools.lru_cache(maxsize=None)
+def orderbook_snapshot_dtype(depth=ORDERBOOK_DEPTH):
+    """
+    호가 스냅샷 구조화 dtype
+    - time: 스냅샷 시각 (KST 벽시계 기준 epoch 밀리초)
+    - total_ask_size/total_bid_size: float64
+    - ask_price/bid_price/ask_size/bid_size: 호가 단위별 float64 (depth,)
+    """
+    import numpy as np
+    return np.dtype(
+        [('time', '<i8'), ('total_ask_size', '<f8'), ('total_bid_size', '<f8')]
+        + [(name, '<f8', (depth,)) for name in ('ask_price', 'bid_price', 'ask_size', 'bid_size')]
+    )
+
+
+def orderbook_snapshots(book, depth=ORDERBOOK_DEPTH):
+    """
+    decode_orderbooks 결과 1개 마켓을 스냅샷 배열(1행)로 변환
+
+    Args:
+        book (dict): {'timestamp', 'total_ask_size', 'total_bid_size', 'units': orderbook_dtype 배열}
+        depth (int): 저장할 호가 단위 수
+
+    Returns:
+        np.ndarray: orderbook_snapshot_dtype 배열
+    """
+    import numpy as np
+
+    out = np.zeros(1, dtype=orderbook_snapshot_dtype(depth))
+    out['time'] = int(book['timestamp']) + KST_OFFSET_MS
+    out['total_ask_size'] = book.get('total_ask_size') or 0.0
+    out['total_bid_size'] = book.get('total_bid_size') or 0.0
+    units = book['units'][:depth]
+    for name in ('ask_price', 'bid_price', 'ask_size', 'bid_size'):
+        out[name] = np.nan
+        out[name][0, :len(units)] = units[name]
+    return out
+
+
+def to_time(value):
+    """
+    조회 범위 시각을 KST 벽시계 기준 epoch 밀리초로 변환
+
+    Args:
+        value (int | str | datetime): epoch 밀리초(KST 벽시계 기준) 또는 시각 (시간대가 없으면 KST로 간주)
+
+    Returns:
+        int: epoch 밀리초 (None이면 None)
+    """
+    if value is None or isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if value.tzinfo is not None:
+        value = value.astimezone(KST).replace(tzinfo=None)
+    return int(value.replace(tzinfo=timezone.utc).timestamp() * 1000)
+
+
+def _day(time_ms):
+    """시각이 속한 KST 날짜 (YYYYMMDD)"""
+    return datetime.fromtimestamp(time_ms // DAY_MS * 86400, tz=timezone.utc).strftime('%Y%m%d')
+
+
+class MarketDataArchive:
+    """
+    시세 아카이브
+
+    - 데이터셋: 'candles/<인터벌>', 'trades', 'orderbook'
+    - 같은 파티션에 이어 붙일 때 이미 저장된 마지막 행보다 오래된 행은 버림
+      (캔들은 같은 시각이면 마지막 행을 덮어씀, 체결은 (time, sequential_id) 기준)
+    """
+
+    MANIFEST = 'manifest.json'
+
+    def __init__(self, root):
+        """
+        Args:
+            root (str): 아카이브 디렉터리
+        """
+        self.root = root
+        self._manifest = None
+        self._manifest_mtime = None
+        self._pending = None   # batch() 중 아직 저장하지 않은 매니페스트
+        self._lock = threading.RLock()
+
+    # 매니페스트
+    def _manifest_path(self):
+        return os.path.join(self.root, self.MANIFEST)
+
+    def manifest(self):
+        """
+        매니페스트 조회 (다른 프로세스가 갱신했으면 다시 읽음)
+
+        Returns:
+            dict: {데이터셋: {마켓: {날짜: {'rows', 'start', 'end'}}}}
+        """
+        with self._lock:
+            if self._pending is not None:
+                return self._pending
+        path = self._manifest_path()
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return self._manifest if self._manifest is not None else {}
+        with self._lock:
+            if self._manifest is None or mtime != self._manifest_mtime:
+                with open(path, encoding='utf-8') as f:
+                    self._manifest = json.load(f).get('datasets', {})
+                self._manifest_mtime = mtime
+            return self._manifest
+
+    def _save_manifest(self, datasets):
+        path = self._manifest_path()
+        temp = f"{path}.{os.getpid()}.tmp"
+        with open(temp, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'datasets': datasets}, f, separators=(',', ':'), sort_keys=True)
+        os.replace(temp, path)
+        self._manifest = datasets
+        self._manifest_mtime = os.stat(path).st_mtime_ns
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        여러 append를 묶어 매니페스트를 마지막에 한 번만 저장 (배치 중 다른 스레드의 추가/조회는 대기)
+
+            with archive.batch():
+                for market in markets:
+                    archive.append_candles(market, 'minute1', candles[market])
+        """
+        with self._lock:
+            if self._pending is not None:
+                # 중첩된 batch()는 바깥 배치에서 저장
+                yield self
+                return
+            self._pending = json.loads(json.dumps(self.manifest()))
+            try:
+                yield self
+            finally:
+                datasets, self._pending = self._pending, None
+                self._save_manifest(datasets)
+
+    def _partition_path(self, dataset, market, day):
+        return os.path.join(self.root, *dataset.split('/'), market, f"{day}.npy")
+
+    # .npy 파일
+    @staticmethod
+    def _write_header(f, dtype, rows, size=None):
+        """
+        .npy 1.0 헤더 기록 (size를 주면 그 크기에 맞춰 채움)
+
+        Returns:
+            int: 헤더 크기 (데이터 시작 위치)
+        """
+        import numpy as np
+
+        header = repr({'descr': np.lib.format.dtype_to_descr(dtype), 'fortran_order': False, 'shape': (rows,)})
+        if size is None:
+            size = -(-(10 + len(header) + HEADER_SLACK + 1) // 64) * 64
+        padding = size - 10 - len(header) - 1
+        if padding < 0:
+            raise ValueError("아카이브 파일 헤더 공간이 부족합니다.")
+        f.seek(0)
+        f.write(np.lib.format.magic(1, 0))
+        f.write(struct.pack('<H', size - 10))
+        f.write((header + ' ' * padding + '\n').encode('latin1'))
+        return size
+
+    @staticmethod
+    def _read_header(f):
+        """.npy 헤더 읽기 → (행 수, dtype, 데이터 시작 위치)"""
+        import numpy as np
+
+        f.seek(0)
+        np.lib.format.read_magic(f)
+        shape, _, dtype = np.lib.format.read_array_header_1_0(f)
+        return shape[0], dtype, f.tell()
+
+    def _append_partition(self, path, rows, entry, replace_last):
+        """
+        파티션 파일에 행 추가
+
+        Returns:
+            tuple: (추가된 행 수(덮어쓴 행 제외), 파티션 전체 행 수)
+        """
+        import numpy as np
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        stored = entry['rows'] if entry else 0
+        mode = 'r+b' if stored and os.path.exists(path) else 'w+b'
+        with open(path, mode) as f:
+            if mode == 'w+b':
+                stored = 0
+                offset = self._write_header(f, rows.dtype, 0)
+            else:
+                _, dtype, offset = self._read_header(f)
+                if dtype != rows.dtype:
+                    raise ValueError(f"아카이브 파티션 형식이 다릅니다: {path}")
+            itemsize = rows.dtype.itemsize
+
+            if stored:
+                f.seek(offset + (stored - 1) * itemsize)
+                last = np.frombuffer(f.read(itemsize), dtype=rows.dtype)[0]
+                if replace_last:
+                    same = rows[rows['time'] == last['time']]
+                    if len(same):
+                        f.seek(offset + (stored - 1) * itemsize)
+                        f.write(same[-1:].tobytes())
+                    rows = rows[rows['time'] > last['time']]
+                elif 'sequential_id' in rows.dtype.names:
+                    rows = rows[(rows['time'] > last['time'])
+                                | ((rows['time'] == last['time']) & (rows['sequential_id'] > last['sequential_id']))]
+                else:
+                    rows = rows[rows['time'] > last['time']]
+
+            # 헤더의 행 수 뒤에 남은 바이트(중단된 쓰기)는 덮어씀
+            f.seek(offset + stored * itemsize)
+            f.truncate()
+            f.write(rows.tobytes())
+            self._write_header(f, rows.dtype, stored + len(rows), offset)
+            return len(rows), stored + len(rows)
+
+    def append(self, dataset, market, rows):
+        """
+        시각 순 구조화 배열을 날짜별 파티션에 추가
+
+        Args:
+            dataset (str): 'candles/<인터벌>', 'trades', 'orderbook'
+            market (str): 마켓 코드
+            rows (np.ndarray): time 필드가 있는 구조화 배열 (오래된 순)
+
+        Returns:
+            int: 추가된 행 수
+        """
+        import numpy as np
+
+        if rows is None or len(rows) == 0:
+            return 0
+        replace_last = dataset.startswith('candles/')
+        days = rows['time'] // DAY_MS
+        bounds = np.flatnonzero(np.concatenate(([True], days[1:] != days[:-1], [True])))
+
+        appended = 0
+        with self._lock:
+            batching = self._pending is not None
+            datasets = self._pending if batching else json.loads(json.dumps(self.manifest()))
+            partitions = datasets.setdefault(dataset, {}).setdefault(market, {})
+            for begin, end in zip(bounds[:-1], bounds[1:]):
+                day = _day(int(rows['time'][begin]))
+                entry = partitions.get(day)
+                count, total = self._append_partition(
+                    self._partition_path(dataset, market, day), rows[begin:end], entry, replace_last
+                )
+                appended += count
+                if total:
+                    partitions[day] = {
+                        'rows': total,
+                        'start': entry['start'] if entry else int(rows['time'][begin]),
+                        'end': max(int(rows['time'][end - 1]), entry['end'] if entry else 0),
+                    }
+            if not batching:
+                self._save_manifest(datasets)
+        return appended
+
+    def append_candles(self, market, interval, candles):
+        """캔들 추가 (candle_dtype 배열)"""
+        return self.append(f"candles/{interval}", market, candles)
+
+    def append_trades(self, market, trades):
+        """체결 추가 (trade_dtype 배열)"""
+        return self.append('trades', market, trades)
+
+    def append_orderbook(self, market, book, depth=ORDERBOOK_DEPTH):
+        """호가 스냅샷 추가 (decode_orderbooks 결과 1개 마켓)"""
+        return self.append('orderbook', market, orderbook_snapshots(book, depth))
+
+    # 조회
+    def markets(self, dataset):
+        """데이터셋에 저장된 마켓 목록"""
+        return sorted(self.manifest().get(dataset, {}))
+
+    def partitions(self, dataset, market, start=None, end=None):
+        """
+        시각 범위와 겹치는 파티션 (매니페스트만 사용, 파일을 열지 않음)
+
+        Returns:
+            list: [(날짜, {'rows', 'start', 'end'}), ...] (날짜순)
+        """
+        start, end = to_time(start), to_time(end)
+        entries = self.manifest().get(dataset, {}).get(market, {})
+        return [
+            (day, entry) for day, entry in sorted(entries.items())
+            if (start is None or entry['end'] >= start) and (end is None or entry['start'] <= end)
+        ]
+
+    def iter_arrays(self, dataset, market, start=None, end=None):
+        """
+        시각 범위의 파티션별 메모리 매핑 배열 (start <= time <= end, 복사 없음)
+
+        Yields:
+            np.ndarray: 구조화 배열 뷰 (오래된 순)
+        """
+        import numpy as np
+
+        start, end = to_time(start), to_time(end)
+        for day, entry in self.partitions(dataset, market, start, end):
+            array = np.load(self._partition_path(dataset, market, day), mmap_mode='r')[:entry['rows']]
+            times = array['time']
+            begin = 0 if start is None or entry['start'] >= start else int(np.searchsorted(times, start, 'left'))
+            stop = len(array) if end is None or entry['end'] <= end else int(np.searchsorted(times, end, 'right'))
+            if stop > begin:
+                yield array[begin:stop]
+
+    def read(self, dataset, market, start=None, end=None):
+        """
+        시각 범위 조회 (파티션을 이어 붙인 사본)
+
+        Returns:
+            np.ndarray: 구조화 배열 (오래된 순, 없으면 빈 배열)
+        """
+        import numpy as np
+
+        arrays = list(self.iter_arrays(dataset, market, start, end))
+        if arrays:
+            return np.concatenate(arrays)
+        if dataset.startswith('candles/'):
+            return np.empty(0, dtype=candle_dtype())
+        if dataset == 'trades':
+            return np.empty(0, dtype=trade_dtype())
+        return np.empty(0, dtype=orderbook_snapshot_dtype())
+
+    def read_candles(self, market, interval, start=None, end=None):
+        """캔들 시각 범위 조회 (candle_dtype 배열)"""
+        return self.read(f"candles/{interval}", market, start, end)
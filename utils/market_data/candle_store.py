@@ -0,0 +1,234 @@
+"""
+캔들 저장소
+- (티커, 인터벌)별 CandleRingBuffer를 보관하는 프로세스 공용 저장소
+- max_age 안에 갱신된 버퍼에 충분한 캔들이 있으면 거래소 조회 없이 최근 구간 반환
+  (자동 매매/추천이 사용자마다 같은 티커의 캔들을 다시 조회하지 않음)
+- 티커별 TimeframeResampler로 1분 캔들 1회 조회만으로 상위 타임프레임 구간을 함께 갱신
+"""
+import logging
+import threading
+import time
+
+from .ring_buffer import CandleRingBuffer
+from .resampler import DEFAULT_TIMEFRAMES, KST_OFFSET_MS, MINUTE_MS, TIMEFRAMES, TimeframeResampler, bucket_start
+
+logger = logging.getLogger(__name__)
+
+
+class CandleStore:
+    """
+    캔들 저장소 (싱글톤)
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        """싱글톤 패턴 구현"""
+        if cls._instance is None:
+            cls._instance = super(CandleStore, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """캔들 저장소 초기화"""
+        if self._initialized:
+            return
+
+        self.capacity = 500
+        self.max_age = 30
+        self.timeframes = DEFAULT_TIMEFRAMES
+        self._buffers = {}
+        self._resamplers = {}   # 티커 → TimeframeResampler
+        self._lock = threading.Lock()
+        self._loading = {}   # (티커, 인터벌) → 조회 중 잠금
+        self._initialized = True
+
+    def configure(self, capacity=None, max_age=None, timeframes=None):
+        """
+        저장소 설정
+
+        Args:
+            capacity (int, optional): 버퍼당 최대 캔들 수 (이후 생성되는 버퍼부터 적용)
+            max_age (float, optional): 버퍼를 거래소 조회 없이 사용할 최대 시간 (초)
+            timeframes (tuple, optional): 1분 캔들로 유지할 상위 타임프레임 (이후 생성되는 리샘플러부터 적용)
+        """
+        if capacity is not None:
+            self.capacity = capacity
+        if max_age is not None:
+            self.max_age = max_age
+        if timeframes is not None:
+            self.timeframes = tuple(timeframes)
+        return self
+
+    def configure_from_config(self, config):
+        """app.config 값으로 설정"""
+        timeframes = config.get('CANDLE_RESAMPLE_TIMEFRAMES')
+        if isinstance(timeframes, str):
+            timeframes = [name.strip() for name in timeframes.split(',') if name.strip()]
+        return self.configure(
+            capacity=config.get('CANDLE_STORE_CAPACITY', 500),
+            max_age=config.get('CANDLE_STORE_MAX_AGE', 30),
+            timeframes=timeframes or None,
+        )
+
+    def buffer(self, ticker, interval):
+        """(티커, 인터벌) 버퍼 조회 (없으면 생성)"""
+        key = (ticker, interval)
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            with self._lock:
+                buffer = self._buffers.get(key)
+                if buffer is None:
+                    buffer = self._buffers[key] = CandleRingBuffer(self.capacity)
+        return buffer
+
+    def get(self, ticker, interval):
+        """버퍼 조회 (없으면 None)"""
+        return self._buffers.get((ticker, interval))
+
+    def update(self, ticker, interval, candles):
+        """캔들 배열 병합 (오래된 순 candle_dtype 배열)"""
+        self.buffer(ticker, interval).extend(candles)
+
+    def window(self, ticker, interval, count, loader):
+        """
+        최근 count개 캔들 조회
+
+        Args:
+            ticker (str): 티커
+            interval (str): 캔들 간격
+            count (int): 캔들 수
+            loader (callable): loader(count) → candle_dtype 배열 또는 None (거래소 조회)
+
+        Returns:
+            np.ndarray: candle_dtype 배열 (오래된 순, 조회 실패 시 None)
+        """
+        count = min(int(count), self.capacity)
+        buffer = self.buffer(ticker, interval)
+        if len(buffer) >= count and time.monotonic() - buffer.updated_at < self.max_age:
+            return buffer.last(count)
+
+        # 같은 (티커, 인터벌)에 대한 동시 조회는 하나로 합침
+        with self._lock:
+            key_lock = self._loading.setdefault((ticker, interval), threading.Lock())
+        with key_lock:
+            if len(buffer) >= count and time.monotonic() - buffer.updated_at < self.max_age:
+                return buffer.last(count)
+            candles = loader(count)
+            if candles is None:
+                return None
+            if len(buffer) < count:
+                # 버퍼보다 과거 구간까지 받았으므로 교체 (extend는 마지막 캔들보다 오래된 캔들을 무시)
+                buffer.clear()
+            buffer.extend(candles)
+            return buffer.last(count)
+
+    def resampler(self, ticker):
+        """티커의 TimeframeResampler 조회 (없으면 생성)"""
+        resampler = self._resamplers.get(ticker)
+        if resampler is None:
+            with self._lock:
+                resampler = self._resamplers.get(ticker)
+                if resampler is None:
+                    resampler = self._resamplers[ticker] = TimeframeResampler(
+                        self.timeframes, capacity=self.capacity, minute_capacity=self.capacity
+                    )
+        return resampler
+
+    @staticmethod
+    def _initial_range(resampler, now):
+        """
+        처음 조회할 구간
+        - 1분 캔들은 최근 minute_capacity개 이내에서 정시부터 받음 (60분 미만 타임프레임의 진행 중 구간 포함)
+        - 가장 긴 타임프레임의 진행 중 구간 중 그 이전 부분은 60분 캔들로 채움
+
+        Returns:
+            tuple: (60분 캔들 시작 시각 또는 None, 1분 캔들 시작 시각)
+        """
+        hour = TIMEFRAMES['minute60'][0]
+        longest = max(resampler.timeframes, key=lambda interval: TIMEFRAMES[interval][0], default='minute1')
+        open_start = int(bucket_start(now, longest))
+        # 보관 가능한 1분 캔들 범위 안의 첫 정시 (단, 현재 정시보다 늦지 않게)
+        earliest = now - (resampler.minutes.capacity - 1) * MINUTE_MS
+        minute_start = min(int(bucket_start(earliest + hour - MINUTE_MS, 'minute60')),
+                           int(bucket_start(now, 'minute60')))
+        if minute_start <= open_start:
+            return None, open_start
+        return open_start, minute_start
+
+    def _load_minutes(self, resampler, minute_loader, seed_loader):
+        """1분 캔들 갱신 (처음에는 _initial_range 구간을 60분/1분 캔들로 채움)"""
+        now = int(time.time() * 1000) + KST_OFFSET_MS
+        if resampler.last_minute is not None:
+            # 진행 중이던 마지막 캔들부터 다시 받음
+            minutes = minute_loader(max(1, (now - resampler.last_minute) // MINUTE_MS + 1))
+            if minutes is None:
+                return False
+            resampler.update(minutes)
+            return True
+
+        hour_start, minute_start = self._initial_range(resampler, now)
+        if hour_start is not None:
+            hour = TIMEFRAMES['minute60'][0]
+            hours = seed_loader('minute60', (now - hour_start) // hour + 1)
+            if hours is None:
+                return False
+            resampler.backfill(hours[(hours['time'] >= hour_start) & (hours['time'] < minute_start)], hour_start)
+        minutes = minute_loader(max(1, (now - minute_start) // MINUTE_MS + 1))
+        if minutes is None:
+            return False
+        # 거래가 없던 분은 응답에 없으므로 더 과거 캔들이 섞일 수 있음
+        resampler.update(minutes[minutes['time'] >= minute_start])
+        return True
+
+    def timeframe_windows(self, ticker, intervals, count, minute_loader, seed_loader):
+        """
+        1분 캔들 하나로 여러 타임프레임의 최근 count개 캔들 조회
+        - max_age가 지나면 1분 캔들만 다시 조회해 모든 타임프레임을 갱신
+        - 처음에는 최근 1분 캔들(최대 minute_capacity개)과, 그 이전의 진행 중 구간을 60분 캔들 1회 조회로 채움
+        - 1분 캔들로 계산되지 않는 과거 구간은 타임프레임별로 한 번만 seed_loader로 채움
+
+        Args:
+            ticker (str): 티커
+            intervals (list): 타임프레임 목록 ('minute1' 또는 저장소 timeframes)
+            count (int): 타임프레임별 캔들 수
+            minute_loader (callable): minute_loader(count) → 1분 candle_dtype 배열 또는 None
+            seed_loader (callable): seed_loader(interval, count) → candle_dtype 배열 또는 None
+
+        Returns:
+            dict: 타임프레임 → candle_dtype 배열 (오래된 순, 1분 캔들 조회 실패 시 None)
+        """
+        count = min(int(count), self.capacity)
+        resampler = self.resampler(ticker)
+        unknown = [interval for interval in intervals if interval != 'minute1' and interval not in resampler.buffers]
+        if unknown:
+            raise ValueError(f"리샘플링하지 않는 타임프레임입니다: {unknown}")
+
+        with self._lock:
+            key_lock = self._loading.setdefault((ticker, 'resample'), threading.Lock())
+        with key_lock:
+            if time.monotonic() - resampler.updated_at >= self.max_age:
+                if not self._load_minutes(resampler, minute_loader, seed_loader):
+                    return None
+            for interval in intervals:
+                if interval != 'minute1' and not resampler.seeded(interval, count):
+                    resampler.seed(interval, seed_loader(interval, count), count)
+        return {interval: resampler.window(interval, count) for interval in intervals}
+
+    def memory_bytes(self):
+        """전체 버퍼 메모리 크기 (바이트)"""
+        buffers = list(self._buffers.values())
+        for resampler in list(self._resamplers.values()):
+            buffers.append(resampler.minutes)
+            buffers.extend(resampler.buffers.values())
+        return sum(buffer.nbytes for buffer in buffers)
+
+    def __len__(self):
+        return len(self._buffers)
+
+    def clear(self):
+        """전체 삭제"""
+        with self._lock:
+            self._buffers.clear()
+            self._resamplers.clear()
+            self._loading.clear()
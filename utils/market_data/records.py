@@ -0,0 +1,58 @@
+"""
+시세 레코드 타입
+- 서비스 사이를 오가는 티커/캔들 항목을 dict 대신 __slots__ 클래스로 표현
+  (인스턴스 dict가 없어 항목당 메모리가 작고 속성 접근이 빠름)
+- JSON 응답이 필요한 곳에서는 to_dict() 사용
+"""
+
+
+class _Record:
+    """__slots__ 레코드 공통 기능"""
+
+    __slots__ = ()
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other):
+        return type(other) is type(self) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __repr__(self):
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class TickerVolume(_Record):
+    """거래량 상위 티커 항목"""
+
+    __slots__ = ('ticker', 'volume', 'price')
+
+    def __init__(self, ticker, volume, price):
+        self.ticker = ticker
+        self.volume = float(volume)
+        self.price = float(price)
+
+
+class Candle(_Record):
+    """
+    캔들 1개
+    - time: 캔들 시작 시각 (KST 벽시계 기준 epoch 밀리초, candle_dtype과 같은 기준)
+    """
+
+    __slots__ = ('time', 'open', 'high', 'low', 'close', 'volume', 'value')
+
+    def __init__(self, time, open, high, low, close, volume, value=0.0):
+        self.time = int(time)
+        self.open = float(open)
+        self.high = float(high)
+        self.low = float(low)
+        self.close = float(close)
+        self.volume = float(volume)
+        self.value = float(value)
+
+    @classmethod
+    def from_row(cls, row):
+        """candle_dtype 구조화 배열의 행에서 생성"""
+        return cls(*row.tolist())
@@ -0,0 +1,275 @@
+"""
+다중 타임프레임 캔들 리샘플링
+- 1분 캔들 하나로 3/5/10/15/30/60/240분, 일, 주 캔들을 만듦 (reduceat 기반 구간 집계)
+- 구간 경계는 업비트 캔들 API와 동일 (시각 표기는 KST 벽시계 기준 epoch 밀리초, candle_dtype의 time과 같은 기준)
+  - 분 캔들: 분 단위 격자 (240분은 UTC 00:00 = KST 09:00 기준)
+  - 일 캔들: KST 09:00 시작
+  - 주 캔들: 월요일 KST 09:00 시작
+- TimeframeResampler는 확정된 1분 캔들을 타임프레임별 진행 중 구간에 한 번씩만 합치므로,
+  1분 캔들을 오래 보관하지 않아도 상위 타임프레임이 정확하게 유지됨
+"""
+import threading
+import time
+
+from utils.upbit_api.utils.decoding import candle_dtype
+from .ring_buffer import CandleRingBuffer
+
+MINUTE_MS = 60 * 1000
+# KST 벽시계 시각과 UTC 시각의 차이 (업비트 일/240분 캔들 경계는 UTC 기준)
+KST_OFFSET_MS = 9 * 60 * MINUTE_MS
+# 1970-01-01(목)에서 첫 월요일까지
+MONDAY_OFFSET_MS = 4 * 24 * 60 * MINUTE_MS
+
+# 인터벌 → (구간 길이, 경계 오프셋) (밀리초, 경계 = offset + k * length)
+TIMEFRAMES = {
+    'minute1': (MINUTE_MS, 0),
+    'minute3': (3 * MINUTE_MS, 0),
+    'minute5': (5 * MINUTE_MS, 0),
+    'minute10': (10 * MINUTE_MS, 0),
+    'minute15': (15 * MINUTE_MS, 0),
+    'minute30': (30 * MINUTE_MS, 0),
+    'minute60': (60 * MINUTE_MS, 0),
+    'minute240': (240 * MINUTE_MS, KST_OFFSET_MS),
+    'day': (1440 * MINUTE_MS, KST_OFFSET_MS),
+    'week': (7 * 1440 * MINUTE_MS, KST_OFFSET_MS + MONDAY_OFFSET_MS),
+}
+
+DEFAULT_TIMEFRAMES = ('minute3', 'minute5', 'minute15', 'minute30', 'minute60', 'minute240', 'day', 'week')
+
+
+def bucket_start(times, interval):
+    """
+    시각이 속한 캔들 구간의 시작 시각
+
+    Args:
+        times (np.ndarray | int): KST 벽시계 기준 epoch 밀리초
+        interval (str): TIMEFRAMES 키
+
+    Returns:
+        구간 시작 시각 (times와 같은 형태)
+    """
+    length, offset = TIMEFRAMES[interval]
+    return (times - offset) // length * length + offset
+
+
+def resample(candles, interval):
+    """
+    캔들을 상위 타임프레임으로 집계 (구간별 reduceat)
+
+    Args:
+        candles (np.ndarray): 오래된 순 candle_dtype 배열 (보통 1분 캔들)
+        interval (str): 결과 캔들 간격
+
+    Returns:
+        np.ndarray: candle_dtype 배열 (구간 시작 시각 순)
+    """
+    import numpy as np
+
+    out = np.empty(0, dtype=candle_dtype())
+    if len(candles) == 0:
+        return out
+
+    starts = bucket_start(candles['time'], interval)
+    # 구간이 바뀌는 위치
+    first = np.flatnonzero(np.concatenate(([True], starts[1:] != starts[:-1])))
+    last = np.append(first[1:], len(candles)) - 1
+
+    out = np.empty(len(first), dtype=candle_dtype())
+    out['time'] = starts[first]
+    out['open'] = candles['open'][first]
+    out['high'] = np.maximum.reduceat(candles['high'], first)
+    out['low'] = np.minimum.reduceat(candles['low'], first)
+    out['close'] = candles['close'][last]
+    out['volume'] = np.add.reduceat(candles['volume'], first)
+    out['value'] = np.add.reduceat(candles['value'], first)
+    return out
+
+
+def _combine(base, part):
+    """같은 구간의 두 집계 캔들 합치기 (base가 먼저)"""
+    merged = base.copy()
+    merged['high'] = max(base['high'], part['high'])
+    merged['low'] = min(base['low'], part['low'])
+    merged['close'] = part['close']
+    merged['volume'] = base['volume'] + part['volume']
+    merged['value'] = base['value'] + part['value']
+    return merged
+
+
+class TimeframeResampler:
+    """
+    티커 1개의 1분 캔들 스트림으로 상위 타임프레임 캔들을 점진적으로 유지
+
+    - update()로 1분 캔들(오래된 순)을 넣으면 가장 최근 캔들은 진행 중(live)으로 두고,
+      그 이전 캔들은 확정되어 타임프레임별 진행 중 구간 집계(base)에 합쳐짐
+    - 타임프레임 캔들 = base + live (같은 구간일 때)
+    - backfill()로 1분 캔들 이전의 진행 중 구간을 60분 캔들 등 상위 캔들로 채움 (1분 캔들을 주 단위로 받지 않음)
+    - seed()로 REST에서 받은 과거 캔들을 1분 캔들이 덮지 못한 구간에 채움
+    """
+
+    def __init__(self, timeframes=DEFAULT_TIMEFRAMES, capacity=500, minute_capacity=500):
+        """
+        Args:
+            timeframes (tuple): 유지할 상위 타임프레임 (TIMEFRAMES 키)
+            capacity (int): 타임프레임별 최대 캔들 수
+            minute_capacity (int): 보관할 최근 1분 캔들 수
+        """
+        unknown = [interval for interval in timeframes if interval not in TIMEFRAMES]
+        if unknown:
+            raise ValueError(f"지원하지 않는 타임프레임입니다: {unknown}")
+
+        self.timeframes = tuple(interval for interval in timeframes if interval != 'minute1')
+        self.capacity = capacity
+        self.minutes = CandleRingBuffer(minute_capacity)
+        self.buffers = {interval: CandleRingBuffer(capacity) for interval in self.timeframes}
+        self.first_minute = None   # 처음 받은 1분 캔들 시각 (이후 구간은 1분 캔들로 계산)
+        self._covered = {}         # 타임프레임 → backfill()로 정확히 계산되는 첫 구간 시작 시각
+        self._base = {}            # 타임프레임 → 진행 중 구간의 확정 분 집계 (0차원 구조화 배열)
+        self._live = None          # 진행 중인 1분 캔들
+        self._seeded = {}          # 타임프레임 → seed()에 요청한 캔들 수
+        self.updated_at = 0.0      # 마지막 1분 캔들 병합 시각 (monotonic)
+        self._lock = threading.Lock()
+
+    @property
+    def last_minute(self):
+        """마지막으로 받은 1분 캔들 시각 (없으면 None)"""
+        return self.minutes.last_time
+
+    def covered_since(self, interval):
+        """
+        1분 캔들로 정확히 계산되는 첫 구간 시작 시각
+
+        Returns:
+            int: KST 벽시계 기준 epoch 밀리초 (1분 캔들을 받지 않았으면 None)
+        """
+        if interval in self._covered:
+            return self._covered[interval]
+        if self.first_minute is None:
+            return None
+        return self._first_bucket(self.first_minute, interval)
+
+    @staticmethod
+    def _first_bucket(since, interval):
+        """since 이후 온전히 포함되는 첫 구간 시작 시각"""
+        start = int(bucket_start(since, interval))
+        if start == since:
+            return start
+        return start + TIMEFRAMES[interval][0]
+
+    def backfill(self, candles, since, source='minute60'):
+        """
+        첫 1분 캔들 이전 구간을 상위 캔들로 채움 (첫 update() 전에만 사용)
+        - 구간 길이가 source의 배수인 타임프레임만 진행 중 구간 집계에 합침
+
+        Args:
+            candles (np.ndarray): 오래된 순 source candle_dtype 배열 (since 이후 완료된 구간만, 첫 1분 캔들 이전까지)
+            since (int): 채운 구간 시작 시각 (KST 벽시계 기준 epoch 밀리초)
+            source (str): candles 간격
+        """
+        length = TIMEFRAMES[source][0]
+        intervals = [
+            interval for interval in self.timeframes
+            if TIMEFRAMES[interval][0] % length == 0 and TIMEFRAMES[interval][1] % length == 0
+        ]
+        with self._lock:
+            for interval in intervals:
+                self._covered[interval] = self._first_bucket(since, interval)
+            if candles is not None and len(candles):
+                self._fold(candles, intervals)
+
+    def update(self, minutes):
+        """
+        1분 캔들 병합
+
+        Args:
+            minutes (np.ndarray): 오래된 순 1분 candle_dtype 배열
+                                  (마지막으로 받은 캔들보다 오래된 캔들은 무시, 같은 시각은 갱신)
+        """
+        import numpy as np
+
+        self.updated_at = time.monotonic()
+        if minutes is None or len(minutes) == 0:
+            return
+        with self._lock:
+            live = self._live
+            if live is not None:
+                minutes = minutes[minutes['time'] >= live['time']]
+                if len(minutes) == 0:
+                    return
+                if minutes['time'][0] > live['time']:
+                    # 이전 live 캔들 확정
+                    minutes = np.concatenate((live.reshape(1), minutes))
+            elif self.first_minute is None:
+                self.first_minute = int(minutes['time'][0])
+
+            self.minutes.extend(minutes)
+            self._fold(minutes[:-1])
+            self._live = minutes[-1].copy()
+            self._publish()
+
+    def _fold(self, finalized, intervals=None):
+        """확정된 캔들을 타임프레임별 base에 합치고 완료된 구간을 버퍼에 기록"""
+        if len(finalized) == 0:
+            return
+        for interval in intervals or self.timeframes:
+            buckets = resample(finalized, interval)
+            base = self._base.get(interval)
+            if base is not None and base['time'] == buckets['time'][0]:
+                buckets[0] = _combine(base, buckets[0])
+            elif base is not None:
+                # 이전 구간 완료
+                self.buffers[interval].extend(base.reshape(1))
+            self.buffers[interval].extend(buckets)
+            self._base[interval] = buckets[-1].copy()
+
+    def _publish(self):
+        """진행 중 구간 캔들(base + live)을 버퍼에 반영"""
+        import numpy as np
+
+        live = self._live
+        for interval in self.timeframes:
+            current = live.copy()
+            current['time'] = bucket_start(live['time'], interval)
+            base = self._base.get(interval)
+            if base is not None and base['time'] == current['time']:
+                current = _combine(base, current)
+            self.buffers[interval].extend(np.array([current], dtype=candle_dtype()))
+
+    def seed(self, interval, candles, count=None):
+        """
+        과거 캔들 채우기 (1분 캔들로 계산되지 않는 구간만 사용)
+
+        Args:
+            interval (str): 타임프레임
+            candles (np.ndarray): 오래된 순 candle_dtype 배열 (REST 조회 결과)
+            count (int, optional): 요청한 캔들 수 (seeded() 판단용, 기본값 len(candles))
+        """
+        import numpy as np
+
+        if interval not in self.buffers or candles is None:
+            return
+        with self._lock:
+            self._seeded[interval] = max(self._seeded.get(interval, 0), count or len(candles))
+            since = self.covered_since(interval)
+            derived = self.buffers[interval].last()
+            if since is not None:
+                candles = candles[candles['time'] < since]
+                derived = derived[derived['time'] >= since]
+            buffer = CandleRingBuffer(self.capacity)
+            buffer.extend(np.concatenate((candles, derived)))
+            self.buffers[interval] = buffer
+
+    def seeded(self, interval, count):
+        """과거 캔들 count개를 이미 채웠거나 버퍼에 count개 이상 있는지"""
+        return self._seeded.get(interval, 0) >= count or len(self.buffers[interval]) >= count
+
+    def window(self, interval, count=None):
+        """
+        최근 count개 캔들 (오래된 순)
+
+        Returns:
+            np.ndarray: candle_dtype 배열
+        """
+        if interval == 'minute1':
+            return self.minutes.last(count)
+        return self.buffers[interval].last(count)
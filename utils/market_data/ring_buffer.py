@@ -0,0 +1,162 @@
+"""
+캔들 링 버퍼
+- (티커, 인터벌)당 NumPy 구조화 배열 1개에 캔들을 순환 저장 (DataFrame/dict 목록 대비 메모리가 작고 추가 시 할당이 없음)
+- 배열은 작게 시작해 capacity까지 두 배씩 늘어나므로 짧은 구간만 쓰는 버퍼는 그만큼만 차지
+- 같은 시각의 캔들은 덮어쓰기 (진행 중인 캔들 갱신), 더 오래된 캔들은 무시
+- 최근 n개 조회는 연속 구간 1회 복사 (다른 스레드의 갱신과 섞이지 않는 스냅샷)
+"""
+import threading
+import time
+
+from utils.upbit_api.utils.decoding import candle_dtype
+from .records import Candle
+
+
+class CandleRingBuffer:
+    """고정 크기 캔들 링 버퍼 (오래된 순 조회)"""
+
+    INITIAL_SIZE = 32
+
+    def __init__(self, capacity=500):
+        """
+        Args:
+            capacity (int): 최대 캔들 수
+        """
+        import numpy as np
+
+        self.capacity = int(capacity)
+        self._data = np.zeros(min(self.capacity, self.INITIAL_SIZE), dtype=candle_dtype())
+        self._start = 0       # 가장 오래된 캔들 위치
+        self._size = 0
+        self.updated_at = 0.0  # 마지막 갱신 시각 (monotonic)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def nbytes(self):
+        """버퍼 메모리 크기 (바이트)"""
+        return self._data.nbytes
+
+    @property
+    def last_time(self):
+        """가장 최근 캔들 시각 (비어 있으면 None)"""
+        if not self._size:
+            return None
+        return int(self._data['time'][(self._start + self._size - 1) % len(self._data)])
+
+    def _reserve(self, size):
+        """배열 크기를 size 이상(최대 capacity)으로 늘림 (오래된 순으로 재배치)"""
+        slots = len(self._data)
+        if size <= slots or slots >= self.capacity:
+            return
+        import numpy as np
+
+        while slots < size:
+            slots *= 2
+        data = np.zeros(min(slots, self.capacity), dtype=self._data.dtype)
+        end = self._start + self._size
+        head = self._data[self._start:min(end, len(self._data))]
+        data[:len(head)] = head
+        data[len(head):self._size] = self._data[:self._size - len(head)]
+        self._data = data
+        self._start = 0
+
+    def _push(self, row):
+        last = self.last_time
+        if last is not None and row['time'] < last:
+            return
+        if last is not None and row['time'] == last:
+            self._data[(self._start + self._size - 1) % len(self._data)] = row
+            return
+        self._reserve(self._size + 1)
+        if self._size < len(self._data):
+            self._data[(self._start + self._size) % len(self._data)] = row
+            self._size += 1
+        else:
+            self._data[self._start] = row
+            self._start = (self._start + 1) % len(self._data)
+
+    def append(self, candle):
+        """
+        캔들 1개 추가
+
+        Args:
+            candle (Candle | tuple | np.void): candle_dtype 필드 순서의 캔들
+        """
+        import numpy as np
+
+        if isinstance(candle, Candle):
+            candle = tuple(getattr(candle, name) for name in Candle.__slots__)
+        if isinstance(candle, tuple):
+            candle = np.array(candle, dtype=self._data.dtype)[()]
+        with self._lock:
+            self._push(candle)
+            self.updated_at = time.monotonic()
+
+    def extend(self, candles):
+        """
+        캔들 배열 병합 (오래된 순 candle_dtype 배열)
+        - 버퍼보다 새로운 구간은 한 번에 복사하고, 겹치는 마지막 캔들은 덮어씀
+        """
+        if candles is None or len(candles) == 0:
+            with self._lock:
+                self.updated_at = time.monotonic()
+            return
+        with self._lock:
+            last = self.last_time
+            if last is not None:
+                same = candles[candles['time'] == last]
+                if len(same):
+                    self._push(same[-1])
+                candles = candles[candles['time'] > last]
+
+            candles = candles[-self.capacity:]
+            count = len(candles)
+            if count:
+                self._reserve(self._size + count)
+                slots = len(self._data)
+                # 끝 위치부터 순환 복사 (두 구간으로 나뉠 수 있음)
+                end = (self._start + self._size) % slots
+                first = min(count, slots - end)
+                self._data[end:end + first] = candles[:first]
+                self._data[:count - first] = candles[first:]
+                overflow = max(0, self._size + count - slots)
+                self._size = min(slots, self._size + count)
+                self._start = (self._start + overflow) % len(self._data)
+            self.updated_at = time.monotonic()
+
+    def last(self, n=None):
+        """
+        최근 n개 캔들 (오래된 순)
+
+        Args:
+            n (int, optional): 캔들 수 (None이면 전체)
+
+        Returns:
+            np.ndarray: candle_dtype 배열 (버퍼와 분리된 사본)
+        """
+        import numpy as np
+
+        with self._lock:
+            n = self._size if n is None else max(0, min(int(n), self._size))
+            begin = (self._start + self._size - n) % len(self._data)
+            if begin + n <= len(self._data):
+                return self._data[begin:begin + n].copy()
+            return np.concatenate((self._data[begin:], self._data[:begin + n - len(self._data)]))
+
+    def __getitem__(self, name):
+        """필드별 배열 (오래된 순, 예: buffer['close'])"""
+        return self.last()[name]
+
+    def __iter__(self):
+        """Candle 레코드로 순회"""
+        for row in self.last().tolist():
+            yield Candle(*row)
+
+    def clear(self):
+        with self._lock:
+            self._start = 0
+            self._size = 0
+            self.updated_at = 0.0
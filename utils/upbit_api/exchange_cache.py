@@ -0,0 +1,146 @@
+"""
+업비트 주문 가능 정보 / 입출금 현황 캐시
+- 수수료, 최소 주문 금액, 지갑 상태처럼 거의 바뀌지 않는 값을 엔드포인트별 TTL로 보관
+- 만료 직전 조회는 기존 값을 그대로 반환하고 백그라운드에서 갱신 (주문 전 검사가 서명 요청 대신 dict 조회)
+- 주문/취소/입출금 후에는 해당 마켓(화폐)의 항목을 명시적으로 무효화 (주문 가능 정보에는 잔고가 포함됨)
+"""
+import logging
+
+from utils.manager_cache.manager_cache import CacheManager
+
+logger = logging.getLogger(__name__)
+
+# 캐시 이름 (cache_requests_total 메트릭 레이블)
+ORDER_CHANCE_CACHE = 'upbit_order_chance'
+WALLET_STATUS_CACHE = 'upbit_wallet_status'
+
+
+def _is_ok(value):
+    return not (isinstance(value, dict) and 'error' in value)
+
+
+def _market_has_currency(market, currency):
+    return currency in (market or '').split('-')
+
+
+class ExchangeInfoCache:
+    """
+    주문 가능 정보 / 입출금 현황 캐시 (싱글톤)
+    - 주문 가능 정보 키: (access_key, market) - 계정별 잔고 포함
+    - 입출금 현황 키: currency (None이면 전체) - 거래소 공통
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        """싱글톤 패턴 구현"""
+        if cls._instance is None:
+            cls._instance = super(ExchangeInfoCache, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """캐시 초기화"""
+        if self._initialized:
+            return
+
+        self.enabled = True
+        self.chance_ttl = 30
+        self.wallet_ttl = 60
+        self.refresh_ratio = 0.2    # TTL의 마지막 20% 구간에서 조회되면 백그라운드 갱신
+        self._initialized = True
+
+    def configure(self, chance_ttl=None, wallet_ttl=None, enabled=None):
+        """
+        캐시 설정
+
+        Args:
+            chance_ttl (float, optional): 주문 가능 정보 캐시 시간 (초)
+            wallet_ttl (float, optional): 입출금 현황 캐시 시간 (초)
+            enabled (bool, optional): 캐시 사용 여부 (False면 항상 실시간 조회)
+        """
+        if chance_ttl is not None:
+            self.chance_ttl = chance_ttl
+        if wallet_ttl is not None:
+            self.wallet_ttl = wallet_ttl
+        if enabled is not None:
+            self.enabled = enabled
+        return self
+
+    def configure_from_config(self, config):
+        """app.config 값으로 설정"""
+        return self.configure(
+            chance_ttl=config.get('ORDER_CHANCE_CACHE_TTL', 30),
+            wallet_ttl=config.get('WALLET_STATUS_CACHE_TTL', 60),
+        )
+
+    @property
+    def _chance(self):
+        return CacheManager().get_cache(ORDER_CHANCE_CACHE, ttl=self.chance_ttl)
+
+    @property
+    def _wallet(self):
+        return CacheManager().get_cache(WALLET_STATUS_CACHE, ttl=self.wallet_ttl, maxsize=256)
+
+    # ------ 조회 ------
+
+    def order_chance(self, access_key, market, loader):
+        """
+        주문 가능 정보 조회
+
+        Args:
+            access_key (str): 계정 액세스 키
+            market (str): 마켓 코드
+            loader (callable): 실시간 조회 함수 (오류 응답은 저장하지 않음)
+
+        Returns:
+            dict: 주문 가능 정보
+        """
+        if not self.enabled or not access_key:
+            return loader()
+        return self._chance.get_or_load(
+            (access_key, market), loader, ttl=self.chance_ttl, cache_if=_is_ok,
+            refresh_ahead=self.chance_ttl * self.refresh_ratio
+        )
+
+    def wallet_status(self, currency, loader):
+        """
+        입출금 현황 조회
+
+        Args:
+            currency (str): 화폐 코드 (None이면 전체)
+            loader (callable): 실시간 조회 함수 (오류 응답은 저장하지 않음)
+
+        Returns:
+            list: 입출금 현황 목록
+        """
+        if not self.enabled:
+            return loader()
+        return self._wallet.get_or_load(
+            currency, loader, ttl=self.wallet_ttl, cache_if=_is_ok,
+            refresh_ahead=self.wallet_ttl * self.refresh_ratio
+        )
+
+    # ------ 무효화 ------
+
+    def invalidate_market(self, access_key, market):
+        """주문/취소 후 해당 마켓의 주문 가능 정보 무효화"""
+        self._chance.invalidate((access_key, market))
+
+    def invalidate_currency(self, access_key, currency):
+        """입출금 후 해당 화폐가 포함된 마켓의 주문 가능 정보와 입출금 현황 무효화"""
+        removed = self._chance.invalidate_where(
+            lambda key: key[0] == access_key and _market_has_currency(key[1], currency)
+        )
+        self._wallet.invalidate(currency)
+        self._wallet.invalidate(None)
+        logger.debug("%s 관련 주문 가능 정보 %s건 무효화", currency, removed)
+
+    def invalidate_account(self, access_key):
+        """일괄 취소처럼 대상 마켓을 알 수 없을 때 계정의 주문 가능 정보 전체 무효화"""
+        self._chance.invalidate_where(lambda key: key[0] == access_key)
+
+    def clear(self):
+        """전체 삭제"""
+        self._chance.clear()
+        self._wallet.clear()
@@ -0,0 +1,217 @@
+"""
+업비트 마켓 카탈로그
+- /v1/market/all(상세 포함)을 한 번 받아 frozenset/dict 색인으로 보관
+- TTL이 지나면 현재 카탈로그를 그대로 쓰면서 백그라운드에서 갱신 (조회 경로는 네트워크를 기다리지 않음)
+- 티커 유효성 검사와 거래 대상 티커 목록의 단일 출처
+"""
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def _default_loader():
+    from .upbit_api import UpbitAPI
+    return UpbitAPI().service_info.get_market_all(is_details=True)
+
+
+class MarketInfo:
+    """마켓 1개 정보 (유의/주의 종목 플래그 포함)"""
+
+    __slots__ = ('market', 'quote', 'base', 'korean_name', 'english_name', 'warning', 'cautions')
+
+    def __init__(self, record):
+        self.market = record['market']
+        self.quote, _, self.base = self.market.partition('-')
+        self.korean_name = record.get('korean_name')
+        self.english_name = record.get('english_name')
+
+        # 구 형식(market_warning: NONE/CAUTION)과 신 형식(market_event: {warning, caution}) 모두 지원
+        event = record.get('market_event') or {}
+        self.warning = bool(event.get('warning')) or record.get('market_warning') == 'CAUTION'
+        self.cautions = tuple(sorted(name for name, flag in (event.get('caution') or {}).items() if flag))
+
+    def to_dict(self):
+        return {
+            'market': self.market,
+            'korean_name': self.korean_name,
+            'english_name': self.english_name,
+            'warning': self.warning,
+            'cautions': list(self.cautions),
+        }
+
+
+class _Snapshot:
+    """불변 카탈로그 스냅샷 (갱신 시 통째로 교체하므로 읽기에 잠금이 필요 없음)"""
+
+    def __init__(self, records):
+        self.by_market = {}
+        for record in records:
+            if record.get('market'):
+                info = MarketInfo(record)
+                self.by_market[info.market] = info
+        self.markets = frozenset(self.by_market)
+        by_quote = {}
+        for market in sorted(self.by_market):
+            by_quote.setdefault(self.by_market[market].quote, []).append(market)
+        self.by_quote = {quote: tuple(markets) for quote, markets in by_quote.items()}
+        self.loaded_at = time.monotonic()
+
+
+class MarketCatalog:
+    """
+    마켓 카탈로그 (싱글톤)
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        """싱글톤 패턴 구현"""
+        if cls._instance is None:
+            cls._instance = super(MarketCatalog, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """마켓 카탈로그 초기화"""
+        if self._initialized:
+            return
+
+        self.ttl = 600
+        self.retry_interval = 30
+        self.loader = _default_loader
+        self._snapshot = None
+        self._last_attempt = 0.0
+        self._load_lock = threading.Lock()
+        self._refreshing = False
+        self._initialized = True
+
+    def configure(self, ttl=None, loader=None):
+        """
+        카탈로그 설정
+
+        Args:
+            ttl (float, optional): 갱신 주기 (초)
+            loader (callable, optional): /v1/market/all 형식의 레코드 목록을 반환하는 함수 (None이면 변경 안 함)
+        """
+        if ttl is not None:
+            self.ttl = ttl
+        if loader is not None:
+            self.loader = loader
+            self._snapshot = None
+            self._last_attempt = 0.0
+        return self
+
+    def configure_from_config(self, config):
+        """app.config 값으로 설정"""
+        return self.configure(ttl=config.get('MARKET_CATALOG_TTL', 600))
+
+    def reset(self):
+        """기본 로더로 되돌리고 카탈로그 비우기"""
+        self.loader = _default_loader
+        self._snapshot = None
+        self._last_attempt = 0.0
+
+    # ------ 로딩 ------
+
+    def refresh(self):
+        """
+        카탈로그 즉시 갱신 (실패하면 기존 카탈로그 유지)
+
+        Returns:
+            bool: 갱신 성공 여부
+        """
+        self._last_attempt = time.monotonic()
+        try:
+            records = self.loader()
+            if not isinstance(records, list) or not records:
+                raise ValueError(records.get('error') if isinstance(records, dict) else "빈 마켓 목록")
+            self._snapshot = _Snapshot(records)
+            logger.info("마켓 카탈로그 갱신: %s개 마켓", len(self._snapshot.markets))
+            return True
+        except Exception as e:
+            logger.error("마켓 카탈로그 갱신 실패: %s", e)
+            return False
+
+    def _refresh_in_background(self):
+        try:
+            self.refresh()
+        finally:
+            self._refreshing = False
+
+    def _current(self):
+        """
+        현재 스냅샷 (처음에는 동기 로딩, TTL이 지나면 백그라운드 갱신 시작)
+
+        Returns:
+            _Snapshot: 스냅샷 또는 None (로딩 실패)
+        """
+        snapshot = self._snapshot
+        now = time.monotonic()
+        if snapshot is None:
+            with self._load_lock:
+                if self._snapshot is None and now - self._last_attempt >= self.retry_interval:
+                    self.refresh()
+                return self._snapshot
+
+        if now - snapshot.loaded_at >= self.ttl and now - self._last_attempt >= self.retry_interval:
+            with self._load_lock:
+                if not self._refreshing:
+                    self._refreshing = True
+                    self._last_attempt = now
+                    threading.Thread(target=self._refresh_in_background, name='market-catalog', daemon=True).start()
+        return snapshot
+
+    @property
+    def loaded(self):
+        """카탈로그 로딩 여부 (로딩을 시도하지 않음)"""
+        return self._snapshot is not None
+
+    # ------ 조회 ------
+
+    def exists(self, market):
+        """
+        마켓 존재 여부 (O(1))
+
+        Returns:
+            bool: 존재 여부 (카탈로그를 불러올 수 없으면 None)
+        """
+        snapshot = self._current()
+        if snapshot is None:
+            return None
+        return market in snapshot.markets
+
+    def get(self, market):
+        """
+        마켓 정보 조회
+
+        Returns:
+            MarketInfo: 마켓 정보 또는 None
+        """
+        snapshot = self._current()
+        return snapshot.by_market.get(market) if snapshot else None
+
+    def is_warning(self, market):
+        """유의 종목 여부"""
+        info = self.get(market)
+        return bool(info and info.warning)
+
+    def tickers(self, quote=None, include_warning=True):
+        """
+        마켓 코드 목록
+
+        Args:
+            quote (str, optional): 기준 화폐 (예: KRW, None이면 전체)
+            include_warning (bool): 유의 종목 포함 여부
+
+        Returns:
+            list: 마켓 코드 목록 (정렬됨, 카탈로그를 불러올 수 없으면 빈 목록)
+        """
+        snapshot = self._current()
+        if snapshot is None:
+            return []
+        markets = snapshot.by_quote.get(quote, ()) if quote else sorted(snapshot.markets)
+        if include_warning:
+            return list(markets)
+        return [market for market in markets if not snapshot.by_market[market].warning]
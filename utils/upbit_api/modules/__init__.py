@@ -5,4 +5,5 @@ from .accounts import AccountsModule
 from .orders import OrdersModule
 from .deposits import DepositsModule
 from .withdrawals import WithdrawalsModule
-from .service_info import ServiceInfoModule
\ No newline at end of file
+from .service_info import ServiceInfoModule
+from .quotation import QuotationModule
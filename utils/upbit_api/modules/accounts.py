@@ -3,10 +3,7 @@
 - 자산/전체 계좌 조회
 - 기타 자산 관련 기능
 """
-import requests
 import logging
-import uuid
-import jwt
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +21,7 @@ class AccountsModule:
         """
         self.api = api
         self.server_url = api.server_url
+        self.pipeline = api.pipeline
     
     def get_accounts(self):
         """
@@ -32,34 +30,7 @@ class AccountsModule:
         Returns:
             list: 계좌 정보 목록
         """
-        try:
-            # 업비트 공식 예제 방식으로 구현
-            payload = {
-                'access_key': self.api.access_key,
-                'nonce': str(uuid.uuid4()),
-            }
-            
-            jwt_token = jwt.encode(payload, self.api.secret_key)
-            
-            # PyJWT 2.0.0 이상에서는 bytes가 아닌 문자열 반환
-            if isinstance(jwt_token, bytes):
-                jwt_token = jwt_token.decode('utf-8')
-            
-            authorization = f'Bearer {jwt_token}'
-            headers = {
-                'Authorization': authorization,
-            }
-            
-            response = requests.get(f"{self.server_url}/v1/accounts", headers=headers)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                logger.error(f"계좌 정보 조회 실패: {response.text}")
-                return {"error": response.text}
-        except Exception as e:
-            logger.error(f"계좌 정보 조회 중 오류 발생: {e}")
-            return {"error": str(e)}
+        return self.pipeline.get('/v1/accounts', label="계좌 정보 조회")
     
     def get_account_balance(self, ticker=None):
         """
@@ -1,11 +1,8 @@
-import requests
 import logging
-from urllib.parse import urlencode, unquote
-import hashlib
-import uuid
-import jwt
 
 from ..utils.validators import validate_order_params, validate_ticker, validate_uuid
+from ..utils.pagination import iter_pages
+from ..exchange_cache import ExchangeInfoCache
 
 logger = logging.getLogger(__name__)
 
@@ -23,14 +20,16 @@ class OrdersModule:
         """
         self.api = api
         self.server_url = api.server_url
+        self.pipeline = api.pipeline
     
     # 주문 가능 정보
-    def get_order_chance(self, market):
+    def get_order_chance(self, market, use_cache=True):
         """
         주문 가능 정보 조회
         
         Args:
             market (str): 마켓 코드 (예: KRW-BTC)
+            use_cache (bool, optional): 캐시 사용 여부 (False면 실시간 조회)
             
         Returns:
             dict: 주문 가능 정보
@@ -44,20 +43,55 @@ class OrdersModule:
                 'market': market
             }
             
-            # 인증 헤더 생성
-            headers = self.api.get_auth_headers(params)
-            
-            # API 요청
-            response = requests.get(f"{self.server_url}/v1/orders/chance", params=params, headers=headers)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                logger.error(f"주문 가능 정보 조회 실패: {response.text}")
-                return {"error": response.text}
+            # 백그라운드 갱신도 호출 시점의 키로 서명
+            credentials = (self.api.access_key, self.api.secret_key)
+            def load():
+                return self.pipeline.get('/v1/orders/chance', params, label="주문 가능 정보 조회", credentials=credentials)
+
+            if not use_cache:
+                return load()
+            return ExchangeInfoCache().order_chance(self.api.access_key, market, load)
         except Exception as e:
             logger.error(f"주문 가능 정보 조회 중 오류 발생: {e}")
             return {"error": str(e)}
+
+    # 주문 전 검사
+    def check_order(self, market, side, ord_type, volume=None, price=None):
+        """
+        주문 가능 정보(캐시)로 마켓 상태와 최소 주문 금액 검사
+        
+        Args:
+            market (str): 마켓 코드 (예: KRW-BTC)
+            side (str): 주문 종류 (bid: 매수, ask: 매도)
+            ord_type (str): 주문 타입
+            volume (str, optional): 주문량
+            price (str, optional): 주문 가격
+            
+        Returns:
+            tuple: (유효 여부, 오류 메시지) - 주문 가능 정보를 조회할 수 없으면 검사를 건너뜀
+        """
+        chance = self.get_order_chance(market)
+        if not isinstance(chance, dict) or 'error' in chance:
+            return True, None
+
+        info = chance.get('market') or {}
+        if info.get('state', 'active') != 'active':
+            return False, "현재 주문할 수 없는 마켓입니다."
+        if side not in info.get('order_sides', [side]):
+            return False, "허용되지 않은 주문 종류입니다."
+
+        # 주문 총액 (시장가 매도는 가격을 알 수 없으므로 검사하지 않음)
+        if ord_type == 'limit':
+            total = float(price) * float(volume)
+        elif ord_type == 'price':
+            total = float(price)
+        else:
+            return True, None
+
+        min_total = float((info.get(side) or {}).get('min_total') or 0)
+        if total < min_total:
+            return False, f"최소 주문 금액({min_total:g})보다 작습니다."
+        return True, None
     
     # 개별 주문 조회
     def get_order(self, uuid_str):
@@ -79,17 +113,7 @@ class OrdersModule:
                 'uuid': uuid_str
             }
             
-            # 인증 헤더 생성
-            headers = self.api.get_auth_headers(params)
-            
-            # API 요청
-            response = requests.get(f"{self.server_url}/v1/order", params=params, headers=headers)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                logger.error(f"개별 주문 조회 실패: {response.text}")
-                return {"error": response.text}
+            return self.pipeline.get('/v1/order', params, label="개별 주문 조회")
         except Exception as e:
             logger.error(f"개별 주문 조회 중 오류 발생: {e}")
             return {"error": str(e)}
@@ -123,17 +147,7 @@ class OrdersModule:
             params['page'] = page
             params['limit'] = limit
             
-            # 인증 헤더 생성
-            headers = self.api.get_auth_headers(params)
-            
-            # API 요청
-            response = requests.get(f"{self.server_url}/v1/orders", params=params, headers=headers)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                logger.error(f"주문 리스트 조회 실패: {response.text}")
-                return {"error": response.text}
+            return self.pipeline.get('/v1/orders', params, label="주문 리스트 조회")
         except Exception as e:
             logger.error(f"주문 리스트 조회 중 오류 발생: {e}")
             return {"error": str(e)} 
@@ -158,17 +172,7 @@ class OrdersModule:
                 'uuids[]': uuids
             }
             
-            # 인증 헤더 생성
-            headers = self.api.get_auth_headers(params)
-            
-            # API 요청
-            response = requests.get(f"{self.server_url}/v1/orders/uuids", params=params, headers=headers)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                logger.error(f"ID로 주문 리스트 조회 실패: {response.text}")
-                return {"error": response.text}
+            return self.pipeline.get('/v1/orders/uuids', params, label="ID로 주문 리스트 조회")
         except Exception as e:
             logger.error(f"ID로 주문 리스트 조회 중 오류 발생: {e}")
             return {"error": str(e)}
@@ -195,23 +199,14 @@ class OrdersModule:
                     return {"error": "유효하지 않은 마켓 코드입니다."}
                 params['market'] = market
             
-            # 인증 헤더 생성
-            headers = self.api.get_auth_headers(params)
-            
-            # API 요청
-            response = requests.get(f"{self.server_url}/v1/orders", params=params, headers=headers)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                logger.error(f"체결 대기 주문 조회 실패: {response.text}")
-                return {"error": response.text}
+            return self.pipeline.get('/v1/orders', params, label="체결 대기 주문 조회")
         except Exception as e:
             logger.error(f"체결 대기 주문 조회 중 오류 발생: {e}")
             return {"error": str(e)}
     
     # 종료된 주문 조회
-    def get_closed_orders(self, market=None, states=['done', 'cancel'], start_time=None, end_time=None, page=1, limit=100):
+    def get_closed_orders(self, market=None, states=['done', 'cancel'], start_time=None, end_time=None, page=1, limit=100,
+                          credentials=None):
         """
         종료된 주문 조회
         
@@ -222,6 +217,7 @@ class OrdersModule:
             end_time (str, optional): 조회 종료 시간 (ISO 8601 형식)
             page (int, optional): 페이지 번호
             limit (int, optional): 한 페이지에 가져올 주문 개수 (최대 100)
+            credentials (tuple, optional): (access_key, secret_key) - 지정하면 인스턴스의 키 대신 사용
             
         Returns:
             list: 종료된 주문 리스트
@@ -245,21 +241,40 @@ class OrdersModule:
             if end_time:
                 params['end_time'] = end_time
             
-            # 인증 헤더 생성
-            headers = self.api.get_auth_headers(params)
-            
-            # API 요청
-            response = requests.get(f"{self.server_url}/v1/orders", params=params, headers=headers)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                logger.error(f"종료된 주문 조회 실패: {response.text}")
-                return {"error": response.text}
+            return self.pipeline.get('/v1/orders', params, label="종료된 주문 조회", credentials=credentials)
         except Exception as e:
             logger.error(f"종료된 주문 조회 중 오류 발생: {e}")
             return {"error": str(e)}
 
+    # 종료된 주문 전체 순회
+    def iter_closed_orders(self, market=None, states=['done', 'cancel'], start_time=None, end_time=None, max_pages=None,
+                           prefetch=True, credentials=None):
+        """
+        종료된 주문 전체 순회 (페이지를 차례로 조회하며 레코드 단위로 반환)
+        
+        Args:
+            market (str, optional): 마켓 코드 (예: KRW-BTC)
+            states (list, optional): 주문 상태. 기본값은 ['done', 'cancel']
+            start_time (str, optional): 조회 시작 시간 (ISO 8601 형식)
+            end_time (str, optional): 조회 종료 시간 (ISO 8601 형식)
+            max_pages (int, optional): 최대 조회 페이지 수
+            prefetch (bool, optional): 다음 페이지 미리 조회 여부
+            credentials (tuple, optional): (access_key, secret_key) - 지정하지 않으면 호출 시점의 인스턴스 키
+            
+        Yields:
+            dict: 주문 정보
+            
+        Raises:
+            PageFetchError: 페이지 조회 실패
+        """
+        # 미리 조회하는 페이지도 호출 시점의 키로 서명
+        credentials = credentials or (self.api.access_key, self.api.secret_key)
+        return iter_pages(
+            lambda page: self.get_closed_orders(market=market, states=states, start_time=start_time,
+                                                end_time=end_time, page=page, limit=100, credentials=credentials),
+            limit=100, max_pages=max_pages, prefetch=prefetch, key='uuid'
+        )
+
     # 주문 취소 접수
     def cancel_order(self, uuid_str):
         """
@@ -280,17 +295,9 @@ class OrdersModule:
                 'uuid': uuid_str
             }
             
-            # 인증 헤더 생성
-            headers = self.api.get_auth_headers(params)
-            
-            # API 요청
-            response = requests.delete(f"{self.server_url}/v1/order", params=params, headers=headers)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                logger.error(f"주문 취소 실패: {response.text}")
-                return {"error": response.text}
+            result = self.pipeline.delete('/v1/order', params, label="주문 취소")
+            self._invalidate_chance(result)
+            return result
         except Exception as e:
             logger.error(f"주문 취소 중 오류 발생: {e}")
             return {"error": str(e)}
@@ -317,17 +324,9 @@ class OrdersModule:
             if quote_currencies:
                 params['quote_currencies'] = quote_currencies
             
-            # 인증 헤더 생성
-            headers = self.api.get_auth_headers(params)
-            
-            # API 요청
-            response = requests.delete(f"{self.server_url}/v1/orders/open", params=params, headers=headers)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                logger.error(f"주문 일괄 취소 실패: {response.text}")
-                return {"error": response.text}
+            result = self.pipeline.delete('/v1/orders/open', params, label="주문 일괄 취소")
+            self._invalidate_chance(result)
+            return result
         except Exception as e:
             logger.error(f"주문 일괄 취소 중 오류 발생: {e}")
             return {"error": str(e)}
@@ -352,17 +351,9 @@ class OrdersModule:
                 'uuids[]': uuids
             }
             
-            # 인증 헤더 생성
-            headers = self.api.get_auth_headers(params)
-            
-            # API 요청
-            response = requests.delete(f"{self.server_url}/v1/orders/uuids", params=params, headers=headers)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                logger.error(f"ID로 주문 리스트 취소 실패: {response.text}")
-                return {"error": response.text}
+            result = self.pipeline.delete('/v1/orders/uuids', params, label="ID로 주문 리스트 취소")
+            self._invalidate_chance(result)
+            return result
         except Exception as e:
             logger.error(f"ID로 주문 리스트 취소 중 오류 발생: {e}")
             return {"error": str(e)}
@@ -391,6 +382,10 @@ class OrdersModule:
             if not is_valid:
                 return {"error": error_msg}
                 
+            is_valid, error_msg = self.check_order(market, side, ord_type, volume, price)
+            if not is_valid:
+                return {"error": error_msg}
+                
             # 쿼리 파라미터 설정
             params = {
                 'market': market,
@@ -404,18 +399,9 @@ class OrdersModule:
             if price is not None:
                 params['price'] = str(price)
             
-            # 인증 헤더 생성
-            headers = self.api.get_auth_headers(params)
-            headers['Content-Type'] = 'application/json'
-            
-            # API 요청
-            response = requests.post(f"{self.server_url}/v1/orders", json=params, headers=headers)
-            
-            if response.status_code == 201:  # 201: Created
-                return response.json()
-            else:
-                logger.error(f"주문 실패: {response.text}")
-                return {"error": response.text}
+            result = self.pipeline.post('/v1/orders', params, label="주문")
+            self._invalidate_chance(result, market)
+            return result
         except Exception as e:
             logger.error(f"주문 중 오류 발생: {e}")
             return {"error": str(e)}
@@ -450,21 +436,22 @@ class OrdersModule:
             if new_volume is not None:
                 params['new_volume'] = str(new_volume)
             
-            # 인증 헤더 생성
-            headers = self.api.get_auth_headers(params)
-            headers['Content-Type'] = 'application/json'
-            
-            # API 요청
-            response = requests.post(f"{self.server_url}/v1/orders/cancel_and_new", json=params, headers=headers)
-            
-            if response.status_code == 201:  # 201: Created
-                return response.json()
-            else:
-                logger.error(f"취소 후 재주문 실패: {response.text}")
-                return {"error": response.text}
+            result = self.pipeline.post('/v1/orders/cancel_and_new', params, label="취소 후 재주문")
+            self._invalidate_chance(result)
+            return result
         except Exception as e:
             logger.error(f"취소 후 재주문 중 오류 발생: {e}")
             return {"error": str(e)}
+
+    def _invalidate_chance(self, result, market=None):
+        """주문/취소 성공 시 주문 가능 정보(잔고 포함) 캐시 무효화 (마켓을 알 수 없으면 계정 전체)"""
+        if isinstance(result, dict) and 'error' in result:
+            return
+        market = market or (result.get('market') if isinstance(result, dict) else None)
+        if market:
+            ExchangeInfoCache().invalidate_market(self.api.access_key, market)
+        else:
+            ExchangeInfoCache().invalidate_account(self.api.access_key)
         
 
           # 지정가 매수
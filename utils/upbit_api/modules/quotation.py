@@ -0,0 +1,183 @@
+"""
+업비트 API 시세 관련 모듈
+- 캔들 조회 (NumPy 구조화 배열, 200개 초과 시 과거 방향으로 나누어 조회)
+- 호가 조회 (마켓별 구조화 배열)
+- 최근 체결 조회 (구조화 배열)
+- 현재가 조회
+"""
+import logging
+from datetime import datetime, timedelta, timezone
+
+from ..utils.request import RequestPipeline
+from ..utils.decoding import candles_from_records, decode_orderbooks, decode_trades
+
+logger = logging.getLogger(__name__)
+
+KST = timezone(timedelta(hours=9))
+
+# pyupbit 인터벌 이름 → 캔들 API 경로
+CANDLE_UNITS = {
+    'day': 'days',
+    'days': 'days',
+    'week': 'weeks',
+    'weeks': 'weeks',
+    'month': 'months',
+    'months': 'months',
+    'minute1': 'minutes/1',
+    'minute3': 'minutes/3',
+    'minute5': 'minutes/5',
+    'minute10': 'minutes/10',
+    'minute15': 'minutes/15',
+    'minute30': 'minutes/30',
+    'minute60': 'minutes/60',
+    'minute240': 'minutes/240',
+}
+
+MAX_CANDLES_PER_REQUEST = 200
+
+
+def format_to(value):
+    """
+    캔들 조회 기준 시각을 업비트 형식(UTC, yyyy-MM-ddTHH:mm:ssZ)으로 변환
+
+    Args:
+        value (str | datetime): 기준 시각 (시간대가 없으면 KST로 간주, pyupbit와 동일)
+
+    Returns:
+        str: UTC 시각 문자열
+    """
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=KST)
+    return value.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+class QuotationModule:
+    """
+    업비트 API 시세 관련 기능 모듈 (싱글톤 패턴)
+    """
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        """싱글톤 패턴 구현"""
+        if cls._instance is None:
+            cls._instance = super(QuotationModule, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self, api=None):
+        """
+        시세 모듈 초기화
+
+        Args:
+            api (UpbitAPI): 상위 UpbitAPI 인스턴스
+        """
+        if self._initialized and api is None:
+            return
+
+        self.api = api
+        self.server_url = api.server_url if api else "https://api.upbit.com"
+        self.pipeline = api.pipeline if api else RequestPipeline(None)
+        self._initialized = True
+        logger.info("QuotationModule 초기화 완료")
+
+    # 캔들 조회
+    def get_candles(self, market, interval='day', count=200, to=None):
+        """
+        캔들 조회 (dict 목록/DataFrame을 거치지 않고 구조화 배열로 디코딩)
+
+        Args:
+            market (str): 마켓 코드 (예: KRW-BTC)
+            interval (str, optional): 캔들 간격 (day, week, month, minute1 ~ minute240)
+            count (int, optional): 캔들 수 (200개 초과 시 나누어 조회)
+            to (str | datetime, optional): 마지막 캔들 시각 (미포함, 시간대가 없으면 KST)
+
+        Returns:
+            np.ndarray: candle_dtype 배열 (오래된 순) 또는 {"error": ...}
+        """
+        import numpy as np
+
+        unit = CANDLE_UNITS.get(interval)
+        if unit is None:
+            return {"error": f"지원하지 않는 캔들 간격입니다: {interval}"}
+
+        try:
+            before = format_to(to) if to else None
+        except (TypeError, ValueError):
+            return {"error": f"유효하지 않은 시각입니다: {to}"}
+
+        chunks = []
+        remaining = int(count)
+        while remaining > 0:
+            params = {'market': market, 'count': min(remaining, MAX_CANDLES_PER_REQUEST)}
+            if before:
+                params['to'] = before
+            records = self.pipeline.get(f'/v1/candles/{unit}', params, label="캔들 조회", auth=False)
+            if isinstance(records, dict):
+                if chunks:
+                    break
+                return records
+            if not records:
+                break
+
+            chunks.append(candles_from_records(records))
+            remaining -= len(records)
+            # 다음 요청은 이번 응답의 가장 오래된 캔들 이전 (응답은 최신순)
+            before = records[-1]['candle_date_time_utc'] + 'Z'
+            if len(records) < params['count']:
+                break
+
+        if not chunks:
+            return candles_from_records([])
+        return chunks[0] if len(chunks) == 1 else np.concatenate(chunks[::-1])
+
+    # 호가 조회
+    def get_orderbook(self, markets):
+        """
+        호가 조회
+
+        Args:
+            markets (str | list): 마켓 코드 또는 목록
+
+        Returns:
+            dict: 마켓 → {'timestamp', 'total_ask_size', 'total_bid_size', 'units': orderbook_dtype 배열}
+                  또는 {"error": ...}
+        """
+        if isinstance(markets, str):
+            markets = [markets]
+        return self.pipeline.get(
+            '/v1/orderbook', {'markets': ','.join(markets)}, label="호가 조회", auth=False, decode=decode_orderbooks
+        )
+
+    # 최근 체결 조회
+    def get_trades(self, market, count=200):
+        """
+        최근 체결 조회
+
+        Args:
+            market (str): 마켓 코드
+            count (int): 체결 수 (최대 500)
+
+        Returns:
+            np.ndarray: trade_dtype 배열 (오래된 순) 또는 {"error": ...}
+        """
+        return self.pipeline.get(
+            '/v1/trades/ticks', {'market': market, 'count': min(int(count), 500)},
+            label="체결 조회", auth=False, decode=decode_trades
+        )
+
+    # 현재가 조회
+    def get_ticker(self, markets):
+        """
+        현재가 조회
+
+        Args:
+            markets (str | list): 마켓 코드 또는 목록
+
+        Returns:
+            list: 현재가 정보 목록
+        """
+        if isinstance(markets, str):
+            markets = [markets]
+        return self.pipeline.get('/v1/ticker', {'markets': ','.join(markets)}, label="현재가 조회", auth=False)
@@ -1,15 +1,18 @@
 """
 업비트 API 싱글톤 클래스
-- 자산, 주문, 입금, 출금, 서비스 정보 모듈을 통합하여 관리
+- 자산, 주문, 입금, 출금, 서비스 정보, 시세 모듈을 통합하여 관리
 """
 import logging
+import os
 from utils.manager_encryption.manager_encryption import EncryptionManager
 from .modules.accounts import AccountsModule
 from .modules.orders import OrdersModule
 from .modules.deposits import DepositsModule
 from .modules.withdrawals import WithdrawalsModule
 from .modules.service_info import ServiceInfoModule
+from .modules.quotation import QuotationModule
 from .utils.auth import generate_auth_headers
+from .utils.request import RequestPipeline
 
 logger = logging.getLogger(__name__)
 
@@ -32,17 +35,22 @@ class UpbitAPI:
         if self._initialized:
             return
         
-        self.server_url = "https://api.upbit.com"
+        # UPBIT_SERVER_URL로 모의 거래소 등 다른 서버 지정 가능
+        self.server_url = os.getenv('UPBIT_SERVER_URL', "https://api.upbit.com")
         self.access_key = None
         self.secret_key = None
         self.encryption_manager = EncryptionManager()
         
+        # 모든 모듈이 공유하는 요청 파이프라인 (서명, 요청 제한, 전송, 디코딩)
+        self.pipeline = RequestPipeline(self)
+        
         # 각 기능별 모듈 초기화
         self.accounts = AccountsModule(self)
         self.orders = OrdersModule(self)
         self.deposits = DepositsModule(self)
         self.withdrawals = WithdrawalsModule(self)
         self.service_info = ServiceInfoModule(self)
+        self.quotation = QuotationModule(self)
         
         self._initialized = True
         logger.info("UpbitAPI 초기화 완료")
@@ -1,7 +1,21 @@
 """
 업비트 API 유틸리티 패키지
 """
-from .auth import generate_auth_headers
+from .auth import generate_auth_headers, get_signer, Signer
+from .request import RequestPipeline, RateLimiter
+from .pagination import iter_pages, PageFetchError
+from .decoding import (
+    loads,
+    candle_dtype,
+    orderbook_dtype,
+    trade_dtype,
+    decode_candles,
+    decode_orderbooks,
+    decode_trades,
+    candles_from_records,
+    trades_from_records,
+    candles_from_dataframe
+)
 from .validators import (
     validate_ticker,
     validate_order_params,
@@ -1,50 +1,125 @@
 """
 업비트 API 인증 관련 유틸리티 함수
+- HS256 JWT 서명 (키별 HMAC 상태와 JWT 헤더 세그먼트를 재사용하여 요청마다 키를 다시 준비하지 않음)
 """
-import uuid
-import jwt
+import base64
 import hashlib
+import hmac
+import json
 import logging
+import threading
+import uuid
 from urllib.parse import urlencode, unquote
 
 logger = logging.getLogger(__name__)
 
+
+def _b64url(data):
+    return base64.urlsafe_b64encode(data).rstrip(b'=')
+
+
+def query_hash(query):
+    """
+    쿼리 파라미터 SHA512 해시 (업비트 query_hash 규격)
+
+    Args:
+        query (dict): 쿼리 파라미터 (리스트 값은 'key[]=a&key[]=b' 형태로 인코딩)
+
+    Returns:
+        str: 16진수 해시
+    """
+    query_string = unquote(urlencode(query, doseq=True)).encode('utf-8')
+    return hashlib.sha512(query_string).hexdigest()
+
+
+class Signer:
+    """
+    업비트 API JWT 서명기 (액세스 키 1개)
+    - PyJWT와 같은 HS256 토큰을 생성하되, 시크릿 키로 초기화한 HMAC 객체를 복사해서 사용
+    """
+
+    _HEADER = _b64url(json.dumps({'alg': 'HS256', 'typ': 'JWT'}, separators=(',', ':')).encode('utf-8'))
+
+    def __init__(self, access_key, secret_key):
+        """
+        Args:
+            access_key (str): 업비트 액세스 키
+            secret_key (str): 업비트 시크릿 키
+        """
+        self.access_key = access_key
+        self._mac = hmac.new(secret_key.encode('utf-8'), digestmod=hashlib.sha256)
+
+    def token(self, query=None):
+        """
+        JWT 토큰 생성
+
+        Args:
+            query (dict, optional): 쿼리 파라미터 (있으면 query_hash 포함)
+
+        Returns:
+            str: JWT 토큰
+        """
+        payload = {
+            'access_key': self.access_key,
+            'nonce': str(uuid.uuid4())
+        }
+        if query:
+            payload['query_hash'] = query_hash(query)
+            payload['query_hash_alg'] = 'SHA512'
+
+        signing_input = self._HEADER + b'.' + _b64url(json.dumps(payload, separators=(',', ':')).encode('utf-8'))
+        mac = self._mac.copy()
+        mac.update(signing_input)
+        return (signing_input + b'.' + _b64url(mac.digest())).decode('ascii')
+
+    def headers(self, query=None):
+        """
+        인증 헤더 생성
+
+        Returns:
+            dict: {'Authorization': 'Bearer ...'}
+        """
+        return {'Authorization': f'Bearer {self.token(query)}'}
+
+
+_signers = {}
+_signers_lock = threading.Lock()
+
+
+def get_signer(access_key, secret_key):
+    """
+    액세스 키별 서명기 조회 (없으면 생성하여 재사용)
+
+    Returns:
+        Signer: 서명기
+    """
+    key = (access_key, hashlib.sha256(secret_key.encode('utf-8')).digest())
+    signer = _signers.get(key)
+    if signer is None:
+        with _signers_lock:
+            signer = _signers.get(key)
+            if signer is None:
+                # 키가 교체되는 경우를 대비해 보관 개수 제한
+                if len(_signers) >= 64:
+                    _signers.clear()
+                signer = _signers[key] = Signer(access_key, secret_key)
+    return signer
+
+
 def generate_auth_headers(access_key, secret_key, query=None):
     """
     API 요청에 필요한 인증 헤더 생성
-    
+
     Args:
         access_key (str): 업비트 액세스 키
         secret_key (str): 업비트 시크릿 키
         query (dict, optional): 쿼리 파라미터
-        
+
     Returns:
         dict: 인증 헤더
     """
     try:
-        payload = {
-            'access_key': access_key,
-            'nonce': str(uuid.uuid4())
-        }
-        
-        if query:
-            m = hashlib.sha512()
-            query_string = unquote(urlencode(query, doseq=True)).encode()
-            m.update(query_string)
-            query_hash = m.hexdigest()
-            
-            payload['query_hash'] = query_hash
-            payload['query_hash_alg'] = 'SHA512'
-        
-        jwt_token = jwt.encode(payload, secret_key, algorithm="HS256")
-        
-        # PyJWT 2.0.0 이상에서는 bytes가 아닌 문자열 반환
-        if isinstance(jwt_token, bytes):
-            jwt_token = jwt_token.decode('utf-8')
-        
-        return {
-            'Authorization': f'Bearer {jwt_token}'
-        }
+        return get_signer(access_key, secret_key).headers(query)
     except Exception as e:
         logger.error(f"인증 헤더 생성 중 오류 발생: {e}")
-        return {}
\ No newline at end of file
+        return {}
@@ -0,0 +1,184 @@
+"""
+업비트 응답 디코딩
+- orjson이 설치되어 있으면 사용 (없으면 표준 json, 응답 본문 bytes를 바로 파싱)
+- 캔들/호가/체결 응답을 DataFrame을 거치지 않고 NumPy 구조화 배열로 변환 (컬럼은 복사 없이 뷰로 꺼내 쓸 수 있음)
+- numpy는 첫 변환 시점에 로드
+"""
+import functools
+import json
+from operator import itemgetter
+
+try:
+    import orjson
+except ImportError:  # 선택 패키지
+    orjson = None
+
+# 캔들 필드 (구조화 배열 필드명, 업비트 응답 키)
+CANDLE_FIELDS = (
+    ('open', 'opening_price'),
+    ('high', 'high_price'),
+    ('low', 'low_price'),
+    ('close', 'trade_price'),
+    ('volume', 'candle_acc_trade_volume'),
+    ('value', 'candle_acc_trade_price'),
+)
+ORDERBOOK_FIELDS = ('ask_price', 'bid_price', 'ask_size', 'bid_size')
+# KST 벽시계 시각과 UTC epoch 밀리초의 차이 (체결/호가 timestamp를 캔들 time과 같은 기준으로 맞춤)
+KST_OFFSET_MS = 9 * 60 * 60 * 1000
+
+_candle_values = itemgetter(*(key for _, key in CANDLE_FIELDS))
+_orderbook_values = itemgetter(*ORDERBOOK_FIELDS)
+
+
+def loads(data):
+    """
+    JSON 파싱 (orjson 우선)
+
+    Args:
+        data (bytes | str): 응답 본문
+
+    Returns:
+        파싱된 값
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=None)
+def candle_dtype():
+    """
+    캔들 구조화 dtype
+    - time: 캔들 시작 시각 (KST 벽시계 기준 epoch 밀리초, pyupbit DataFrame 인덱스와 같은 기준)
+    - open/high/low/close/volume/value: float64
+    """
+    import numpy as np
+    return np.dtype([('time', '<i8')] + [(name, '<f8') for name, _ in CANDLE_FIELDS])
+
+
+@functools.lru_cache(maxsize=None)
+def orderbook_dtype():
+    """호가 단위 구조화 dtype (ask_price, bid_price, ask_size, bid_size: float64)"""
+    import numpy as np
+    return np.dtype([(name, '<f8') for name in ORDERBOOK_FIELDS])
+
+
+@functools.lru_cache(maxsize=None)
+def trade_dtype():
+    """
+    체결 구조화 dtype
+    - time: 체결 시각 (KST 벽시계 기준 epoch 밀리초, candle_dtype의 time과 같은 기준)
+    - price/volume: float64, side: 1 매수(BID) / -1 매도(ASK), sequential_id: 체결 번호
+    """
+    import numpy as np
+    return np.dtype([('time', '<i8'), ('price', '<f8'), ('volume', '<f8'), ('side', 'i1'), ('sequential_id', '<i8')])
+
+
+def candles_from_records(records):
+    """
+    캔들 레코드 목록을 구조화 배열로 변환
+
+    Args:
+        records (list): /v1/candles 응답 (최신순)
+
+    Returns:
+        np.ndarray: candle_dtype 배열 (오래된 순)
+    """
+    import numpy as np
+
+    records = records[::-1]
+    out = np.empty(len(records), dtype=candle_dtype())
+    out['time'] = np.array(
+        [record['candle_date_time_kst'] for record in records], dtype='datetime64[ms]'
+    ).view(np.int64)
+    values = np.array(list(map(_candle_values, records)), dtype=np.float64).reshape(len(records), len(CANDLE_FIELDS))
+    for i, (name, _) in enumerate(CANDLE_FIELDS):
+        out[name] = values[:, i]
+    return out
+
+
+def candles_from_dataframe(df):
+    """
+    pyupbit 형식 OHLCV DataFrame을 구조화 배열로 변환 (pyupbit 호환 클라이언트용)
+
+    Returns:
+        np.ndarray: candle_dtype 배열 (오래된 순)
+    """
+    import numpy as np
+
+    out = np.empty(len(df), dtype=candle_dtype())
+    out['time'] = df.index.values.astype('datetime64[ms]').view(np.int64)
+    for name, _ in CANDLE_FIELDS:
+        if name in df:
+            out[name] = df[name].to_numpy(dtype=np.float64)
+        else:
+            out[name] = np.nan
+    return out
+
+
+def decode_candles(body):
+    """캔들 응답 본문을 구조화 배열로 디코딩"""
+    return candles_from_records(loads(body))
+
+
+def orderbooks_from_records(records):
+    """
+    호가 레코드 목록을 마켓별 구조화 배열로 변환
+
+    Args:
+        records (list): /v1/orderbook 응답
+
+    Returns:
+        dict: 마켓 → {'timestamp', 'total_ask_size', 'total_bid_size', 'units': orderbook_dtype 배열}
+    """
+    import numpy as np
+
+    books = {}
+    for record in records:
+        units = record.get('orderbook_units') or []
+        books[record['market']] = {
+            'timestamp': record.get('timestamp'),
+            'total_ask_size': record.get('total_ask_size'),
+            'total_bid_size': record.get('total_bid_size'),
+            'units': np.array(list(map(_orderbook_values, units)), dtype=np.float64)
+                       .reshape(len(units), len(ORDERBOOK_FIELDS))
+                       .view(orderbook_dtype()).reshape(len(units)),
+        }
+    return books
+
+
+def decode_orderbooks(body):
+    """호가 응답 본문을 마켓별 구조화 배열로 디코딩"""
+    return orderbooks_from_records(loads(body))
+
+
+def trades_from_records(records):
+    """
+    체결 레코드 목록을 구조화 배열로 변환
+
+    Args:
+        records (list): /v1/trades/ticks 응답 (최신순)
+
+    Returns:
+        np.ndarray: trade_dtype 배열 (오래된 순)
+    """
+    import numpy as np
+
+    out = np.empty(len(records), dtype=trade_dtype())
+    out['time'] = [record['timestamp'] + KST_OFFSET_MS for record in records]
+    out['price'] = [record['trade_price'] for record in records]
+    out['volume'] = [record['trade_volume'] for record in records]
+    out['side'] = [1 if record.get('ask_bid') == 'BID' else -1 for record in records]
+    out['sequential_id'] = [record.get('sequential_id', 0) for record in records]
+    # 같은 시각은 체결 번호 순
+    return out[np.lexsort((out['sequential_id'], out['time']))]
+
+
+def decode_trades(body):
+    """체결 응답 본문을 구조화 배열로 디코딩"""
+    return trades_from_records(loads(body))
+
+
+def to_columns(array):
+    """구조화 배열을 필드별 배열 dict로 변환 (복사 없이 뷰)"""
+    return {name: array[name] for name in array.dtype.names}
@@ -0,0 +1,11 @@
+"""
+업비트 API HTTP 세션
+- 모든 모듈이 공유하는 requests.Session (연결 재사용)
+- 응답 훅으로 엔드포인트 그룹별 요청 시간/실패 메트릭 기록
+"""
+import requests
+
+from utils.manager_metrics.manager_metrics import observe_upbit_response
+
+session = requests.Session()
+session.hooks['response'].append(observe_upbit_response)
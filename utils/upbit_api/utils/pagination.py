@@ -0,0 +1,95 @@
+"""
+업비트 API 페이지 순회 유틸리티
+- 페이지 단위(최대 100건) 목록 API를 레코드 단위 제너레이터로 변환
+- 현재 페이지의 끝부분을 소비하는 동안 다음 페이지를 백그라운드에서 미리 조회 (prefetch)
+  → 끝까지 순회하면 페이지 사이 대기가 줄고, 워터마크에서 일찍 멈추는 소비자는 다음 페이지 요청을 보내지 않음
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+class PageFetchError(RuntimeError):
+    """페이지 조회 실패 (API가 {"error": ...}를 반환한 경우)"""
+
+    def __init__(self, page, error):
+        super().__init__(f"{page} 페이지 조회 실패: {error}")
+        self.page = page
+        self.error = error
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='upbit-prefetch')
+    return _executor
+
+
+def iter_pages(fetch_page, limit=100, start_page=1, max_pages=None, prefetch=True, key=None, prefetch_margin=10):
+    """
+    페이지 번호 기반 목록 API를 레코드 단위로 순회
+
+    - 받은 페이지가 limit보다 짧으면 마지막 페이지로 보고 종료
+    - prefetch가 켜져 있으면 페이지의 마지막 prefetch_margin개 레코드에 도달했을 때 다음 페이지 요청을 먼저 보냄
+      (그 전에 순회를 멈추면 다음 페이지는 요청하지 않음)
+    - 순회 중 새 레코드가 추가되면 페이지 경계가 밀려 같은 레코드가 다시 나올 수 있으므로 key로 중복 제거
+
+    Args:
+        fetch_page (callable): page 번호를 받아 레코드 리스트(또는 {"error": ...})를 반환하는 함수
+        limit (int): 페이지 크기
+        start_page (int): 시작 페이지
+        max_pages (int, optional): 최대 조회 페이지 수
+        prefetch (bool): 다음 페이지 미리 조회 여부
+        key (str, optional): 중복 제거에 사용할 레코드 필드 (예: 'uuid')
+        prefetch_margin (int): 페이지 끝에서 몇 번째 레코드부터 다음 페이지를 미리 조회할지
+
+    Yields:
+        dict: 레코드
+
+    Raises:
+        PageFetchError: 페이지 조회 실패
+    """
+    def _fetch(page):
+        result = fetch_page(page)
+        if isinstance(result, dict) and 'error' in result:
+            raise PageFetchError(page, result['error'])
+        return result or []
+
+    def _has_next(page, records):
+        return len(records) >= limit and (max_pages is None or page - start_page + 1 < max_pages)
+
+    seen = set() if key else None
+    page = start_page
+    pending = None
+    try:
+        records = _fetch(page)
+        while True:
+            has_next = _has_next(page, records)
+            trigger = max(0, len(records) - prefetch_margin) if has_next and prefetch else None
+
+            for index, record in enumerate(records):
+                if index == trigger:
+                    pending = _get_executor().submit(_fetch, page + 1)
+                if seen is not None:
+                    value = record.get(key)
+                    if value in seen:
+                        continue
+                    seen.add(value)
+                yield record
+
+            if not has_next:
+                return
+            page += 1
+            if pending is not None:
+                future, pending = pending, None
+                records = future.result()
+            else:
+                records = _fetch(page)
+    finally:
+        # 소비자가 순회를 중단하면 아직 시작되지 않은 다음 페이지 요청은 취소
+        if pending is not None:
+            pending.cancel()
@@ -0,0 +1,176 @@
+"""
+업비트 API 요청 파이프라인
+- 모든 모듈 메서드가 공유: 서명 → 요청 제한 → 전송(공유 세션) → 디코딩(orjson 우선, 엔드포인트별 디코더 지정 가능)
+- 요청 시간/실패는 공유 세션의 응답 훅이 엔드포인트 그룹별로 기록
+- 업비트 요청 수 제한 그룹(order / default / quotation)별 토큰 버킷, 응답의 Remaining-Req 헤더로 보정
+"""
+import logging
+import threading
+import time
+
+from utils.manager_metrics.manager_metrics import RATE_LIMIT_WAIT_SECONDS
+from .auth import get_signer
+from .decoding import loads
+from .http import session
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """초당 요청 수 제한 (토큰 버킷)"""
+
+    def __init__(self, name, rate, burst=None):
+        """
+        Args:
+            name (str): 메트릭 라벨
+            rate (float): 초당 요청 수
+            burst (float, optional): 최대 연속 요청 수 (기본값 rate)
+        """
+        self.name = name
+        self.rate = float(rate)
+        self.burst = float(burst or rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """요청 1회분 토큰 확보 (부족하면 대기)"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            RATE_LIMIT_WAIT_SECONDS.labels(self.name).observe(wait)
+            time.sleep(wait)
+
+    def limit_remaining(self, remaining):
+        """서버가 알려준 남은 요청 수보다 많이 보내지 않도록 토큰 수 보정"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, float(remaining))
+
+    def pause(self, seconds):
+        """이후 요청을 seconds 동안 보내지 않음 (429 응답 시)"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+def parse_remaining_req(value):
+    """
+    Remaining-Req 헤더 파싱 (예: 'group=default; min=1800; sec=29')
+
+    Returns:
+        tuple: (그룹, 초당 남은 요청 수) 또는 (None, None)
+    """
+    fields = {}
+    for item in (value or '').split(';'):
+        key, _, field = item.strip().partition('=')
+        fields[key] = field
+    try:
+        return fields['group'], int(fields['sec'])
+    except (KeyError, ValueError):
+        return None, None
+
+
+class RequestPipeline:
+    """
+    업비트 API 요청 파이프라인 (UpbitAPI 인스턴스당 1개)
+    """
+
+    # 업비트 요청 수 제한 (초당)
+    RATE_LIMITS = {'order': 8, 'default': 30, 'quotation': 10}
+
+    def __init__(self, api, timeout=10, max_retries=1):
+        """
+        Args:
+            api (UpbitAPI): 서버 주소와 인증 키를 가진 상위 인스턴스
+            timeout (float): 요청 제한 시간 (초)
+            max_retries (int): 429(요청 수 초과) 응답 시 재시도 횟수
+        """
+        self.api = api
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.limiters = {
+            group: RateLimiter(f'upbit_{group}', rate) for group, rate in self.RATE_LIMITS.items()
+        }
+
+    @staticmethod
+    def rate_group(method, path, auth):
+        """요청이 속한 업비트 요청 수 제한 그룹"""
+        if not auth:
+            return 'quotation'
+        if method in ('POST', 'DELETE') and path.startswith(('/v1/order', '/v1/orders')):
+            return 'order'
+        return 'default'
+
+    def request(self, method, path, params=None, label='업비트 API 요청', auth=True, success=(200, 201), credentials=None,
+                decode=None):
+        """
+        API 요청
+
+        Args:
+            method (str): HTTP 메서드 (GET, POST, DELETE)
+            path (str): API 경로 (예: /v1/deposits)
+            params (dict, optional): 쿼리 파라미터 (POST는 JSON 본문)
+            label (str): 로그에 사용할 요청 이름
+            auth (bool): 인증 필요 여부
+            success (tuple): 성공으로 볼 상태 코드
+            credentials (tuple, optional): (access_key, secret_key) - 지정하면 상위 인스턴스의 키 대신 사용
+                                           (백그라운드 갱신처럼 호출 시점의 키로 서명해야 할 때)
+            decode (callable, optional): 응답 본문(bytes) 디코더 (기본값은 JSON 파싱)
+
+        Returns:
+            디코딩된 JSON 응답 또는 {"error": ...}
+        """
+        try:
+            if auth and credentials is None:
+                credentials = (self.api.access_key, self.api.secret_key) if self.api else (None, None)
+            if auth and (not credentials[0] or not credentials[1]):
+                return {"error": "API 키가 설정되지 않았습니다."}
+
+            params = params or {}
+            group = self.rate_group(method, path, auth)
+            url = f"{self.api.server_url if self.api else 'https://api.upbit.com'}{path}"
+
+            for attempt in range(self.max_retries + 1):
+                headers = get_signer(*credentials).headers(params) if auth else {}
+                kwargs = {'headers': headers, 'timeout': self.timeout}
+                if method == 'POST':
+                    headers['Content-Type'] = 'application/json'
+                    kwargs['json'] = params
+                elif params:
+                    kwargs['params'] = params
+
+                self.limiters[group].acquire()
+                response = session.request(method, url, **kwargs)
+
+                remaining_group, remaining = parse_remaining_req(response.headers.get('Remaining-Req'))
+                if remaining is not None:
+                    self.limiters.get(remaining_group, self.limiters[group]).limit_remaining(remaining)
+
+                if response.status_code != 429 or attempt >= self.max_retries:
+                    break
+                logger.warning("%s 요청 수 초과 (429), 재시도", label)
+                self.limiters[group].pause(1.0)
+
+            if response.status_code in success:
+                return (decode or loads)(response.content)
+            logger.error(f"{label} 실패: {response.text}")
+            return {"error": response.text}
+        except Exception as e:
+            logger.error(f"{label} 중 오류 발생: {e}")
+            return {"error": str(e)}
+
+    def get(self, path, params=None, label='업비트 API 요청', auth=True, credentials=None, decode=None):
+        return self.request('GET', path, params, label, auth, credentials=credentials, decode=decode)
+
+    def post(self, path, params=None, label='업비트 API 요청', auth=True):
+        return self.request('POST', path, params, label, auth)
+
+    def delete(self, path, params=None, label='업비트 API 요청', auth=True):
+        return self.request('DELETE', path, params, label, auth)
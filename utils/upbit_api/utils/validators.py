@@ -3,15 +3,17 @@
 """
 import logging
 import uuid
+from ..market_catalog import MarketCatalog
 
 logger = logging.getLogger(__name__)
 
-def validate_ticker(ticker):
+def validate_ticker(ticker, check_exists=True):
     """
     코인 티커 유효성 검사
     
     Args:
         ticker (str): 검사할 티커 (예: KRW-BTC)
+        check_exists (bool): 마켓 카탈로그로 실제 거래 가능한 마켓인지 확인 (카탈로그를 불러올 수 없으면 형식만 검사)
         
     Returns:
         bool: 유효성 여부
@@ -33,6 +35,10 @@ def validate_ticker(ticker):
     if market not in valid_markets:
         return False
     
+    # 상장 여부 검사 (서명/전송 전에 로컬에서 거절)
+    if check_exists and MarketCatalog().exists(ticker) is False:
+        return False
+    
     return True
 
 def validate_order_params(side, ord_type, volume=None, price=None):
@@ -0,0 +1,47 @@
+"""
+업비트 모의 거래소 패키지
+- 인메모리 주문 매칭 엔진 (SimulatedExchange)
+- 기록된 시장 데이터 재생 (MarketDataReplay)
+- pyupbit 호환 인프로세스 클라이언트 (SimulatedPyupbit)
+- 업비트 REST 호환 로컬 HTTP 서버 (SimulatedExchangeServer)
+
+실행 예:
+    python -m utils.upbit_simulator --data market.json --port 7200
+"""
+from .market_data import MarketDataReplay, generate_random_walk
+from .exchange import SimulatedExchange, SimulatorError
+from .client import SimulatedPyupbit, SimulatedUpbit
+from .server import SimulatedExchangeServer
+
+
+def install(exchange, request_interval=0.0):
+    """
+    UpbitService의 기본 클라이언트와 마켓 카탈로그를 모의 거래소로 교체 (인프로세스 모드)
+
+    Args:
+        exchange (SimulatedExchange): 사용할 모의 거래소
+        request_interval (float): 연속 시세 조회 사이 대기 시간 (초)
+
+    Returns:
+        SimulatedPyupbit: 설치된 클라이언트
+    """
+    from service.upbit.upbit_service import UpbitService
+    from utils.upbit_api.market_catalog import MarketCatalog
+    from utils.market_data.candle_store import CandleStore
+
+    client = SimulatedPyupbit(exchange)
+    UpbitService.set_default_client(client, request_interval=request_interval)
+    MarketCatalog().configure(loader=exchange.list_markets)
+    CandleStore().clear()
+    return client
+
+
+def uninstall():
+    """UpbitService의 기본 클라이언트를 실제 pyupbit로 복원"""
+    from service.upbit.upbit_service import UpbitService
+    from utils.upbit_api.market_catalog import MarketCatalog
+    from utils.market_data.candle_store import CandleStore
+
+    UpbitService.set_default_client(None)
+    MarketCatalog().reset()
+    CandleStore().clear()
@@ -0,0 +1,46 @@
+"""
+모의 거래소 HTTP 서버 실행 스크립트
+
+    python -m utils.upbit_simulator --data market.json --port 7200
+    python -m utils.upbit_simulator --synthetic KRW-BTC,KRW-ETH --periods 500
+"""
+import argparse
+import logging
+
+from .exchange import SimulatedExchange
+from .market_data import MarketDataReplay, generate_random_walk
+from .server import SimulatedExchangeServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="업비트 모의 거래소 서버")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=7200)
+    parser.add_argument('--data', help="기록된 시장 데이터 JSON 파일")
+    parser.add_argument('--synthetic', help="합성 데이터를 생성할 마켓 목록 (쉼표 구분)")
+    parser.add_argument('--periods', type=int, default=200, help="합성 캔들 개수")
+    parser.add_argument('--unit', default='days', help="합성 캔들 단위")
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    if args.synthetic:
+        market_data = generate_random_walk(
+            args.synthetic.split(','), periods=args.periods, unit=args.unit, seed=args.seed
+        )
+    else:
+        market_data = MarketDataReplay()
+        if args.data:
+            market_data.load_file(args.data)
+            market_data.seek_index(-1)
+
+    server = SimulatedExchangeServer(SimulatedExchange(market_data), args.host, args.port)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
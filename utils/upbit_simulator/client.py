@@ -0,0 +1,166 @@
+"""
+모의 거래소 인프로세스 클라이언트
+- pyupbit 모듈과 동일한 함수 이름/반환 형식을 제공하여 UpbitService에 그대로 주입 가능
+"""
+import functools
+import logging
+
+from .exchange import SimulatorError
+from .market_data import parse_candle_time
+
+logger = logging.getLogger(__name__)
+
+# pyupbit interval 이름 → 업비트 캔들 단위
+INTERVAL_UNITS = {
+    'day': 'days',
+    'days': 'days',
+    'week': 'weeks',
+    'weeks': 'weeks',
+    'month': 'months',
+    'months': 'months',
+    'minute1': 'minutes/1',
+    'minute3': 'minutes/3',
+    'minute5': 'minutes/5',
+    'minute10': 'minutes/10',
+    'minute15': 'minutes/15',
+    'minute30': 'minutes/30',
+    'minute60': 'minutes/60',
+    'minute240': 'minutes/240',
+}
+
+
+class SimulatedUpbit:
+    """
+    pyupbit.Upbit 호환 모의 계좌 객체
+    - 오류는 pyupbit와 동일하게 {"error": {...}} 딕셔너리로 반환
+    """
+
+    def __init__(self, exchange, access_key, secret_key=None):
+        self.exchange = exchange
+        self.access_key = access_key
+        if not exchange.has_account(access_key):
+            exchange.open_account(access_key, secret_key)
+
+    def _call(self, func, *args, **kwargs):
+        try:
+            return func(self.access_key, *args, **kwargs)
+        except SimulatorError as e:
+            return e.to_dict()
+
+    def get_balances(self):
+        return self._call(self.exchange.get_accounts)
+
+    def get_balance(self, ticker="KRW"):
+        """주문 가능 잔고 (락 제외)"""
+        currency = ticker.split('-')[-1]
+        balances = self.get_balances()
+        if isinstance(balances, dict) and 'error' in balances:
+            return balances
+        for account in balances:
+            if account['currency'] == currency:
+                return float(account['balance'])
+        return 0
+
+    def get_chance(self, ticker):
+        return self._call(self.exchange.get_order_chance, ticker)
+
+    def buy_market_order(self, ticker, price):
+        return self._call(self.exchange.place_order, ticker, 'bid', 'price', price=price)
+
+    def sell_market_order(self, ticker, volume):
+        return self._call(self.exchange.place_order, ticker, 'ask', 'market', volume=volume)
+
+    def buy_limit_order(self, ticker, price, volume):
+        return self._call(self.exchange.place_order, ticker, 'bid', 'limit', volume=volume, price=price)
+
+    def sell_limit_order(self, ticker, price, volume):
+        return self._call(self.exchange.place_order, ticker, 'ask', 'limit', volume=volume, price=price)
+
+    def cancel_order(self, uuid):
+        return self._call(self.exchange.cancel_order, uuid)
+
+    def get_order(self, ticker_or_uuid, state='wait'):
+        if '-' in ticker_or_uuid and len(ticker_or_uuid) < 20:
+            return self._call(self.exchange.get_orders, ticker_or_uuid, [state])
+        return self._call(self.exchange.get_order, ticker_or_uuid)
+
+
+class SimulatedPyupbit:
+    """
+    pyupbit 모듈 호환 인프로세스 클라이언트
+
+    사용 예:
+        exchange = SimulatedExchange(generate_random_walk(['KRW-BTC']))
+        UpbitService.set_default_client(SimulatedPyupbit(exchange), request_interval=0)
+    """
+
+    def __init__(self, exchange):
+        self.exchange = exchange
+        # pyupbit.Upbit(access, secret) 형태 호출 지원
+        self.Upbit = functools.partial(SimulatedUpbit, exchange)
+
+    def get_tickers(self, fiat=''):
+        markets = self.exchange.market_data.markets()
+        if fiat:
+            markets = [m for m in markets if m.startswith(f"{fiat}-")]
+        return markets
+
+    def get_current_price(self, ticker="KRW-BTC"):
+        if isinstance(ticker, (list, tuple)):
+            return {t['market']: t['trade_price'] for t in self.exchange.get_tickers(ticker)}
+        tickers = self.exchange.get_tickers([ticker])
+        return tickers[0]['trade_price'] if tickers else None
+
+    def get_ohlcv(self, ticker="KRW-BTC", interval="day", count=200, to=None, period=0.1):
+        """pyupbit.get_ohlcv와 동일한 형식의 DataFrame 반환 (오래된 순)"""
+        import pandas as pd
+
+        unit = INTERVAL_UNITS.get(interval)
+        if unit is None:
+            return None
+        # pyupbit처럼 200개씩 나누어 과거 방향으로 조회
+        candles = []
+        before = None
+        while len(candles) < count:
+            chunk = self.exchange.get_candles(ticker, unit, min(count - len(candles), 200), before)
+            if not chunk:
+                break
+            candles.extend(chunk)
+            before = parse_candle_time(chunk[-1]['candle_date_time_utc'])
+        if not candles:
+            return None
+
+        candles = candles[::-1]
+        index = pd.to_datetime([c['candle_date_time_kst'] for c in candles])
+        df = pd.DataFrame({
+            'open': [c['opening_price'] for c in candles],
+            'high': [c['high_price'] for c in candles],
+            'low': [c['low_price'] for c in candles],
+            'close': [c['trade_price'] for c in candles],
+            'volume': [c['candle_acc_trade_volume'] for c in candles],
+            'value': [c['candle_acc_trade_price'] for c in candles],
+        }, index=index)
+        return df
+
+    def get_candles(self, ticker="KRW-BTC", interval="day", count=200, to=None):
+        """UpbitAPI 시세 모듈과 동일한 구조화 배열 반환 (오래된 순, DataFrame 생성 없음)"""
+        from utils.upbit_api.utils.decoding import candles_from_records
+
+        unit = INTERVAL_UNITS.get(interval)
+        if unit is None:
+            return {"error": f"지원하지 않는 캔들 간격입니다: {interval}"}
+        candles = []
+        before = None
+        while len(candles) < count:
+            chunk = self.exchange.get_candles(ticker, unit, min(count - len(candles), 200), before)
+            if not chunk:
+                break
+            candles.extend(chunk)
+            before = parse_candle_time(chunk[-1]['candle_date_time_utc'])
+        return candles_from_records(candles)
+
+    def get_orderbook(self, ticker="KRW-BTC"):
+        if isinstance(ticker, (list, tuple)):
+            return self.exchange.get_orderbook(ticker)
+        books = self.exchange.get_orderbook([ticker])
+        return books[0] if books else None
@@ -0,0 +1,644 @@
+"""
+모의 거래소 (인메모리 주문 매칭 엔진)
+- 계좌별 잔고/락 관리
+- 마켓별 호가창(가격-시간 우선) 및 주문 매칭
+- 재생 중인 시장 데이터 체결가를 외부 유동성으로 사용
+"""
+import bisect
+import logging
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import datetime, timedelta, timezone
+
+from .market_data import MarketDataReplay
+
+logger = logging.getLogger(__name__)
+
+KST = timezone(timedelta(hours=9))
+
+# 기본 수수료율 (0.05%)
+DEFAULT_FEE_RATE = 0.0005
+
+# 최소 주문 금액 (원화 마켓 기준)
+MIN_ORDER_TOTAL = 5000
+
+
+class SimulatorError(Exception):
+    """모의 거래소 오류 (업비트 오류 응답 형식으로 변환됨)"""
+
+    def __init__(self, name, message, status_code=400):
+        super().__init__(message)
+        self.name = name
+        self.message = message
+        self.status_code = status_code
+
+    def to_dict(self):
+        return {"error": {"name": self.name, "message": self.message}}
+
+
+def _fmt(value):
+    """숫자를 업비트 응답 형식의 문자열로 변환"""
+    if value is None:
+        return None
+    text = f"{value:.8f}".rstrip('0').rstrip('.')
+    return text if text not in ('', '-0') else '0'
+
+
+def _now_iso():
+    return datetime.now(KST).isoformat(timespec='seconds')
+
+
+class SimOrder:
+    """모의 주문"""
+
+    __slots__ = (
+        'uuid', 'access_key', 'market', 'side', 'ord_type', 'price', 'volume',
+        'remaining_volume', 'funds', 'remaining_funds', 'locked', 'paid_fee',
+        'executed_volume', 'executed_funds', 'state', 'created_at', 'seq', 'trades'
+    )
+
+    def __init__(self, access_key, market, side, ord_type, price, volume, seq):
+        self.uuid = str(uuid.uuid4())
+        self.access_key = access_key
+        self.market = market
+        self.side = side
+        self.ord_type = ord_type
+        self.price = price
+        self.volume = volume
+        self.remaining_volume = volume
+        # 시장가 매수(price) 주문의 주문 금액
+        self.funds = price if ord_type == 'price' else None
+        self.remaining_funds = self.funds
+        self.locked = 0.0
+        self.paid_fee = 0.0
+        self.executed_volume = 0.0
+        self.executed_funds = 0.0
+        self.state = 'wait'
+        self.created_at = _now_iso()
+        self.seq = seq
+        self.trades = []
+
+    def to_dict(self, with_trades=False):
+        """업비트 주문 응답 형식으로 변환"""
+        # 매수 주문의 락에는 수수료가 포함되어 있음
+        reserved_fee = self.locked - self.locked / (1 + DEFAULT_FEE_RATE) if self.side == 'bid' else 0.0
+        data = {
+            'uuid': self.uuid,
+            'side': self.side,
+            'ord_type': self.ord_type,
+            'price': _fmt(self.price),
+            'state': self.state,
+            'market': self.market,
+            'created_at': self.created_at,
+            'volume': _fmt(self.volume),
+            'remaining_volume': _fmt(self.remaining_volume),
+            'reserved_fee': _fmt(reserved_fee),
+            'remaining_fee': _fmt(reserved_fee),
+            'paid_fee': _fmt(self.paid_fee),
+            'locked': _fmt(self.locked),
+            'executed_volume': _fmt(self.executed_volume),
+            'executed_funds': _fmt(self.executed_funds),
+            'trades_count': len(self.trades),
+        }
+        if with_trades:
+            data['trades'] = list(self.trades)
+        return data
+
+
+class _BookSide:
+    """호가창 한쪽 면 (가격별 주문 큐 + 정렬된 가격 목록)"""
+
+    __slots__ = ('levels', 'prices', 'descending')
+
+    def __init__(self, descending):
+        self.levels = {}
+        self.prices = []
+        # 매수 호가는 높은 가격이 최우선
+        self.descending = descending
+
+    def best_price(self):
+        if not self.prices:
+            return None
+        return self.prices[-1] if self.descending else self.prices[0]
+
+    def add(self, order):
+        queue = self.levels.get(order.price)
+        if queue is None:
+            queue = self.levels[order.price] = deque()
+            bisect.insort(self.prices, order.price)
+        queue.append(order)
+
+    def best_queue(self):
+        price = self.best_price()
+        return price, (self.levels[price] if price is not None else None)
+
+    def remove_level(self, price):
+        del self.levels[price]
+        index = bisect.bisect_left(self.prices, price)
+        del self.prices[index]
+
+    def remove(self, order):
+        queue = self.levels.get(order.price)
+        if queue is None:
+            return
+        try:
+            queue.remove(order)
+        except ValueError:
+            return
+        if not queue:
+            self.remove_level(order.price)
+
+    def depth(self, limit):
+        """상위 limit개 가격 레벨 (가격, 잔량 합계)"""
+        prices = self.prices[::-1] if self.descending else self.prices
+        return [
+            (price, sum(o.remaining_volume for o in self.levels[price]))
+            for price in prices[:limit]
+        ]
+
+
+class _OrderBook:
+    __slots__ = ('bids', 'asks')
+
+    def __init__(self):
+        self.bids = _BookSide(descending=True)
+        self.asks = _BookSide(descending=False)
+
+
+class SimulatedExchange:
+    """
+    인메모리 모의 거래소
+    - 업비트 REST API와 동일한 의미의 메서드 제공 (HTTP 서버/인프로세스 클라이언트에서 공용)
+    - 주문은 먼저 내부 호가창과 매칭되고, 남은 수량은 재생 중인 시장 체결가로 체결
+    - 체결되지 않은 지정가 주문은 호가창에 남아 시장 데이터가 진행될 때 재평가
+    """
+
+    def __init__(self, market_data=None, fee_rate=DEFAULT_FEE_RATE, default_balances=None):
+        """
+        모의 거래소 초기화
+
+        Args:
+            market_data (MarketDataReplay, optional): 재생할 시장 데이터
+            fee_rate (float): 거래 수수료율
+            default_balances (dict, optional): 자동 개설 계좌의 초기 잔고 (예: {'KRW': 1000000})
+        """
+        self.market_data = market_data or MarketDataReplay()
+        self.fee_rate = fee_rate
+        self.default_balances = default_balances if default_balances is not None else {'KRW': 10000000}
+
+        self._lock = threading.RLock()
+        self._accounts = {}
+        self._secrets = {}
+        self._orders = {}
+        self._orders_by_account = {}
+        self._books = {}
+        self._seq = 0
+
+    # ------ 계좌 ------
+
+    def open_account(self, access_key, secret_key=None, balances=None):
+        """
+        계좌 개설 (이미 존재하면 잔고만 덮어씀)
+
+        Args:
+            access_key (str): 계좌 식별자로 사용할 액세스 키
+            secret_key (str, optional): JWT 서명 검증용 시크릿 키
+            balances (dict, optional): 화폐별 초기 잔고
+        """
+        with self._lock:
+            balances = self.default_balances if balances is None else balances
+            self._accounts[access_key] = {
+                currency: [float(amount), 0.0, 0.0] for currency, amount in balances.items()
+            }
+            self._orders_by_account.setdefault(access_key, [])
+            if secret_key:
+                self._secrets[access_key] = secret_key
+
+    def has_account(self, access_key):
+        """계좌 존재 여부"""
+        return access_key in self._accounts
+
+    def get_secret(self, access_key):
+        """계좌의 시크릿 키 (등록되지 않았으면 None)"""
+        return self._secrets.get(access_key)
+
+    def _account(self, access_key):
+        account = self._accounts.get(access_key)
+        if account is None:
+            if not access_key:
+                raise SimulatorError('invalid_access_key', '잘못된 엑세스 키입니다.', 401)
+            # 인프로세스 사용 편의를 위해 기본 잔고로 자동 개설
+            self.open_account(access_key)
+            account = self._accounts[access_key]
+        return account
+
+    def _wallet(self, account, currency):
+        wallet = account.get(currency)
+        if wallet is None:
+            wallet = account[currency] = [0.0, 0.0, 0.0]
+        return wallet
+
+    def get_accounts(self, access_key):
+        """전체 계좌 조회 (업비트 응답 형식)"""
+        with self._lock:
+            account = self._account(access_key)
+            return [
+                {
+                    'currency': currency,
+                    'balance': _fmt(wallet[0]),
+                    'locked': _fmt(wallet[1]),
+                    'avg_buy_price': _fmt(wallet[2]),
+                    'avg_buy_price_modified': False,
+                    'unit_currency': 'KRW',
+                }
+                for currency, wallet in account.items()
+                if wallet[0] > 0 or wallet[1] > 0 or currency == 'KRW'
+            ]
+
+    # ------ 주문 ------
+
+    def _parse_market(self, market):
+        parts = (market or '').split('-')
+        if len(parts) != 2 or not all(parts):
+            raise SimulatorError('invalid_market', '유효하지 않은 마켓 코드입니다.')
+        return parts[0], parts[1]
+
+    def get_order_chance(self, access_key, market):
+        """주문 가능 정보 조회"""
+        with self._lock:
+            quote, base = self._parse_market(market)
+            account = self._account(access_key)
+            bid_wallet = self._wallet(account, quote)
+            ask_wallet = self._wallet(account, base)
+            return {
+                'bid_fee': _fmt(self.fee_rate),
+                'ask_fee': _fmt(self.fee_rate),
+                'maker_bid_fee': _fmt(self.fee_rate),
+                'maker_ask_fee': _fmt(self.fee_rate),
+                'market': {
+                    'id': market,
+                    'name': f"{base}/{quote}",
+                    'order_types': ['limit'],
+                    'order_sides': ['ask', 'bid'],
+                    'bid_types': ['limit', 'price'],
+                    'ask_types': ['limit', 'market'],
+                    'bid': {'currency': quote, 'min_total': str(MIN_ORDER_TOTAL)},
+                    'ask': {'currency': quote, 'min_total': str(MIN_ORDER_TOTAL)},
+                    'max_total': '1000000000',
+                    'state': 'active',
+                },
+                'bid_account': self._account_entry(quote, bid_wallet),
+                'ask_account': self._account_entry(base, ask_wallet),
+            }
+
+    def _account_entry(self, currency, wallet):
+        return {
+            'currency': currency,
+            'balance': _fmt(wallet[0]),
+            'locked': _fmt(wallet[1]),
+            'avg_buy_price': _fmt(wallet[2]),
+            'avg_buy_price_modified': False,
+            'unit_currency': 'KRW',
+        }
+
+    def place_order(self, access_key, market, side, ord_type, volume=None, price=None):
+        """
+        주문 접수 및 즉시 매칭
+
+        Args:
+            access_key (str): 계좌 액세스 키
+            market (str): 마켓 코드
+            side (str): 'bid' 또는 'ask'
+            ord_type (str): 'limit', 'price'(시장가 매수), 'market'(시장가 매도)
+            volume (str|float, optional): 주문 수량
+            price (str|float, optional): 주문 가격 (시장가 매수는 주문 금액)
+
+        Returns:
+            dict: 주문 정보 (업비트 응답 형식)
+        """
+        volume = float(volume) if volume not in (None, '') else None
+        price = float(price) if price not in (None, '') else None
+
+        if side not in ('bid', 'ask'):
+            raise SimulatorError('invalid_side', "주문 종류(side)는 'bid' 또는 'ask'만 가능합니다.")
+        if ord_type == 'limit':
+            if not price or not volume or price <= 0 or volume <= 0:
+                raise SimulatorError('invalid_parameter', '지정가 주문에는 가격과 수량이 필요합니다.')
+        elif ord_type == 'price':
+            if side != 'bid' or not price or price <= 0:
+                raise SimulatorError('invalid_parameter', '시장가 매수 주문에는 금액(price)이 필요합니다.')
+        elif ord_type == 'market':
+            if side != 'ask' or not volume or volume <= 0:
+                raise SimulatorError('invalid_parameter', '시장가 매도 주문에는 수량(volume)이 필요합니다.')
+        else:
+            raise SimulatorError('invalid_ord_type', '지원하지 않는 주문 타입입니다.')
+
+        with self._lock:
+            quote, base = self._parse_market(market)
+            account = self._account(access_key)
+
+            reference = self.market_data.current_price(market)
+            if ord_type != 'limit' and reference is None:
+                raise SimulatorError('market_not_available', f"{market}의 시세 데이터가 없습니다.")
+
+            # 최소 주문 금액 확인
+            notional = price if ord_type == 'price' else (volume * (price or reference or 0))
+            if quote == 'KRW' and notional < MIN_ORDER_TOTAL:
+                raise SimulatorError('under_min_total_bid' if side == 'bid' else 'under_min_total_ask',
+                                     f"최소주문금액 이상으로 주문해주세요. ({MIN_ORDER_TOTAL} {quote})")
+
+            self._seq += 1
+            order = SimOrder(access_key, market, side, ord_type, price, volume, self._seq)
+
+            # 잔고 락
+            if side == 'bid':
+                required = (price if ord_type == 'price' else price * volume) * (1 + self.fee_rate)
+                wallet = self._wallet(account, quote)
+            else:
+                required = volume
+                wallet = self._wallet(account, base)
+
+            if wallet[0] + 1e-12 < required:
+                raise SimulatorError('insufficient_funds_' + side, '주문가능한 금액(잔고)이 부족합니다.')
+            wallet[0] -= required
+            wallet[1] += required
+            order.locked = required
+
+            self._orders[order.uuid] = order
+            self._orders_by_account.setdefault(access_key, []).append(order)
+
+            self._match(order, reference)
+            return order.to_dict()
+
+    def _book(self, market):
+        book = self._books.get(market)
+        if book is None:
+            book = self._books[market] = _OrderBook()
+        return book
+
+    def _match(self, order, reference):
+        """주문 매칭: 내부 호가창 → 외부(재생) 체결가 → 잔여 지정가는 호가창 등록"""
+        book = self._book(order.market)
+        opposite = book.asks if order.side == 'bid' else book.bids
+
+        while not self._is_filled(order):
+            best, queue = opposite.best_queue()
+            if best is None or not self._crosses(order, best):
+                break
+            maker = queue[0]
+            if maker.access_key == order.access_key:
+                # 자기 체결 방지: 같은 계좌의 반대 주문은 건너뛰지 않고 매칭 중단
+                break
+            fill_volume = min(self._fillable_volume(order, best), maker.remaining_volume)
+            if fill_volume <= 0:
+                break
+            self._apply_fill(maker, fill_volume, best)
+            self._apply_fill(order, fill_volume, best)
+            if self._is_filled(maker):
+                queue.popleft()
+                self._close(maker)
+                if not queue:
+                    opposite.remove_level(best)
+
+        if not self._is_filled(order) and reference is not None and self._crosses(order, reference):
+            fill_price = reference if order.ord_type != 'limit' else (
+                min(order.price, reference) if order.side == 'bid' else max(order.price, reference)
+            )
+            fill_volume = self._fillable_volume(order, fill_price)
+            if fill_volume > 0:
+                self._apply_fill(order, fill_volume, fill_price)
+
+        if self._is_filled(order) or order.ord_type != 'limit':
+            self._close(order)
+        else:
+            own_side = book.bids if order.side == 'bid' else book.asks
+            own_side.add(order)
+
+    def _crosses(self, order, price):
+        if order.ord_type != 'limit':
+            return True
+        return price <= order.price if order.side == 'bid' else price >= order.price
+
+    def _fillable_volume(self, order, price):
+        if order.ord_type == 'price':
+            return order.remaining_funds / price
+        return order.remaining_volume
+
+    def _is_filled(self, order):
+        if order.ord_type == 'price':
+            return order.remaining_funds <= 1e-9
+        return order.remaining_volume <= 1e-12
+
+    def _apply_fill(self, order, volume, price):
+        """체결 반영 (주문 상태 및 계좌 잔고)"""
+        quote, base = order.market.split('-')
+        account = self._accounts[order.access_key]
+        funds = volume * price
+        fee = funds * self.fee_rate
+
+        if order.side == 'bid':
+            base_wallet = self._wallet(account, base)
+            quote_wallet = self._wallet(account, quote)
+            # 평균 매수가 갱신
+            total_volume = base_wallet[0] + base_wallet[1] + volume
+            if total_volume > 0:
+                base_wallet[2] = ((base_wallet[0] + base_wallet[1]) * base_wallet[2] + funds) / total_volume
+            base_wallet[0] += volume
+            quote_wallet[1] -= funds + fee
+            order.locked -= funds + fee
+        else:
+            base_wallet = self._wallet(account, base)
+            quote_wallet = self._wallet(account, quote)
+            base_wallet[1] -= volume
+            quote_wallet[0] += funds - fee
+            order.locked -= volume
+
+        if order.ord_type == 'price':
+            order.remaining_funds -= funds
+        else:
+            order.remaining_volume -= volume
+        order.executed_volume += volume
+        order.executed_funds += funds
+        order.paid_fee += fee
+        order.trades.append({
+            'market': order.market,
+            'uuid': str(uuid.uuid4()),
+            'price': _fmt(price),
+            'volume': _fmt(volume),
+            'funds': _fmt(funds),
+            'side': order.side,
+            'created_at': _now_iso(),
+        })
+
+    def _close(self, order):
+        """주문 종료 처리 (남은 락 해제)"""
+        if order.state != 'wait':
+            return
+        account = self._accounts[order.access_key]
+        quote, base = order.market.split('-')
+        wallet = self._wallet(account, quote if order.side == 'bid' else base)
+        if order.locked > 0:
+            wallet[1] -= order.locked
+            wallet[0] += order.locked
+            order.locked = 0.0
+        order.state = 'done' if order.trades else 'cancel'
+
+    def _get_own_order(self, access_key, uuid_str):
+        order = self._orders.get(uuid_str)
+        if order is None or order.access_key != access_key:
+            raise SimulatorError('order_not_found', '주문을 찾지 못했습니다.', 404)
+        return order
+
+    def get_order(self, access_key, uuid_str):
+        """개별 주문 조회 (체결 내역 포함)"""
+        with self._lock:
+            return self._get_own_order(access_key, uuid_str).to_dict(with_trades=True)
+
+    def get_orders(self, access_key, market=None, states=None, page=1, limit=100, order_by='desc'):
+        """주문 리스트 조회"""
+        with self._lock:
+            self._account(access_key)
+            states = states or ['wait', 'watch']
+            orders = [
+                o for o in self._orders_by_account.get(access_key, [])
+                if o.state in states and (market is None or o.market == market)
+            ]
+            if order_by == 'desc':
+                orders.reverse()
+            start = (max(int(page), 1) - 1) * int(limit)
+            return [o.to_dict() for o in orders[start:start + int(limit)]]
+
+    def get_orders_by_uuids(self, access_key, uuids):
+        """ID로 주문 리스트 조회"""
+        with self._lock:
+            return [
+                self._orders[u].to_dict() for u in uuids
+                if u in self._orders and self._orders[u].access_key == access_key
+            ]
+
+    def cancel_order(self, access_key, uuid_str):
+        """주문 취소"""
+        with self._lock:
+            order = self._get_own_order(access_key, uuid_str)
+            if order.state != 'wait':
+                raise SimulatorError('order_not_found', '이미 종료된 주문입니다.', 404)
+            book = self._book(order.market)
+            (book.bids if order.side == 'bid' else book.asks).remove(order)
+            result = order.to_dict()
+            self._close(order)
+            order.state = 'cancel'
+            return result
+
+    def cancel_orders_by_uuids(self, access_key, uuids):
+        """ID로 주문 리스트 취소"""
+        success, failed = [], []
+        for uuid_str in uuids:
+            try:
+                order = self.cancel_order(access_key, uuid_str)
+                success.append({'uuid': order['uuid'], 'market': order['market']})
+            except SimulatorError:
+                failed.append({'uuid': uuid_str})
+        return {
+            'success': {'count': len(success), 'orders': success},
+            'failed': {'count': len(failed), 'orders': failed},
+        }
+
+    # ------ 시세 ------
+
+    def list_markets(self):
+        """마켓 코드 목록 (업비트 /v1/market/all 형식)"""
+        return [
+            {
+                'market': market,
+                'korean_name': market.split('-')[1],
+                'english_name': market.split('-')[1],
+                'market_warning': 'NONE',
+            }
+            for market in self.market_data.markets()
+        ]
+
+    def get_tickers(self, markets):
+        """현재가 정보 조회 (업비트 /v1/ticker 형식)"""
+        result = []
+        for market in markets:
+            candle = self.market_data.latest_candle(market)
+            if candle is None:
+                continue
+            result.append({
+                'market': market,
+                'trade_price': candle['trade_price'],
+                'opening_price': candle['opening_price'],
+                'high_price': candle['high_price'],
+                'low_price': candle['low_price'],
+                'prev_closing_price': candle.get('prev_closing_price', candle['opening_price']),
+                'acc_trade_price_24h': candle.get('candle_acc_trade_price', 0),
+                'acc_trade_volume_24h': candle.get('candle_acc_trade_volume', 0),
+                'timestamp': candle.get('timestamp', int(time.time() * 1000)),
+            })
+        return result
+
+    def get_candles(self, market, unit, count=200, to=None):
+        """캔들 조회 (최신순)"""
+        return self.market_data.get_candles(market, unit, min(int(count), 200), to)
+
+    def get_orderbook(self, markets, depth=15):
+        """
+        호가 정보 조회
+        - 내부 호가창이 비어 있는 면은 재생 체결가 기준 1단계 합성 호가로 채움
+        """
+        with self._lock:
+            result = []
+            for market in markets:
+                book = self._book(market)
+                asks = book.asks.depth(depth)
+                bids = book.bids.depth(depth)
+                reference = self.market_data.current_price(market)
+                if reference is not None:
+                    if not asks:
+                        asks = [(reference, 1.0)]
+                    if not bids:
+                        bids = [(reference, 1.0)]
+                units = []
+                for i in range(max(len(asks), len(bids))):
+                    ask = asks[i] if i < len(asks) else (0.0, 0.0)
+                    bid = bids[i] if i < len(bids) else (0.0, 0.0)
+                    units.append({
+                        'ask_price': ask[0], 'bid_price': bid[0],
+                        'ask_size': ask[1], 'bid_size': bid[1],
+                    })
+                result.append({
+                    'market': market,
+                    'timestamp': int(time.time() * 1000),
+                    'total_ask_size': sum(u['ask_size'] for u in units),
+                    'total_bid_size': sum(u['bid_size'] for u in units),
+                    'orderbook_units': units,
+                })
+            return result
+
+    # ------ 재생 ------
+
+    def advance(self, steps=1):
+        """
+        시장 데이터를 앞으로 진행하고, 새 체결가에 도달한 대기 주문을 체결
+
+        Returns:
+            bool: 진행 성공 여부
+        """
+        with self._lock:
+            moved = self.market_data.advance(steps)
+            for market, book in self._books.items():
+                reference = self.market_data.current_price(market)
+                if reference is None:
+                    continue
+                for side in (book.bids, book.asks):
+                    while True:
+                        best, queue = side.best_queue()
+                        if best is None or not self._crosses(queue[0], reference):
+                            break
+                        for order in list(queue):
+                            self._apply_fill(order, order.remaining_volume, order.price)
+                            self._close(order)
+                        side.remove_level(best)
+            return moved
@@ -0,0 +1,290 @@
+"""
+모의 거래소용 시장 데이터 재생 모듈
+- 기록된 캔들 데이터 로드/저장
+- 재생 시계(clock) 관리 및 시점 기준 캔들/시세 조회
+- 테스트/벤치마크용 합성 캔들 생성
+"""
+import bisect
+import json
+import logging
+import random
+from datetime import datetime, timedelta, timezone
+
+logger = logging.getLogger(__name__)
+
+# 업비트 캔들 단위별 길이 (초)
+UNIT_SECONDS = {
+    'minutes/1': 60,
+    'minutes/3': 180,
+    'minutes/5': 300,
+    'minutes/10': 600,
+    'minutes/15': 900,
+    'minutes/30': 1800,
+    'minutes/60': 3600,
+    'minutes/240': 14400,
+    'days': 86400,
+    'weeks': 604800,
+    'months': 2592000,
+}
+
+KST = timezone(timedelta(hours=9))
+
+
+def parse_candle_time(value):
+    """
+    캔들 시각 문자열(UTC, 'YYYY-MM-DDTHH:MM:SS')을 epoch 초로 변환
+
+    Args:
+        value (str): candle_date_time_utc 값
+
+    Returns:
+        int: epoch 초
+    """
+    dt = datetime.strptime(value[:19], '%Y-%m-%dT%H:%M:%S').replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+def format_candle_time(epoch, tz=timezone.utc):
+    """epoch 초를 업비트 캔들 시각 문자열로 변환"""
+    return datetime.fromtimestamp(epoch, tz).strftime('%Y-%m-%dT%H:%M:%S')
+
+
+class MarketDataReplay:
+    """
+    기록된 캔들 데이터를 시간 순서대로 재생하는 클래스
+    - (market, unit)별로 시각 기준 정렬된 캔들을 보관
+    - 재생 시계 이전(포함)의 캔들만 조회 가능
+    """
+
+    def __init__(self):
+        """시장 데이터 재생기 초기화"""
+        # (market, unit) -> 캔들 목록 / 시작 시각 목록 (정렬 유지)
+        self._candles = {}
+        self._times = {}
+        # 전체 타임라인 (재생 시계가 이동하는 시각 목록)
+        self._timeline = []
+        self._cursor = -1
+
+    # ------ 데이터 적재 ------
+
+    def load_candles(self, market, unit, candles):
+        """
+        캔들 데이터 적재
+
+        Args:
+            market (str): 마켓 코드 (예: KRW-BTC)
+            unit (str): 캔들 단위 (예: 'days', 'minutes/1')
+            candles (list): 업비트 캔들 응답 형식의 딕셔너리 목록 (정렬 순서 무관)
+        """
+        if unit not in UNIT_SECONDS:
+            raise ValueError(f"지원하지 않는 캔들 단위입니다: {unit}")
+
+        rows = sorted(
+            ((parse_candle_time(c['candle_date_time_utc']), c) for c in candles),
+            key=lambda row: row[0]
+        )
+        key = (market, unit)
+        self._times[key] = [row[0] for row in rows]
+        self._candles[key] = [row[1] for row in rows]
+        self._rebuild_timeline()
+
+    def load_file(self, path):
+        """
+        JSON 파일에서 기록된 캔들 데이터 로드
+
+        파일 형식: {"candles": {"KRW-BTC": {"days": [...], "minutes/1": [...]}}}
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        for market, units in data.get('candles', {}).items():
+            for unit, candles in units.items():
+                self.load_candles(market, unit, candles)
+
+        logger.info(f"시장 데이터 로드 완료: {path} ({len(self._candles)}개 시리즈)")
+
+    def save_file(self, path):
+        """적재된 캔들 데이터를 JSON 파일로 저장"""
+        data = {'candles': {}}
+        for (market, unit), candles in self._candles.items():
+            data['candles'].setdefault(market, {})[unit] = candles
+
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+
+    def record(self, markets, unit='days', count=200, server_url="https://api.upbit.com"):
+        """
+        실제 업비트 API에서 캔들 데이터를 받아 기록
+
+        Args:
+            markets (list): 마켓 코드 목록
+            unit (str): 캔들 단위
+            count (int): 마켓별 캔들 개수 (최대 200)
+            server_url (str): 업비트 API 서버 주소
+        """
+        import requests
+
+        for market in markets:
+            response = requests.get(
+                f"{server_url}/v1/candles/{unit}",
+                params={'market': market, 'count': count}
+            )
+            if response.status_code == 200:
+                self.load_candles(market, unit, response.json())
+            else:
+                logger.error(f"캔들 기록 실패 ({market}): {response.text}")
+
+    def _rebuild_timeline(self):
+        """전체 시리즈의 시각을 병합하여 타임라인 재구성 (현재 시계는 유지)"""
+        current = self.now
+        timeline = set()
+        for times in self._times.values():
+            timeline.update(times)
+        self._timeline = sorted(timeline)
+
+        if current is None:
+            self._cursor = -1
+        else:
+            self._cursor = bisect.bisect_right(self._timeline, current) - 1
+
+    # ------ 재생 시계 ------
+
+    @property
+    def now(self):
+        """현재 재생 시각 (epoch 초, 시작 전이면 None)"""
+        if self._cursor < 0 or not self._timeline:
+            return None
+        return self._timeline[self._cursor]
+
+    def seek(self, epoch):
+        """재생 시계를 지정한 시각(포함) 직전의 타임라인 위치로 이동"""
+        self._cursor = bisect.bisect_right(self._timeline, epoch) - 1
+
+    def seek_index(self, index):
+        """재생 시계를 타임라인 인덱스로 이동 (음수는 뒤에서부터)"""
+        if index < 0:
+            index = len(self._timeline) + index
+        self._cursor = max(-1, min(index, len(self._timeline) - 1))
+
+    def advance(self, steps=1):
+        """
+        재생 시계를 앞으로 이동
+
+        Returns:
+            bool: 이동 성공 여부 (타임라인 끝이면 False)
+        """
+        if self._cursor + steps >= len(self._timeline):
+            self._cursor = len(self._timeline) - 1
+            return False
+        self._cursor += steps
+        return True
+
+    def has_next(self):
+        """다음 시점이 남아 있는지 여부"""
+        return self._cursor + 1 < len(self._timeline)
+
+    # ------ 조회 ------
+
+    def markets(self):
+        """적재된 마켓 코드 목록"""
+        return sorted({market for market, _ in self._candles})
+
+    def units(self, market):
+        """마켓의 적재된 캔들 단위 목록 (짧은 단위 우선)"""
+        units = [unit for m, unit in self._candles if m == market]
+        return sorted(units, key=lambda unit: UNIT_SECONDS[unit])
+
+    def get_candles(self, market, unit, count=1, to=None):
+        """
+        현재 재생 시각까지 확정된 캔들 조회 (최신순, 업비트 응답 형식)
+
+        Args:
+            market (str): 마켓 코드
+            unit (str): 캔들 단위
+            count (int): 캔들 개수
+            to (int, optional): 이 시각 이전의 캔들만 조회 (epoch 초)
+
+        Returns:
+            list: 캔들 목록 (최신순)
+        """
+        key = (market, unit)
+        times = self._times.get(key)
+        if not times:
+            return []
+
+        limit = self.now
+        if limit is None:
+            return []
+        end = bisect.bisect_right(times, limit)
+        if to is not None:
+            end = min(end, bisect.bisect_left(times, to))
+
+        start = max(0, end - count)
+        return self._candles[key][start:end][::-1]
+
+    def latest_candle(self, market):
+        """가장 짧은 단위 기준의 최신 캔들 (없으면 None)"""
+        for unit in self.units(market):
+            candles = self.get_candles(market, unit, 1)
+            if candles:
+                return candles[0]
+        return None
+
+    def current_price(self, market):
+        """현재 재생 시각 기준 체결가 (없으면 None)"""
+        candle = self.latest_candle(market)
+        return float(candle['trade_price']) if candle else None
+
+
+def generate_random_walk(markets, periods=200, unit='days', start=None, seed=None,
+                         start_price=10000.0, volatility=0.02):
+    """
+    테스트/벤치마크용 합성 캔들 생성 (기하 랜덤 워크)
+
+    Args:
+        markets (list): 마켓 코드 목록
+        periods (int): 마켓별 캔들 개수
+        unit (str): 캔들 단위
+        start (datetime, optional): 첫 캔들 시각 (UTC). 기본값은 현재로부터 periods 단위 이전
+        seed (int, optional): 난수 시드
+        start_price (float): 시작 가격
+        volatility (float): 캔들당 변동성
+
+    Returns:
+        MarketDataReplay: 합성 데이터가 적재된 재생기
+    """
+    rng = random.Random(seed)
+    step = UNIT_SECONDS[unit]
+    if start is None:
+        start = datetime.now(timezone.utc) - timedelta(seconds=step * periods)
+    start_epoch = int(start.replace(tzinfo=start.tzinfo or timezone.utc).timestamp())
+    start_epoch -= start_epoch % step
+
+    replay = MarketDataReplay()
+    for market in markets:
+        price = start_price * rng.uniform(0.5, 2.0)
+        candles = []
+        for i in range(periods):
+            epoch = start_epoch + i * step
+            open_price = price
+            close_price = max(1.0, open_price * (1 + rng.gauss(0, volatility)))
+            high_price = max(open_price, close_price) * (1 + abs(rng.gauss(0, volatility / 2)))
+            low_price = min(open_price, close_price) * (1 - abs(rng.gauss(0, volatility / 2)))
+            volume = rng.uniform(100, 10000)
+            candles.append({
+                'market': market,
+                'candle_date_time_utc': format_candle_time(epoch),
+                'candle_date_time_kst': format_candle_time(epoch, KST),
+                'opening_price': round(open_price, 2),
+                'high_price': round(high_price, 2),
+                'low_price': round(low_price, 2),
+                'trade_price': round(close_price, 2),
+                'timestamp': (epoch + step - 1) * 1000,
+                'candle_acc_trade_price': round(volume * close_price, 2),
+                'candle_acc_trade_volume': round(volume, 8),
+            })
+            price = close_price
+        replay.load_candles(market, unit, candles)
+
+    replay.seek_index(-1)
+    return replay
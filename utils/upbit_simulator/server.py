@@ -0,0 +1,210 @@
+"""
+모의 거래소 로컬 HTTP 서버
+- 업비트 REST API 경로/응답 형식을 흉내내어 UpbitAPI 모듈을 그대로 연결 가능
+- UPBIT_SERVER_URL 환경 변수를 서버 주소로 지정하면 실제 거래소 대신 사용됨
+"""
+import json
+import logging
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from .exchange import SimulatorError
+from .market_data import parse_candle_time
+
+logger = logging.getLogger(__name__)
+
+CANDLE_PATH = re.compile(r'^/v1/candles/(minutes/\d+|days|weeks|months)$')
+
+
+def _single(query, name, default=None):
+    values = query.get(name)
+    return values[0] if values else default
+
+
+def _multi(query, name):
+    """'states[]' / 'states' 형태의 다중 값 파라미터"""
+    return query.get(f"{name}[]") or query.get(name) or []
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "UpbitSimulator/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    # ------ 공통 ------
+
+    def _send(self, status, body):
+        payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _parse(self):
+        parsed = urlparse(self.path)
+        query = parse_qs(parsed.query)
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            try:
+                body = json.loads(self.rfile.read(length) or b'{}')
+            except ValueError:
+                body = {}
+            for key, value in body.items():
+                query[key] = value if isinstance(value, list) else [value]
+        return parsed.path, query
+
+    def _access_key(self):
+        """Authorization 헤더의 JWT에서 access_key 추출 (등록된 시크릿이 있으면 서명 검증)"""
+        import jwt
+
+        header = self.headers.get('Authorization', '')
+        if not header.startswith('Bearer '):
+            raise SimulatorError('jwt_verification', '인증 토큰이 없습니다.', 401)
+        token = header[len('Bearer '):]
+        try:
+            claims = jwt.decode(token, options={'verify_signature': False})
+            secret = self.server.exchange.get_secret(claims.get('access_key'))
+            if secret:
+                jwt.decode(token, secret, algorithms=['HS256', 'HS512'])
+        except jwt.PyJWTError as e:
+            raise SimulatorError('jwt_verification', f"잘못된 토큰입니다: {e}", 401)
+        return claims.get('access_key')
+
+    def _dispatch(self, method):
+        try:
+            path, query = self._parse()
+            status, body = self._route(method, path, query)
+            self._send(status, body)
+        except SimulatorError as e:
+            self._send(e.status_code, e.to_dict())
+        except Exception as e:
+            logger.error(f"모의 거래소 요청 처리 중 오류 발생: {e}")
+            self._send(500, {"error": {"name": "server_error", "message": str(e)}})
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_DELETE(self):
+        self._dispatch('DELETE')
+
+    # ------ 라우팅 ------
+
+    def _route(self, method, path, query):
+        exchange = self.server.exchange
+
+        # 시세 (인증 불필요)
+        if method == 'GET':
+            if path == '/v1/market/all':
+                return 200, exchange.list_markets()
+            if path == '/v1/ticker':
+                markets = _single(query, 'markets', '').split(',')
+                return 200, exchange.get_tickers([m for m in markets if m])
+            if path == '/v1/orderbook':
+                markets = _single(query, 'markets', '').split(',')
+                return 200, exchange.get_orderbook([m for m in markets if m])
+            match = CANDLE_PATH.match(path)
+            if match:
+                to = _single(query, 'to')
+                return 200, exchange.get_candles(
+                    _single(query, 'market'),
+                    match.group(1),
+                    int(_single(query, 'count', 1)),
+                    parse_candle_time(to.replace(' ', 'T')) if to else None
+                )
+
+        access_key = self._access_key()
+
+        if method == 'GET':
+            if path == '/v1/accounts':
+                return 200, exchange.get_accounts(access_key)
+            if path == '/v1/orders/chance':
+                return 200, exchange.get_order_chance(access_key, _single(query, 'market'))
+            if path == '/v1/order':
+                return 200, exchange.get_order(access_key, _single(query, 'uuid'))
+            if path == '/v1/orders':
+                return 200, exchange.get_orders(
+                    access_key,
+                    market=_single(query, 'market'),
+                    states=_multi(query, 'states') or None,
+                    page=int(_single(query, 'page', 1)),
+                    limit=int(_single(query, 'limit', 100)),
+                    order_by=_single(query, 'order_by', 'desc')
+                )
+            if path == '/v1/orders/uuids':
+                return 200, exchange.get_orders_by_uuids(access_key, _multi(query, 'uuids'))
+
+        if method == 'POST' and path == '/v1/orders':
+            return 201, exchange.place_order(
+                access_key,
+                _single(query, 'market'),
+                _single(query, 'side'),
+                _single(query, 'ord_type'),
+                volume=_single(query, 'volume'),
+                price=_single(query, 'price')
+            )
+
+        if method == 'DELETE':
+            if path == '/v1/order':
+                return 200, exchange.cancel_order(access_key, _single(query, 'uuid'))
+            if path == '/v1/orders/uuids':
+                return 200, exchange.cancel_orders_by_uuids(access_key, _multi(query, 'uuids'))
+
+        raise SimulatorError('not_found', f"지원하지 않는 경로입니다: {method} {path}", 404)
+
+
+class SimulatedExchangeServer:
+    """
+    모의 거래소 HTTP 서버
+
+    사용 예:
+        server = SimulatedExchangeServer(exchange).start()
+        os.environ['UPBIT_SERVER_URL'] = server.url
+        ...
+        server.stop()
+    """
+
+    def __init__(self, exchange, host='127.0.0.1', port=0):
+        """
+        Args:
+            exchange (SimulatedExchange): 요청을 처리할 모의 거래소
+            host (str): 바인딩 주소
+            port (int): 포트 (0이면 임의 포트)
+        """
+        self.exchange = exchange
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.exchange = exchange
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='upbit-simulator', daemon=True)
+        self._thread.start()
+        logger.info(f"모의 거래소 서버 시작: {self.url}")
+        return self
+
+    def serve_forever(self):
+        """현재 스레드에서 서버 실행"""
+        logger.info(f"모의 거래소 서버 시작: {self.url}")
+        self._httpd.serve_forever()
+
+    def stop(self):
+        """서버 종료"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+        logger.info("모의 거래소 서버 종료")
@@ -0,0 +1,154 @@
+"""
+주기 작업 워커 진입점 (웹 스택 없이 자동 매매/추천/알림 작업만 실행)
+
+    python -m worker                                  # 전체 작업 (SCHEDULER_MODE 설정에 따름)
+    python -m worker --jobs auto_trading,recommendations --mode distributed
+    python -m worker --once recommendation_sweep      # 작업 1회 실행 후 종료 (cron 등)
+    python -m worker --cpus 2,3                       # 지정 CPU 코어에 고정 (Linux)
+
+- 웹 프로세스(wsgi.py)는 스케줄러를 시작하지 않으므로 작업은 이 프로세스에서만 실행됨
+- 여러 워커를 띄울 때는 SCHEDULER_MODE=distributed로 샤드를 나눠 처리
+- WORKER_METRICS_PORT를 지정하면 /metrics를 별도 포트로 노출
+"""
+import argparse
+import logging
+import os
+import signal
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from flask import Flask
+
+from config import Config
+from models.database import init_database
+from utils.upbit_api.market_catalog import MarketCatalog
+from utils.upbit_api.exchange_cache import ExchangeInfoCache
+from utils.market_data.candle_store import CandleStore
+from service.replay.replay_recorder import ReplayRecorder
+from utils.manager_logging.manager_logging import LoggingManager
+from utils.manager_metrics.manager_metrics import MetricsManager
+
+logger = logging.getLogger('worker')
+
+
+def create_worker_app(config_object='config.Config', create_tables=None):
+    """
+    워커용 최소 Flask 앱 생성 (DB/설정/app context 용도, 라우트 및 로그인 없음)
+
+    Args:
+        config_object (str): 설정 객체 경로
+        create_tables (bool, optional): 테이블/인덱스 생성 여부 (None이면 DB_AUTO_CREATE 설정에 따름)
+    """
+    app = Flask('worker')
+    app.config.from_object(config_object)
+    init_database(app, create_tables)
+    MarketCatalog().configure_from_config(app.config)
+    ExchangeInfoCache().configure_from_config(app.config)
+    CandleStore().configure_from_config(app.config)
+    ReplayRecorder().configure_from_config(app.config)
+    return app
+
+
+def start_metrics_server(port, host='0.0.0.0'):
+    """
+    Prometheus 수집용 /metrics 서버 시작 (데몬 스레드)
+
+    Returns:
+        ThreadingHTTPServer: 실행 중인 서버
+    """
+    class _Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            logger.debug("%s - %s", self.address_string(), format % args)
+
+        def do_GET(self):
+            if self.path.split('?')[0] != '/metrics':
+                self.send_error(404)
+                return
+            body = MetricsManager().render().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer((host, port), _Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='worker-metrics', daemon=True).start()
+    logger.info("워커 메트릭 서버 시작: %s:%s", host, server.server_address[1])
+    return server
+
+
+def _configure_logging():
+    # 웹 프로세스와 같은 파일을 순환하지 않도록 워커 전용 로그 파일 사용
+    config = {name: getattr(Config, name) for name in dir(Config) if name.startswith('LOG_')}
+    config['LOG_FILE'] = Config.WORKER_LOG_FILE
+    LoggingManager().configure_from_config(config)
+
+
+def main(argv=None):
+    from service.scheduler.scheduler_service import SchedulerService, MODE_OFF
+
+    parser = argparse.ArgumentParser(description="주기 작업 워커")
+    parser.add_argument('--jobs', help=f"실행할 작업 (쉼표 구분, 기본: 전체) {list(SchedulerService.JOBS)}")
+    parser.add_argument('--mode', help="local / distributed (기본: SCHEDULER_MODE 설정)")
+    parser.add_argument('--once', metavar='JOB', help="작업을 1회 실행하고 종료")
+    parser.add_argument('--cpus', help="고정할 CPU 코어 번호 (쉼표 구분, Linux 전용)")
+    args = parser.parse_args(argv)
+
+    _configure_logging()
+
+    if args.cpus:
+        if hasattr(os, 'sched_setaffinity'):
+            os.sched_setaffinity(0, {int(cpu) for cpu in args.cpus.split(',')})
+            logger.info("CPU 코어 고정: %s", args.cpus)
+        else:
+            logger.warning("이 플랫폼은 CPU 코어 고정을 지원하지 않습니다.")
+
+    app = create_worker_app()
+    jobs = [job.strip() for job in args.jobs.split(',') if job.strip()] if args.jobs else None
+
+    try:
+        scheduler_service = SchedulerService(app, mode=args.mode, jobs=jobs)
+    except ValueError as e:
+        parser.error(str(e))
+    app.extensions['scheduler_service'] = scheduler_service
+
+    if args.once:
+        if args.once not in SchedulerService.JOBS:
+            parser.error(f"알 수 없는 작업입니다: {args.once}")
+        scheduler_service.run(args.once)
+        return 0
+
+    if scheduler_service.mode == MODE_OFF:
+        logger.error("SCHEDULER_MODE=off 상태에서는 워커가 작업을 실행하지 않습니다.")
+        return 1
+
+    if app.config.get('WORKER_METRICS_PORT'):
+        start_metrics_server(int(app.config['WORKER_METRICS_PORT']))
+
+    stop = threading.Event()
+
+    def _handle_signal(signum, frame):
+        logger.info("종료 신호 수신 (%s)", signum)
+        stop.set()
+
+    signal.signal(signal.SIGTERM, _handle_signal)
+    signal.signal(signal.SIGINT, _handle_signal)
+
+    scheduler_service.start()
+    logger.info("워커 시작 (PID %s)", os.getpid())
+    while not stop.wait(1):
+        pass
+
+    # 실행 중인 작업이 끝날 때까지 대기 후 종료
+    scheduler_service.shutdown(wait=True)
+    dispatcher = app.extensions.get('alert_dispatcher')
+    if dispatcher is not None:
+        dispatcher.shutdown()
+    logger.info("워커 종료")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,12 @@
+"""
+운영 웹 서버(WSGI) 진입점
+
+    gunicorn -k gthread --threads 100 -b 0.0.0.0:7100 wsgi:app
+
+- 개발 서버(python app.py)와 달리 디버그/리로더 없이 앱만 생성
+- 주기 작업은 실행하지 않음 → 워커 프로세스(python -m worker)를 별도로 실행
+- 스키마 생성이 끝난 환경은 DB_AUTO_CREATE=False로 기동 시간 단축
+"""
+from app import create_app
+
+app = create_app()